@@ -0,0 +1,146 @@
+"""
+QUERY RESULT CACHE
+Shared by SalesDatabaseAnalyzer (Day 15) and AdvancedSQLAnalyzer (Day 16)
+
+Dashboards run the same queries again and again while the data only changes
+when a loader runs. Results are cached by (normalized SQL, parameters) and
+stay valid until one of the tables a query reads gets a new version number.
+
+Loaders call bump_table_versions(conn, [...tables]) after writing.
+The versions live IN the database (table_versions), so a load done by one
+analyzer also invalidates the cache of another analyzer on the same file.
+"""
+
+import re
+import sqlite3
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def bump_table_versions(conn, tables):
+    """Increment the version counter of each table (call after every load)"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS table_versions (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    conn.executemany('''
+        INSERT INTO table_versions (table_name, version) VALUES (?, 1)
+        ON CONFLICT(table_name) DO UPDATE SET version = version + 1
+    ''', [(table,) for table in tables])
+    conn.commit()
+
+
+class QueryResultCache:
+    """LRU cache of query results, bounded by memory size in bytes"""
+
+    def __init__(self, conn, max_bytes=64 * 1024 * 1024):
+        self.conn = conn
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()   # key -> (DataFrame, table versions, size)
+        self.current_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    @staticmethod
+    def normalize_sql(query):
+        """Collapse whitespace and drop the trailing ';' so formatting doesn't matter"""
+        return ' '.join(query.split()).rstrip(';').strip()
+
+    @staticmethod
+    def _params_key(params):
+        """Hashable form of positional (sequence) or named (dict) parameters"""
+        if not params:
+            return ()
+        if isinstance(params, dict):
+            return tuple(sorted(params.items()))
+        return tuple(params)
+
+    def _table_versions(self, tables):
+        """Current version of each table (0 if a loader never bumped it)"""
+        try:
+            rows = self.conn.execute('SELECT table_name, version FROM table_versions').fetchall()
+        except sqlite3.OperationalError:   # no load has bumped a version yet
+            rows = []
+        versions = dict(rows)
+        return {table: versions.get(table, 0) for table in tables}
+
+    def _tables_in(self, sql):
+        """Names of the database tables a query mentions"""
+        tables = [row[0] for row in self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )]
+        return frozenset(t for t in tables if re.search(rf'\b{re.escape(t)}\b', sql, re.IGNORECASE))
+
+    def get_or_run(self, query, params=None):
+        """Return the cached result of query if still valid, otherwise run it"""
+        sql = self.normalize_sql(query)
+        key = (sql, self._params_key(params))
+
+        entry = self.entries.get(key)
+        if entry is not None:
+            df, versions, _ = entry
+            if self._table_versions(versions) == versions:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return df.copy()
+            # A loader changed one of the tables - drop the stale result
+            self.invalidations += 1
+            self._remove(key)
+
+        self.misses += 1
+        versions = self._table_versions(self._tables_in(sql))
+        df = pd.read_sql_query(query, self.conn, params=params)
+
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size <= self.max_bytes:
+            self.entries[key] = (df, versions, size)
+            self.current_bytes += size
+            self._evict()
+
+        return df.copy()
+
+    def _remove(self, key):
+        _, _, size = self.entries.pop(key)
+        self.current_bytes -= size
+
+    def _evict(self):
+        """Drop least recently used results until we are under max_bytes"""
+        while self.current_bytes > self.max_bytes:
+            oldest = next(iter(self.entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self):
+        """Empty the cache (statistics are kept)"""
+        self.entries.clear()
+        self.current_bytes = 0
+
+    def stats(self):
+        """Hit/miss statistics as a dict"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            'invalidations': self.invalidations,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.current_bytes,
+        }
+
+    def print_stats(self):
+        """Display cache statistics"""
+        stats = self.stats()
+        print("\n💾 QUERY CACHE")
+        print("-" * 80)
+        print(f"Hits: {stats['hits']}  Misses: {stats['misses']}  "
+              f"Hit rate: {stats['hit_rate']}%")
+        print(f"Invalidations: {stats['invalidations']}  Evictions: {stats['evictions']}")
+        print(f"Cached results: {stats['entries']} ({stats['bytes'] / 1024:,.1f} KB "
+              f"of {self.max_bytes / 1024:,.0f} KB)")
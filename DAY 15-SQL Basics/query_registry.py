@@ -0,0 +1,72 @@
+"""
+PARAMETERIZED QUERY REGISTRY
+Shared by SalesDatabaseAnalyzer (Day 15) and AdvancedSQLAnalyzer (Day 16)
+
+Every analysis is registered ONCE with named parameters (:status, :limit,
+:start_date, ...) and a default value for each. Callers change the values,
+never the SQL text, so:
+- SQLite parses each analysis once and keeps it prepared in the connection's
+  statement cache (sqlite3.connect(cached_statements=...))
+- the query result cache keys on (SQL, parameters)
+
+Usage:
+    QUERIES = QueryRegistry()
+    QUERIES.register('orders_by_status', '''
+        SELECT * FROM orders WHERE status = :status LIMIT :limit
+    ''', "Orders with status {status}", status='Completed', limit=10)
+
+    sql, description, params = QUERIES.bind('orders_by_status', status='Pending')
+"""
+
+import re
+
+# :name placeholders (':00' inside a time literal is not a parameter)
+PARAMETER = re.compile(r'(?<![:\w]):([A-Za-z_]\w*)')
+
+
+class QueryRegistry:
+    """Named SQL analyses with bound parameters and default values"""
+
+    def __init__(self):
+        self.queries = {}   # name -> (sql, description template, defaults)
+
+    def register(self, name, sql, description, **defaults):
+        """Register an analysis; every :parameter in sql needs a default"""
+        parameters = set(PARAMETER.findall(sql))
+        missing = parameters - set(defaults)
+        if missing:
+            raise ValueError(f"Query '{name}' has no default for: {sorted(missing)}")
+        unused = set(defaults) - parameters
+        if unused:
+            raise ValueError(f"Query '{name}' does not use: {sorted(unused)}")
+        self.queries[name] = (sql, description, defaults)
+        return name
+
+    def bind(self, name, **params):
+        """Return (sql, description, parameters) with defaults filled in"""
+        if name not in self.queries:
+            raise KeyError(f"Unknown query: {name}")
+        sql, description, defaults = self.queries[name]
+        unknown = set(params) - set(defaults)
+        if unknown:
+            raise ValueError(f"Query '{name}' has no parameter(s): {sorted(unknown)}")
+        bound = {**defaults, **params}
+        return sql, description.format(**bound), bound
+
+    def parameters(self, name):
+        """Parameter names and defaults of one analysis"""
+        return dict(self.queries[name][2])
+
+    def names(self):
+        """Registered analysis names, in registration order"""
+        return list(self.queries)
+
+    def statement_cache_size(self, extra=128):
+        """Statements to keep prepared: every registered analysis plus room for ad-hoc SQL"""
+        return len(self.queries) + extra
+
+    def __contains__(self, name):
+        return name in self.queries
+
+    def __len__(self):
+        return len(self.queries)
@@ -15,14 +15,148 @@ import sqlite3
 import pandas as pd
 import random
 from datetime import datetime, timedelta
+from query_cache import QueryResultCache, bump_table_versions
+from query_registry import QueryRegistry
+
+# Analyses registered ONCE with named parameters (defaults = the classic literals)
+QUERIES = QueryRegistry()
+
+QUERIES.register('query_1_basic_select', '''
+    SELECT customer_id, name, city, customer_type
+    FROM customers
+    LIMIT :limit;
+    ''',
+    "View first {limit} customers", limit=10)
+
+QUERIES.register('query_2_where_filter', '''
+    SELECT name, email, city
+    FROM customers
+    WHERE city = :city AND customer_type = :customer_type;
+    ''',
+    "{customer_type} customers from {city}", city='Mumbai', customer_type='Premium')
+
+QUERIES.register('query_3_aggregation', '''
+    SELECT 
+        COUNT(*) as total_orders,
+        SUM(total_amount) as total_revenue,
+        AVG(total_amount) as avg_order_value,
+        MAX(total_amount) as highest_order,
+        MIN(total_amount) as lowest_order
+    FROM orders
+    WHERE status = :status;
+    ''',
+    "Overall sales statistics ({status} orders)", status='Completed')
+
+QUERIES.register('query_4_group_by', '''
+    SELECT 
+        c.city,
+        COUNT(o.order_id) as total_orders,
+        SUM(o.total_amount) as total_revenue,
+        AVG(o.total_amount) as avg_order_value
+    FROM customers c
+    JOIN orders o ON c.customer_id = o.customer_id
+    WHERE o.status = :status
+    GROUP BY c.city
+    ORDER BY total_revenue DESC;
+    ''',
+    "Sales performance by city", status='Completed')
+
+QUERIES.register('query_5_having_clause', '''
+    SELECT 
+        c.customer_id,
+        c.name,
+        COUNT(o.order_id) as order_count,
+        SUM(o.total_amount) as total_spent
+    FROM customers c
+    JOIN orders o ON c.customer_id = o.customer_id
+    WHERE o.status = :status
+    GROUP BY c.customer_id, c.name
+    HAVING SUM(o.total_amount) > :min_spent
+    ORDER BY total_spent DESC;
+    ''',
+    "High-value customers (spent > ₹{min_spent})", status='Completed', min_spent=5000)
+
+QUERIES.register('query_6_inner_join', '''
+    SELECT 
+        o.order_id,
+        c.name as customer_name,
+        p.product_name,
+        o.quantity,
+        o.total_amount,
+        o.order_date,
+        o.status
+    FROM orders o
+    INNER JOIN customers c ON o.customer_id = c.customer_id
+    INNER JOIN products p ON o.product_id = p.product_id
+    ORDER BY o.order_date DESC
+    LIMIT :limit;
+    ''',
+    "Recent orders with full details", limit=10)
+
+QUERIES.register('query_7_left_join', '''
+    SELECT 
+        c.customer_id,
+        c.name,
+        c.email,
+        c.city,
+        COUNT(o.order_id) as order_count
+    FROM customers c
+    LEFT JOIN orders o ON c.customer_id = o.customer_id
+    GROUP BY c.customer_id, c.name, c.email, c.city
+    HAVING COUNT(o.order_id) = 0;
+    ''',
+    "Customers who never ordered (potential leads!)")
+
+QUERIES.register('query_8_subquery', '''
+    SELECT 
+        product_name,
+        category,
+        price,
+        ROUND((price - (SELECT AVG(price) FROM products)), 2) as price_vs_avg
+    FROM products
+    WHERE price > (SELECT AVG(price) FROM products)
+    ORDER BY price DESC;
+    ''',
+    "Premium products (above average price)")
+
+QUERIES.register('query_9_advanced_grouping', '''
+    SELECT 
+        c.city,
+        p.category,
+        COUNT(o.order_id) as orders,
+        SUM(o.total_amount) as revenue
+    FROM orders o
+    JOIN customers c ON o.customer_id = c.customer_id
+    JOIN products p ON o.product_id = p.product_id
+    WHERE o.status = :status
+    GROUP BY c.city, p.category
+    ORDER BY c.city, revenue DESC;
+    ''',
+    "Category performance by city", status='Completed')
+
+QUERIES.register('query_10_date_analysis', '''
+    SELECT 
+        strftime('%Y-%m', order_date) as month,
+        COUNT(*) as orders,
+        SUM(total_amount) as revenue,
+        AVG(total_amount) as avg_order_value
+    FROM orders
+    WHERE status = :status
+      AND order_date BETWEEN :start_date AND :end_date
+    GROUP BY strftime('%Y-%m', order_date)
+    ORDER BY month DESC;
+    ''',
+    "Monthly sales trend", status='Completed', start_date='0001-01-01', end_date='9999-12-31')
 
 class SalesDatabaseAnalyzer:
     """Complete SQL + Python analytics system"""
     
-    def __init__(self, db_name='sales_analysis.db'):
+    def __init__(self, db_name='sales_analysis.db', cache_max_bytes=64 * 1024 * 1024):
         """Initialize database connection"""
-        self.conn = sqlite3.connect(db_name)
+        # Statement cache big enough to keep every registered analysis prepared
+        self.conn = sqlite3.connect(db_name, cached_statements=QUERIES.statement_cache_size())
         self.cursor = self.conn.cursor()
+        self.cache = QueryResultCache(self.conn, max_bytes=cache_max_bytes)
         print(f"✅ Connected to database: {db_name}")
     
     def create_tables(self):
@@ -61,6 +195,7 @@ class SalesDatabaseAnalyzer:
                 order_date DATE,
                 total_amount DECIMAL(10, 2),
                 status TEXT,
+                order_month TEXT GENERATED ALWAYS AS (strftime('%Y-%m', order_date)) STORED,
                 FOREIGN KEY (customer_id) REFERENCES customers(customer_id),
                 FOREIGN KEY (product_id) REFERENCES products(product_id)
             )
@@ -69,8 +204,13 @@ class SalesDatabaseAnalyzer:
         self.conn.commit()
         print("✅ Database tables created successfully!")
     
-    def populate_sample_data(self):
-        """Generate realistic sample data (like a real company)"""
+    def populate_sample_data(self, n_customers=50, n_orders=100, batch_size=50_000):
+        """
+        Generate realistic sample data (like a real company)
+        Large targets (e.g. n_orders=1_000_000) are fine: product prices are
+        read ONCE into a dict and orders are inserted batch_size at a time,
+        one transaction per batch
+        """
         
         # Sample data
         cities = ['Mumbai', 'Delhi', 'Bangalore', 'Chennai', 'Pune', 'Hyderabad']
@@ -80,7 +220,7 @@ class SalesDatabaseAnalyzer:
         
         # Insert customers
         customers = []
-        for i in range(1, 51):  # 50 customers
+        for i in range(1, n_customers + 1):
             customers.append((
                 i,
                 f'Customer_{i}',
@@ -117,303 +257,273 @@ class SalesDatabaseAnalyzer:
             VALUES (?, ?, ?, ?, ?)
         ''', products)
         
-        # Insert orders (100 orders)
-        orders = []
-        for i in range(1, 101):
-            customer_id = random.randint(1, 50)
-            product_id = random.randint(1, 15)
-            quantity = random.randint(1, 5)
-            
-            # Get product price
-            self.cursor.execute('SELECT price FROM products WHERE product_id = ?', (product_id,))
-            price = self.cursor.fetchone()[0]
-            
-            orders.append((
-                i,
-                customer_id,
-                product_id,
-                quantity,
-                (datetime.now() - timedelta(days=random.randint(1, 90))).date(),
-                round(price * quantity, 2),
-                random.choice(statuses)
-            ))
-        
-        self.cursor.executemany('''
-            INSERT OR IGNORE INTO orders 
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', orders)
-        
         self.conn.commit()
+
+        # Load the price table ONCE (prices already in the database win,
+        # because the inserts above are INSERT OR IGNORE)
+        self.cursor.execute('SELECT product_id, price FROM products')
+        prices = dict(self.cursor.fetchall())
+        product_ids = list(prices)
+
+        # Order dates are 1-90 days old, so build them once
+        today = datetime.now()
+        order_dates = [(today - timedelta(days=d)).date() for d in range(91)]
+
+        # Insert orders in batches, one transaction per batch
+        inserted = 0
+        for batch_start in range(1, n_orders + 1, batch_size):
+            batch_end = min(batch_start + batch_size, n_orders + 1)
+            orders = []
+            for i in range(batch_start, batch_end):
+                product_id = random.choice(product_ids)
+                quantity = random.randint(1, 5)
+                orders.append((
+                    i,
+                    random.randint(1, n_customers),
+                    product_id,
+                    quantity,
+                    order_dates[random.randint(1, 90)],
+                    round(prices[product_id] * quantity, 2),
+                    random.choice(statuses)
+                ))
+
+            with self.conn:
+                self.cursor.executemany('''
+                    INSERT OR IGNORE INTO orders 
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', orders)
+
+            inserted += len(orders)
+            if n_orders > batch_size:
+                print(f"   ⏳ {inserted:,}/{n_orders:,} orders")
+
+        bump_table_versions(self.conn, ['customers', 'products', 'orders'])
         print("✅ Sample data inserted successfully!")
-        print(f"   📊 50 customers, 15 products, 100 orders")
-    
-    def run_sql_query(self, query, description):
-        """Execute SQL query and display results"""
+        print(f"   📊 {n_customers} customers, {len(product_ids)} products, {n_orders:,} orders")
+    
+    def bulk_insert(self, table, rows, batch_size=100_000):
+        """
+        Bulk load any iterable of row tuples into table
+        - executemany in batches, so rows can come from a generator
+        - ONE transaction for the whole load
+        Returns the rows actually inserted (duplicates ignored by
+        INSERT OR IGNORE are not counted)
+        """
+        start = datetime.now()
+        changes_before = self.conn.total_changes
+
+        try:
+            sql = None
+            batch = []
+            for row in rows:
+                if sql is None:
+                    sql = f"INSERT OR IGNORE INTO {table} VALUES ({', '.join('?' * len(row))})"
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    self.cursor.executemany(sql, batch)
+                    batch = []
+            if batch:
+                self.cursor.executemany(sql, batch)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        inserted = self.conn.total_changes - changes_before
+        bump_table_versions(self.conn, [table])
+
+        elapsed = (datetime.now() - start).total_seconds()
+        print(f"✅ Bulk loaded {inserted:,} rows into {table} in {elapsed:.2f}s "
+              f"({inserted / max(elapsed, 1e-9):,.0f} rows/sec)")
+        return inserted
+
+    def run_sql_query(self, query, description, params=None):
+        """Execute SQL query and display results (served from cache when unchanged)"""
         print(f"\n{'='*80}")
         print(f"📊 QUERY: {description}")
         print(f"{'='*80}")
         print(f"\nSQL:\n{query}\n")
+        if params:
+            print(f"Parameters: {params}\n")
         
-        df = pd.read_sql_query(query, self.conn)
+        df = self.cache.get_or_run(query, params)
         print(df.to_string(index=False))
         print(f"\n📈 Results: {len(df)} rows returned")
         return df
     
-    def query_1_basic_select(self):
-        """Query 1: Basic SELECT - View all customers"""
-        query = '''
-        SELECT customer_id, name, city, customer_type
-        FROM customers
-        LIMIT 10;
-        '''
-        return self.run_sql_query(query, "View first 10 customers")
-    
-    def query_2_where_filter(self):
-        """Query 2: WHERE clause - Filter by condition"""
-        query = '''
-        SELECT name, email, city
-        FROM customers
-        WHERE city = 'Mumbai' AND customer_type = 'Premium';
-        '''
-        return self.run_sql_query(query, "Premium customers from Mumbai")
-    
-    def query_3_aggregation(self):
-        """Query 3: Aggregation - Calculate statistics"""
-        query = '''
-        SELECT 
-            COUNT(*) as total_orders,
-            SUM(total_amount) as total_revenue,
-            AVG(total_amount) as avg_order_value,
-            MAX(total_amount) as highest_order,
-            MIN(total_amount) as lowest_order
-        FROM orders
-        WHERE status = 'Completed';
-        '''
-        return self.run_sql_query(query, "Overall sales statistics (completed orders)")
-    
-    def query_4_group_by(self):
-        """Query 4: GROUP BY - Sales by city"""
-        query = '''
-        SELECT 
-            c.city,
-            COUNT(o.order_id) as total_orders,
-            SUM(o.total_amount) as total_revenue,
-            AVG(o.total_amount) as avg_order_value
-        FROM customers c
-        JOIN orders o ON c.customer_id = o.customer_id
-        WHERE o.status = 'Completed'
-        GROUP BY c.city
-        ORDER BY total_revenue DESC;
-        '''
-        return self.run_sql_query(query, "Sales performance by city")
-    
-    def query_5_having_clause(self):
-        """Query 5: HAVING - Filter grouped results"""
-        query = '''
-        SELECT 
-            c.customer_id,
-            c.name,
-            COUNT(o.order_id) as order_count,
-            SUM(o.total_amount) as total_spent
-        FROM customers c
-        JOIN orders o ON c.customer_id = o.customer_id
-        WHERE o.status = 'Completed'
-        GROUP BY c.customer_id, c.name
-        HAVING SUM(o.total_amount) > 5000
-        ORDER BY total_spent DESC;
-        '''
-        return self.run_sql_query(query, "High-value customers (spent > ₹5000)")
-    
-    def query_6_inner_join(self):
-        """Query 6: INNER JOIN - Orders with customer & product details"""
-        query = '''
-        SELECT 
-            o.order_id,
-            c.name as customer_name,
-            p.product_name,
-            o.quantity,
-            o.total_amount,
-            o.order_date,
-            o.status
-        FROM orders o
-        INNER JOIN customers c ON o.customer_id = c.customer_id
-        INNER JOIN products p ON o.product_id = p.product_id
-        ORDER BY o.order_date DESC
-        LIMIT 10;
-        '''
-        return self.run_sql_query(query, "Recent orders with full details")
+    def run_registered(self, name, **params):
+        """Run a registered analysis with bound parameters (defaults for the rest)"""
+        query, description, bound = QUERIES.bind(name, **params)
+        return self.run_sql_query(query, description, bound or None)
+    
+    def query_1_basic_select(self, **params):
+        """
+        Query 1: Basic SELECT - View all customers
+        Parameters: limit
+        """
+        return self.run_registered('query_1_basic_select', **params)
+    
+    def query_2_where_filter(self, **params):
+        """
+        Query 2: WHERE clause - Filter by condition
+        Parameters: city, customer_type
+        """
+        return self.run_registered('query_2_where_filter', **params)
+    
+    def query_3_aggregation(self, **params):
+        """
+        Query 3: Aggregation - Calculate statistics
+        Parameters: status
+        """
+        return self.run_registered('query_3_aggregation', **params)
+    
+    def query_4_group_by(self, **params):
+        """
+        Query 4: GROUP BY - Sales by city
+        Parameters: status
+        """
+        return self.run_registered('query_4_group_by', **params)
+    
+    def query_5_having_clause(self, **params):
+        """
+        Query 5: HAVING - Filter grouped results
+        Parameters: status, min_spent
+        """
+        return self.run_registered('query_5_having_clause', **params)
+    
+    def query_6_inner_join(self, **params):
+        """
+        Query 6: INNER JOIN - Orders with customer & product details
+        Parameters: limit
+        """
+        return self.run_registered('query_6_inner_join', **params)
     
     def query_7_left_join(self):
         """Query 7: LEFT JOIN - Find customers without orders"""
-        query = '''
-        SELECT 
-            c.customer_id,
-            c.name,
-            c.email,
-            c.city,
-            COUNT(o.order_id) as order_count
-        FROM customers c
-        LEFT JOIN orders o ON c.customer_id = o.customer_id
-        GROUP BY c.customer_id, c.name, c.email, c.city
-        HAVING COUNT(o.order_id) = 0;
-        '''
-        return self.run_sql_query(query, "Customers who never ordered (potential leads!)")
+        return self.run_registered('query_7_left_join')
     
     def query_8_subquery(self):
         """Query 8: Subquery - Products above average price"""
+        return self.run_registered('query_8_subquery')
+    
+    def query_9_advanced_grouping(self, **params):
+        """
+        Query 9: Multi-level grouping - Category performance by city
+        Parameters: status
+        """
+        return self.run_registered('query_9_advanced_grouping', **params)
+    
+    def query_10_date_analysis(self, **params):
+        """
+        Query 10: Date-based analysis - Monthly sales trend
+        Parameters: status, start_date, end_date
+        """
+        return self.run_registered('query_10_date_analysis', **params)
+    
+    def _business_report_aggregate(self):
+        """
+        ONE scan of orders ⋈ customers ⋈ products, pre-aggregated per
+        (status, customer, product). Every report section is derived from
+        this small result instead of re-scanning orders five times.
+        LEFT JOINs keep orders without a matching customer/product, which the
+        status breakdown still counts (it never joined).
+        """
         query = '''
         SELECT 
-            product_name,
-            category,
-            price,
-            ROUND((price - (SELECT AVG(price) FROM products)), 2) as price_vs_avg
-        FROM products
-        WHERE price > (SELECT AVG(price) FROM products)
-        ORDER BY price DESC;
-        '''
-        return self.run_sql_query(query, "Premium products (above average price)")
-    
-    def query_9_advanced_grouping(self):
-        """Query 9: Multi-level grouping - Category performance by city"""
-        query = '''
-        SELECT 
+            o.status,
+            o.customer_id,
+            c.customer_id IS NOT NULL as has_customer,
             c.city,
-            p.category,
-            COUNT(o.order_id) as orders,
+            c.customer_type,
+            p.product_id IS NOT NULL as has_product,
+            p.product_name,
+            COUNT(*) as orders,
+            SUM(o.quantity) as units,
             SUM(o.total_amount) as revenue
         FROM orders o
-        JOIN customers c ON o.customer_id = c.customer_id
-        JOIN products p ON o.product_id = p.product_id
-        WHERE o.status = 'Completed'
-        GROUP BY c.city, p.category
-        ORDER BY c.city, revenue DESC;
-        '''
-        return self.run_sql_query(query, "Category performance by city")
-    
-    def query_10_date_analysis(self):
-        """Query 10: Date-based analysis - Monthly sales trend"""
-        query = '''
-        SELECT 
-            strftime('%Y-%m', order_date) as month,
-            COUNT(*) as orders,
-            SUM(total_amount) as revenue,
-            AVG(total_amount) as avg_order_value
-        FROM orders
-        WHERE status = 'Completed'
-        GROUP BY strftime('%Y-%m', order_date)
-        ORDER BY month DESC;
+        LEFT JOIN customers c ON o.customer_id = c.customer_id
+        LEFT JOIN products p ON o.product_id = p.product_id
+        GROUP BY o.status, o.customer_id, o.product_id;
         '''
-        return self.run_sql_query(query, "Monthly sales trend")
-    
+        return pd.read_sql_query(query, self.conn)
+
     def generate_business_report(self):
-        """Generate comprehensive business insights report"""
+        """Generate comprehensive business insights report (single table scan)"""
         print("\n" + "="*80)
         print("📊 COMPREHENSIVE BUSINESS ANALYTICS REPORT")
         print("="*80)
+
+        agg = self._business_report_aggregate()
+        completed = agg[(agg['status'] == 'Completed') & (agg['has_customer'] == 1)]
         
         # 1. Overall metrics
-        query1 = '''
-        SELECT 
-            COUNT(DISTINCT c.customer_id) as total_customers,
-            COUNT(DISTINCT o.order_id) as total_orders,
-            SUM(o.total_amount) as total_revenue,
-            AVG(o.total_amount) as avg_order_value
-        FROM customers c
-        LEFT JOIN orders o ON c.customer_id = o.customer_id
-        WHERE o.status = 'Completed';
-        '''
-        df1 = pd.read_sql_query(query1, self.conn)
+        total_orders = int(completed['orders'].sum())
+        total_revenue = completed['revenue'].sum()
+        kpis = {
+            'total_customers': completed['customer_id'].nunique(),
+            'total_orders': total_orders,
+            'total_revenue': total_revenue,
+            'avg_order_value': total_revenue / total_orders if total_orders else float('nan'),
+        }
         
         print("\n📈 KEY PERFORMANCE INDICATORS")
         print("-" * 80)
-        print(f"Total Customers: {df1['total_customers'][0]}")
-        print(f"Total Orders: {df1['total_orders'][0]}")
-        print(f"Total Revenue: ₹{df1['total_revenue'][0]:,.2f}")
-        print(f"Average Order Value: ₹{df1['avg_order_value'][0]:,.2f}")
+        print(f"Total Customers: {kpis['total_customers']}")
+        print(f"Total Orders: {kpis['total_orders']}")
+        print(f"Total Revenue: ₹{kpis['total_revenue']:,.2f}")
+        print(f"Average Order Value: ₹{kpis['avg_order_value']:,.2f}")
         
         # 2. Top performing cities
-        query2 = '''
-        SELECT 
-            c.city,
-            SUM(o.total_amount) as revenue
-        FROM customers c
-        JOIN orders o ON c.customer_id = o.customer_id
-        WHERE o.status = 'Completed'
-        GROUP BY c.city
-        ORDER BY revenue DESC
-        LIMIT 3;
-        '''
-        df2 = pd.read_sql_query(query2, self.conn)
+        top_cities = (completed.groupby('city')['revenue'].sum()
+                      .sort_values(ascending=False).head(3))
         
         print("\n🏆 TOP 3 CITIES BY REVENUE")
         print("-" * 80)
-        for idx, row in df2.iterrows():
-            print(f"{idx+1}. {row['city']}: ₹{row['revenue']:,.2f}")
+        for rank, (city, revenue) in enumerate(top_cities.items(), start=1):
+            print(f"{rank}. {city}: ₹{revenue:,.2f}")
         
         # 3. Best selling products
-        query3 = '''
-        SELECT 
-            p.product_name,
-            SUM(o.quantity) as units_sold,
-            SUM(o.total_amount) as revenue
-        FROM products p
-        JOIN orders o ON p.product_id = o.product_id
-        WHERE o.status = 'Completed'
-        GROUP BY p.product_name
-        ORDER BY revenue DESC
-        LIMIT 5;
-        '''
-        df3 = pd.read_sql_query(query3, self.conn)
+        completed_products = agg[(agg['status'] == 'Completed') & (agg['has_product'] == 1)]
+        top_products = (completed_products.groupby('product_name')[['units', 'revenue']].sum()
+                        .sort_values('revenue', ascending=False).head(5))
         
         print("\n🌟 TOP 5 BEST-SELLING PRODUCTS")
         print("-" * 80)
-        for idx, row in df3.iterrows():
-            print(f"{idx+1}. {row['product_name']}: {row['units_sold']} units sold (₹{row['revenue']:,.2f})")
+        for rank, (product_name, units, revenue) in enumerate(
+                zip(top_products.index, top_products['units'], top_products['revenue']), start=1):
+            print(f"{rank}. {product_name}: {units} units sold (₹{revenue:,.2f})")
         
         # 4. Customer insights
-        query4 = '''
-        SELECT 
-            customer_type,
-            COUNT(*) as customer_count,
-            AVG(total_spent) as avg_spent
-        FROM (
-            SELECT 
-                c.customer_type,
-                SUM(o.total_amount) as total_spent
-            FROM customers c
-            LEFT JOIN orders o ON c.customer_id = o.customer_id
-            WHERE o.status = 'Completed'
-            GROUP BY c.customer_id, c.customer_type
-        )
-        GROUP BY customer_type;
-        '''
-        df4 = pd.read_sql_query(query4, self.conn)
+        spent_per_customer = completed.groupby(['customer_id', 'customer_type'])['revenue'].sum()
+        segments = (spent_per_customer.groupby(level='customer_type')
+                    .agg(customer_count='count', avg_spent='mean'))
         
         print("\n👥 CUSTOMER SEGMENT ANALYSIS")
         print("-" * 80)
-        for idx, row in df4.iterrows():
-            print(f"{row['customer_type']}: {row['customer_count']} customers, "
-                  f"Avg spent: ₹{row['avg_spent']:,.2f}")
+        for customer_type, count, avg_spent in zip(
+                segments.index, segments['customer_count'], segments['avg_spent']):
+            print(f"{customer_type}: {count} customers, "
+                  f"Avg spent: ₹{avg_spent:,.2f}")
         
         # 5. Order status breakdown
-        query5 = '''
-        SELECT 
-            status,
-            COUNT(*) as order_count,
-            SUM(total_amount) as revenue
-        FROM orders
-        GROUP BY status;
-        '''
-        df5 = pd.read_sql_query(query5, self.conn)
+        statuses = agg.groupby('status')[['orders', 'revenue']].sum()
         
         print("\n📦 ORDER STATUS BREAKDOWN")
         print("-" * 80)
-        for idx, row in df5.iterrows():
-            print(f"{row['status']}: {row['order_count']} orders (₹{row['revenue']:,.2f})")
+        for status, count, revenue in zip(statuses.index, statuses['orders'], statuses['revenue']):
+            print(f"{status}: {count} orders (₹{revenue:,.2f})")
         
         print("\n" + "="*80)
         print("✅ Report generated successfully!")
         print("="*80)
+
+        return {
+            'kpis': kpis,
+            'top_cities': top_cities,
+            'top_products': top_products,
+            'segments': segments,
+            'status_breakdown': statuses,
+        }
     
     def export_to_csv(self, query, filename):
         """Export query results to CSV (for Pandas analysis)"""
@@ -501,6 +611,9 @@ def main():
     '''
     analyzer.export_to_csv(query, 'sales_export.csv')
     
+    # Query cache statistics
+    analyzer.cache.print_stats()
+
     # Close connection
     analyzer.close()
     
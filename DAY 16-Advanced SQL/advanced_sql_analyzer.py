@@ -5,29 +5,392 @@ Window functions, CTEs, CASE statements, and complex business queries
 Skills: Advanced SQL patterns used in real data analyst work
 """
 
+import heapq
+import re
 import sqlite3
+import sys
 import pandas as pd
 from datetime import datetime
+from pathlib import Path
+
+# The query cache and registry live next to the Day 15 analyzer (same database)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'DAY 15-SQL Basics'))
+from query_cache import QueryResultCache, bump_table_versions
+from query_registry import QueryRegistry
+
+# The cohort retention store is shared with the Day 17 platform
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from cohort_retention import CohortRetentionStore
+
+# Month of an order, computed by SQLite from order_date
+ORDER_MONTH_COLUMN = "order_month TEXT GENERATED ALWAYS AS (strftime('%Y-%m', order_date))"
+
+# Indexes tailored to the query catalogue below. Almost every query filters on
+# status = 'Completed', so most are PARTIAL indexes over completed orders only,
+# and they carry the summed columns and status too (COVERING) so the table is
+# never read.
+INDEX_MIGRATION = [
+    # query_1, query_5, query_10, executive summary tiers (per-customer work)
+    ('idx_orders_completed_customer',
+     "ON orders(customer_id, order_date, total_amount, status) WHERE status = 'Completed'"),
+    # query_2, query_3 (per-product revenue)
+    ('idx_orders_completed_product',
+     "ON orders(product_id, quantity, total_amount, status) WHERE status = 'Completed'"),
+    # query_9 and the revenue store's refresh (per-day revenue)
+    ('idx_orders_completed_date',
+     "ON orders(order_date, total_amount, status) WHERE status = 'Completed'"),
+    # revenue store's refresh (per-month revenue)
+    ('idx_orders_completed_month',
+     "ON orders(order_month, total_amount, status) WHERE status = 'Completed'"),
+    # query_7, query_8, executive summary (all statuses, joined from customers)
+    ('idx_orders_customer_status',
+     "ON orders(customer_id, status, order_date, total_amount)"),
+]
+
+# Incremental revenue store read by query_4 and query_6. Orders can arrive
+# with any id, change status or be deleted, so a refresh compares each day's
+# and month's revenue with the orders table and rewrites only what differs.
+REVENUE_STORE_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS daily_revenue (
+        sale_date TEXT PRIMARY KEY,
+        daily_revenue REAL NOT NULL,
+        running_total REAL NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS monthly_revenue (
+        month TEXT PRIMARY KEY,
+        revenue REAL NOT NULL,
+        prev_month_revenue REAL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS revenue_store_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        orders_version INTEGER NOT NULL,
+        order_count INTEGER NOT NULL,
+        max_order_id INTEGER
+    )
+    ''',
+    'DROP TABLE IF EXISTS revenue_store_watermark',   # order_id watermark of older stores
+]
+
+# Analyses registered ONCE with named parameters (defaults = the classic literals)
+QUERIES = QueryRegistry()
+
+QUERIES.register('query_1_row_number', '''
+    SELECT 
+        c.name as customer_name,
+        o.order_date,
+        o.total_amount,
+        ROW_NUMBER() OVER (
+            PARTITION BY c.customer_id 
+            ORDER BY o.order_date
+        ) as order_number
+    FROM orders o
+    JOIN customers c ON o.customer_id = c.customer_id
+    WHERE o.status = :status
+    ORDER BY c.name, o.order_date
+    LIMIT :limit;
+    ''',
+    "WINDOW FUNCTION: ROW_NUMBER - Track order sequence per customer", status='Completed', limit=20)
+
+QUERIES.register('query_2_rank_products', '''
+    WITH product_sales AS (
+        SELECT 
+            p.product_name,
+            p.category,
+            SUM(o.quantity) as units_sold,
+            SUM(o.total_amount) as revenue
+        FROM products p
+        JOIN orders o ON p.product_id = o.product_id
+        WHERE o.status = :status
+        GROUP BY p.product_id, p.product_name, p.category
+    )
+    SELECT 
+        product_name,
+        category,
+        units_sold,
+        revenue,
+        RANK() OVER (ORDER BY revenue DESC) as overall_rank,
+        RANK() OVER (PARTITION BY category ORDER BY revenue DESC) as rank_in_category
+    FROM product_sales
+    ORDER BY overall_rank;
+    ''',
+    "WINDOW FUNCTION: RANK - Product rankings overall and within category", status='Completed')
+
+QUERIES.register('query_3_top_n_per_group', '''
+    WITH ranked_products AS (
+        SELECT 
+            p.category,
+            p.product_name,
+            SUM(o.total_amount) as revenue,
+            ROW_NUMBER() OVER (
+                PARTITION BY p.category 
+                ORDER BY SUM(o.total_amount) DESC
+            ) as rank_in_category
+        FROM products p
+        JOIN orders o ON p.product_id = o.product_id
+        WHERE o.status = :status
+        GROUP BY p.category, p.product_name
+    )
+    SELECT 
+        category,
+        product_name,
+        revenue,
+        rank_in_category
+    FROM ranked_products
+    WHERE rank_in_category <= :n
+    ORDER BY category, rank_in_category;
+    ''',
+    "TOP N PER GROUP: Best {n} products in each category (Interview Pattern!)", status='Completed', n=2)
+
+QUERIES.register('query_4_running_total', '''
+    SELECT 
+        sale_date,
+        daily_revenue,
+        running_total
+    FROM daily_revenue
+    WHERE sale_date BETWEEN :start_date AND :end_date
+    ORDER BY sale_date DESC
+    LIMIT :limit;
+    ''',
+    "RUNNING TOTAL: Cumulative revenue over time", start_date='0001-01-01', end_date='9999-12-31', limit=15)
+
+QUERIES.register('query_5_multiple_ctes', '''
+    WITH 
+    -- CTE 1: Calculate customer totals
+    customer_totals AS (
+        SELECT 
+            customer_id,
+            COUNT(*) as order_count,
+            SUM(total_amount) as total_spent,
+            AVG(total_amount) as avg_order
+        FROM orders
+        WHERE status = :status
+        GROUP BY customer_id
+    ),
+    -- CTE 2: Calculate overall averages
+    overall_stats AS (
+        SELECT 
+            AVG(total_spent) as avg_customer_value,
+            AVG(order_count) as avg_orders_per_customer
+        FROM customer_totals
+    ),
+    -- CTE 3: Compare customers to averages
+    customer_comparison AS (
+        SELECT 
+            ct.*,
+            os.avg_customer_value,
+            os.avg_orders_per_customer,
+            CASE
+                WHEN ct.total_spent > os.avg_customer_value * 2 THEN 'Top Tier'
+                WHEN ct.total_spent > os.avg_customer_value THEN 'Above Average'
+                WHEN ct.total_spent > os.avg_customer_value * 0.5 THEN 'Average'
+                ELSE 'Below Average'
+            END as performance_tier
+        FROM customer_totals ct
+        CROSS JOIN overall_stats os
+    )
+    SELECT 
+        c.name,
+        c.city,
+        c.customer_type,
+        cc.order_count,
+        ROUND(cc.total_spent, 2) as total_spent,
+        ROUND(cc.avg_order, 2) as avg_order,
+        cc.performance_tier
+    FROM customer_comparison cc
+    JOIN customers c ON cc.customer_id = c.customer_id
+    ORDER BY cc.total_spent DESC
+    LIMIT :limit;
+    ''',
+    "MULTIPLE CTEs: Customer performance tiers vs. averages", status='Completed', limit=15)
+
+QUERIES.register('query_6_recursive_cte', '''
+    WITH revenue_with_previous AS (
+        SELECT 
+            month,
+            revenue,
+            prev_month_revenue
+        FROM monthly_revenue
+    )
+    SELECT 
+        month,
+        ROUND(revenue, 2) as current_revenue,
+        ROUND(prev_month_revenue, 2) as previous_revenue,
+        ROUND(revenue - prev_month_revenue, 2) as revenue_change,
+        ROUND(
+            ((revenue - prev_month_revenue) / prev_month_revenue * 100), 
+            2
+        ) as growth_percent
+    FROM revenue_with_previous
+    WHERE prev_month_revenue IS NOT NULL
+      AND month BETWEEN :start_month AND :end_month
+    ORDER BY month DESC;
+    ''',
+    "GROWTH ANALYSIS: Month-over-month revenue change (CTE + LAG)", start_month='0001-01', end_month='9999-12')
+
+QUERIES.register('query_7_case_segmentation', '''
+    WITH customer_metrics AS (
+        SELECT 
+            c.customer_id,
+            c.name,
+            c.city,
+            c.customer_type,
+            COUNT(o.order_id) as order_count,
+            SUM(o.total_amount) as total_spent,
+            AVG(o.total_amount) as avg_order_value,
+            MAX(o.order_date) as last_order_date,
+            julianday('now') - julianday(MAX(o.order_date)) as days_since_last_order
+        FROM customers c
+        LEFT JOIN orders o ON c.customer_id = o.customer_id
+        WHERE o.status = :status OR o.status IS NULL
+        GROUP BY c.customer_id, c.name, c.city, c.customer_type
+    )
+    SELECT 
+        name,
+        city,
+        order_count,
+        ROUND(total_spent, 2) as total_spent,
+        ROUND(avg_order_value, 2) as avg_order,
+        CASE
+            WHEN order_count = 0 THEN 'Never Purchased'
+            WHEN days_since_last_order > 60 THEN 'At Risk'
+            WHEN days_since_last_order > 30 THEN 'Needs Attention'
+            WHEN total_spent > 5000 THEN 'VIP Active'
+            ELSE 'Active'
+        END as customer_status,
+        CASE
+            WHEN total_spent > 10000 THEN 'Platinum'
+            WHEN total_spent > 5000 THEN 'Gold'
+            WHEN total_spent > 2000 THEN 'Silver'
+            WHEN total_spent > 0 THEN 'Bronze'
+            ELSE 'Prospect'
+        END as loyalty_tier
+    FROM customer_metrics
+    ORDER BY total_spent DESC;
+    ''',
+    "CASE STATEMENTS: Customer segmentation with multiple tiers", status='Completed')
+
+QUERIES.register('query_8_case_pivot', '''
+    SELECT 
+        c.customer_id,
+        c.name,
+        COUNT(o.order_id) as total_orders,
+        SUM(CASE WHEN o.status = 'Completed' THEN 1 ELSE 0 END) as completed,
+        SUM(CASE WHEN o.status = 'Pending' THEN 1 ELSE 0 END) as pending,
+        SUM(CASE WHEN o.status = 'Cancelled' THEN 1 ELSE 0 END) as cancelled,
+        ROUND(
+            SUM(CASE WHEN o.status = 'Completed' THEN 1 ELSE 0 END) * 100.0 / 
+            COUNT(o.order_id), 
+            1
+        ) as completion_rate
+    FROM customers c
+    JOIN orders o ON c.customer_id = o.customer_id
+    GROUP BY c.customer_id, c.name
+    HAVING COUNT(o.order_id) > :min_orders
+    ORDER BY completion_rate DESC
+    LIMIT :limit;
+    ''',
+    "CASE + PIVOT: Order status breakdown per customer", min_orders=2, limit=15)
+
+QUERIES.register('query_9_date_analysis', '''
+    SELECT 
+        CASE CAST(strftime('%w', order_date) AS INTEGER)
+            WHEN 0 THEN 'Sunday'
+            WHEN 1 THEN 'Monday'
+            WHEN 2 THEN 'Tuesday'
+            WHEN 3 THEN 'Wednesday'
+            WHEN 4 THEN 'Thursday'
+            WHEN 5 THEN 'Friday'
+            WHEN 6 THEN 'Saturday'
+        END as day_of_week,
+        CAST(strftime('%w', order_date) AS INTEGER) as day_num,
+        COUNT(*) as order_count,
+        ROUND(SUM(total_amount), 2) as total_revenue,
+        ROUND(AVG(total_amount), 2) as avg_order_value
+    FROM orders
+    WHERE status = :status
+      AND order_date BETWEEN :start_date AND :end_date
+    GROUP BY day_num
+    ORDER BY day_num;
+    ''',
+    "DATE ANALYSIS: Sales patterns by day of week", status='Completed', start_date='0001-01-01', end_date='9999-12-31')
+
+QUERIES.register('query_10_cohort_analysis', '''
+    WITH customer_first_order AS (
+        SELECT 
+            customer_id,
+            strftime('%Y-%m', MIN(order_date)) as cohort_month,
+            MIN(order_date) as first_order_date
+        FROM orders
+        WHERE status = :status
+        GROUP BY customer_id
+    ),
+    cohort_stats AS (
+        SELECT 
+            cfo.cohort_month,
+            COUNT(DISTINCT cfo.customer_id) as customers_in_cohort,
+            COUNT(DISTINCT o.order_id) as total_orders,
+            ROUND(SUM(o.total_amount), 2) as total_revenue,
+            ROUND(AVG(o.total_amount), 2) as avg_order_value
+        FROM customer_first_order cfo
+        JOIN orders o ON cfo.customer_id = o.customer_id
+        WHERE o.status = :status
+        GROUP BY cfo.cohort_month
+    )
+    SELECT 
+        cohort_month,
+        customers_in_cohort,
+        total_orders,
+        total_revenue,
+        avg_order_value,
+        ROUND(total_revenue / customers_in_cohort, 2) as revenue_per_customer,
+        ROUND(total_orders * 1.0 / customers_in_cohort, 2) as orders_per_customer
+    FROM cohort_stats
+    ORDER BY cohort_month;
+    ''',
+    "COHORT ANALYSIS: Performance by customer acquisition month", status='Completed')
 
 class AdvancedSQLAnalyzer:
     """Advanced SQL techniques for professional data analysis"""
     
-    def __init__(self, db_name='sales_analysis.db'):
+    def __init__(self, db_name='sales_analysis.db', cache_max_bytes=64 * 1024 * 1024):
         """Connect to existing database from Day 15"""
-        self.conn = sqlite3.connect(db_name)
+        # Statement cache big enough to keep every registered analysis prepared
+        self.conn = sqlite3.connect(db_name, cached_statements=QUERIES.statement_cache_size())
         self.cursor = self.conn.cursor()
+        self.cache = QueryResultCache(self.conn, max_bytes=cache_max_bytes)
+        self.cohorts = CohortRetentionStore(self.conn)
         print(f"✅ Connected to: {db_name}")
         print("📊 Using database from Day 15\n")
+        self._ensure_order_month_column()
+
+    def _ensure_order_month_column(self):
+        """
+        Add the generated order_month column to databases created before it
+        existed. SQLite can only ADD a VIRTUAL generated column (fresh Day 15
+        databases get a STORED one); indexing it stores the value anyway.
+        """
+        columns = [row[1] for row in self.cursor.execute("PRAGMA table_xinfo(orders)")]
+        if columns and 'order_month' not in columns:
+            self.cursor.execute(f"ALTER TABLE orders ADD COLUMN {ORDER_MONTH_COLUMN} VIRTUAL")
+            self.conn.commit()
+            print("🔧 Added generated column orders.order_month\n")
     
-    def run_query(self, query, description):
-        """Execute and display query results"""
+    def run_query(self, query, description, params=None):
+        """Execute and display query results (served from cache when unchanged)"""
         print("=" * 80)
         print(f"📊 {description}")
         print("=" * 80)
         print(f"\nSQL Query:\n{query}\n")
+        if params:
+            print(f"Parameters: {params}\n")
         
         try:
-            df = pd.read_sql_query(query, self.conn)
+            df = self.cache.get_or_run(query, params)
             print("Results:")
             print(df.to_string(index=False))
             print(f"\n✅ {len(df)} rows returned\n")
@@ -36,342 +399,100 @@ class AdvancedSQLAnalyzer:
             print(f"❌ Error: {e}\n")
             return None
     
+    def run_registered(self, name, **params):
+        """Run a registered analysis with bound parameters (defaults for the rest)"""
+        query, description, bound = QUERIES.bind(name, **params)
+        return self.run_query(query, description, bound or None)
+    
     # =========================================================================
     # WINDOW FUNCTIONS
     # =========================================================================
     
-    def query_1_row_number(self):
-        """Window Function 1: ROW_NUMBER - Number orders per customer"""
-        query = '''
-        SELECT 
-            c.name as customer_name,
-            o.order_date,
-            o.total_amount,
-            ROW_NUMBER() OVER (
-                PARTITION BY c.customer_id 
-                ORDER BY o.order_date
-            ) as order_number
-        FROM orders o
-        JOIN customers c ON o.customer_id = c.customer_id
-        WHERE o.status = 'Completed'
-        ORDER BY c.name, o.order_date
-        LIMIT 20;
-        '''
-        return self.run_query(query, 
-            "WINDOW FUNCTION: ROW_NUMBER - Track order sequence per customer")
+    def query_1_row_number(self, **params):
+        """
+        Window Function 1: ROW_NUMBER - Number orders per customer
+        Parameters: status, limit
+        """
+        return self.run_registered('query_1_row_number', **params)
     
-    def query_2_rank_products(self):
-        """Window Function 2: RANK - Rank products by sales"""
-        query = '''
-        WITH product_sales AS (
-            SELECT 
-                p.product_name,
-                p.category,
-                SUM(o.quantity) as units_sold,
-                SUM(o.total_amount) as revenue
-            FROM products p
-            JOIN orders o ON p.product_id = o.product_id
-            WHERE o.status = 'Completed'
-            GROUP BY p.product_id, p.product_name, p.category
-        )
-        SELECT 
-            product_name,
-            category,
-            units_sold,
-            revenue,
-            RANK() OVER (ORDER BY revenue DESC) as overall_rank,
-            RANK() OVER (PARTITION BY category ORDER BY revenue DESC) as rank_in_category
-        FROM product_sales
-        ORDER BY overall_rank;
-        '''
-        return self.run_query(query,
-            "WINDOW FUNCTION: RANK - Product rankings overall and within category")
+    def query_2_rank_products(self, **params):
+        """
+        Window Function 2: RANK - Rank products by sales
+        Parameters: status
+        """
+        return self.run_registered('query_2_rank_products', **params)
     
-    def query_3_top_n_per_group(self):
-        """Window Function 3: Top 2 products per category"""
-        query = '''
-        WITH ranked_products AS (
-            SELECT 
-                p.category,
-                p.product_name,
-                SUM(o.total_amount) as revenue,
-                ROW_NUMBER() OVER (
-                    PARTITION BY p.category 
-                    ORDER BY SUM(o.total_amount) DESC
-                ) as rank_in_category
-            FROM products p
-            JOIN orders o ON p.product_id = o.product_id
-            WHERE o.status = 'Completed'
-            GROUP BY p.category, p.product_name
-        )
-        SELECT 
-            category,
-            product_name,
-            revenue,
-            rank_in_category
-        FROM ranked_products
-        WHERE rank_in_category <= 2
-        ORDER BY category, rank_in_category;
-        '''
-        return self.run_query(query,
-            "TOP N PER GROUP: Best 2 products in each category (Interview Pattern!)")
+    def query_3_top_n_per_group(self, **params):
+        """
+        Window Function 3: Top N products per category
+        Parameters: status, n
+        """
+        return self.run_registered('query_3_top_n_per_group', **params)
     
-    def query_4_running_total(self):
-        """Window Function 4: Running total (cumulative sum)"""
-        query = '''
-        WITH daily_sales AS (
-            SELECT 
-                DATE(order_date) as sale_date,
-                SUM(total_amount) as daily_revenue
-            FROM orders
-            WHERE status = 'Completed'
-            GROUP BY DATE(order_date)
-        )
-        SELECT 
-            sale_date,
-            daily_revenue,
-            SUM(daily_revenue) OVER (
-                ORDER BY sale_date
-                ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
-            ) as running_total
-        FROM daily_sales
-        ORDER BY sale_date DESC
-        LIMIT 15;
-        '''
-        return self.run_query(query,
-            "RUNNING TOTAL: Cumulative revenue over time")
+    def query_4_running_total(self, **params):
+        """
+        Window Function 4: Running total (cumulative sum)
+        Parameters: start_date, end_date, limit
+        """
+        # Running totals are stored, so this no longer re-sums the whole history
+        self.refresh_revenue_store()
+        return self.run_registered('query_4_running_total', **params)
     
     # =========================================================================
     # COMMON TABLE EXPRESSIONS (CTEs)
     # =========================================================================
     
-    def query_5_multiple_ctes(self):
-        """CTEs: Chain multiple CTEs for complex analysis"""
-        query = '''
-        WITH 
-        -- CTE 1: Calculate customer totals
-        customer_totals AS (
-            SELECT 
-                customer_id,
-                COUNT(*) as order_count,
-                SUM(total_amount) as total_spent,
-                AVG(total_amount) as avg_order
-            FROM orders
-            WHERE status = 'Completed'
-            GROUP BY customer_id
-        ),
-        -- CTE 2: Calculate overall averages
-        overall_stats AS (
-            SELECT 
-                AVG(total_spent) as avg_customer_value,
-                AVG(order_count) as avg_orders_per_customer
-            FROM customer_totals
-        ),
-        -- CTE 3: Compare customers to averages
-        customer_comparison AS (
-            SELECT 
-                ct.*,
-                os.avg_customer_value,
-                os.avg_orders_per_customer,
-                CASE
-                    WHEN ct.total_spent > os.avg_customer_value * 2 THEN 'Top Tier'
-                    WHEN ct.total_spent > os.avg_customer_value THEN 'Above Average'
-                    WHEN ct.total_spent > os.avg_customer_value * 0.5 THEN 'Average'
-                    ELSE 'Below Average'
-                END as performance_tier
-            FROM customer_totals ct
-            CROSS JOIN overall_stats os
-        )
-        SELECT 
-            c.name,
-            c.city,
-            c.customer_type,
-            cc.order_count,
-            ROUND(cc.total_spent, 2) as total_spent,
-            ROUND(cc.avg_order, 2) as avg_order,
-            cc.performance_tier
-        FROM customer_comparison cc
-        JOIN customers c ON cc.customer_id = c.customer_id
-        ORDER BY cc.total_spent DESC
-        LIMIT 15;
-        '''
-        return self.run_query(query,
-            "MULTIPLE CTEs: Customer performance tiers vs. averages")
+    def query_5_multiple_ctes(self, **params):
+        """
+        CTEs: Chain multiple CTEs for complex analysis
+        Parameters: status, limit
+        """
+        return self.run_registered('query_5_multiple_ctes', **params)
     
-    def query_6_recursive_cte(self):
-        """CTEs: Month-over-month growth analysis"""
-        query = '''
-        WITH monthly_revenue AS (
-            SELECT 
-                strftime('%Y-%m', order_date) as month,
-                SUM(total_amount) as revenue
-            FROM orders
-            WHERE status = 'Completed'
-            GROUP BY strftime('%Y-%m', order_date)
-        ),
-        revenue_with_previous AS (
-            SELECT 
-                month,
-                revenue,
-                LAG(revenue, 1) OVER (ORDER BY month) as prev_month_revenue
-            FROM monthly_revenue
-        )
-        SELECT 
-            month,
-            ROUND(revenue, 2) as current_revenue,
-            ROUND(prev_month_revenue, 2) as previous_revenue,
-            ROUND(revenue - prev_month_revenue, 2) as revenue_change,
-            ROUND(
-                ((revenue - prev_month_revenue) / prev_month_revenue * 100), 
-                2
-            ) as growth_percent
-        FROM revenue_with_previous
-        WHERE prev_month_revenue IS NOT NULL
-        ORDER BY month DESC;
-        '''
-        return self.run_query(query,
-            "GROWTH ANALYSIS: Month-over-month revenue change (CTE + LAG)")
+    def query_6_recursive_cte(self, **params):
+        """
+        CTEs: Month-over-month growth analysis
+        Parameters: start_month, end_month
+        """
+        # Monthly revenue and LAG(revenue) are kept in the revenue store
+        self.refresh_revenue_store()
+        return self.run_registered('query_6_recursive_cte', **params)
     
     # =========================================================================
     # CASE STATEMENTS
     # =========================================================================
     
-    def query_7_case_segmentation(self):
-        """CASE: Customer segmentation"""
-        query = '''
-        WITH customer_metrics AS (
-            SELECT 
-                c.customer_id,
-                c.name,
-                c.city,
-                c.customer_type,
-                COUNT(o.order_id) as order_count,
-                SUM(o.total_amount) as total_spent,
-                AVG(o.total_amount) as avg_order_value,
-                MAX(o.order_date) as last_order_date,
-                julianday('now') - julianday(MAX(o.order_date)) as days_since_last_order
-            FROM customers c
-            LEFT JOIN orders o ON c.customer_id = o.customer_id
-            WHERE o.status = 'Completed' OR o.status IS NULL
-            GROUP BY c.customer_id, c.name, c.city, c.customer_type
-        )
-        SELECT 
-            name,
-            city,
-            order_count,
-            ROUND(total_spent, 2) as total_spent,
-            ROUND(avg_order_value, 2) as avg_order,
-            CASE
-                WHEN order_count = 0 THEN 'Never Purchased'
-                WHEN days_since_last_order > 60 THEN 'At Risk'
-                WHEN days_since_last_order > 30 THEN 'Needs Attention'
-                WHEN total_spent > 5000 THEN 'VIP Active'
-                ELSE 'Active'
-            END as customer_status,
-            CASE
-                WHEN total_spent > 10000 THEN 'Platinum'
-                WHEN total_spent > 5000 THEN 'Gold'
-                WHEN total_spent > 2000 THEN 'Silver'
-                WHEN total_spent > 0 THEN 'Bronze'
-                ELSE 'Prospect'
-            END as loyalty_tier
-        FROM customer_metrics
-        ORDER BY total_spent DESC;
-        '''
-        return self.run_query(query,
-            "CASE STATEMENTS: Customer segmentation with multiple tiers")
+    def query_7_case_segmentation(self, **params):
+        """
+        CASE: Customer segmentation
+        Parameters: status
+        """
+        return self.run_registered('query_7_case_segmentation', **params)
     
-    def query_8_case_pivot(self):
-        """CASE: Pivot-style aggregation (orders by status per customer)"""
-        query = '''
-        SELECT 
-            c.customer_id,
-            c.name,
-            COUNT(o.order_id) as total_orders,
-            SUM(CASE WHEN o.status = 'Completed' THEN 1 ELSE 0 END) as completed,
-            SUM(CASE WHEN o.status = 'Pending' THEN 1 ELSE 0 END) as pending,
-            SUM(CASE WHEN o.status = 'Cancelled' THEN 1 ELSE 0 END) as cancelled,
-            ROUND(
-                SUM(CASE WHEN o.status = 'Completed' THEN 1 ELSE 0 END) * 100.0 / 
-                COUNT(o.order_id), 
-                1
-            ) as completion_rate
-        FROM customers c
-        JOIN orders o ON c.customer_id = o.customer_id
-        GROUP BY c.customer_id, c.name
-        HAVING COUNT(o.order_id) > 2
-        ORDER BY completion_rate DESC
-        LIMIT 15;
-        '''
-        return self.run_query(query,
-            "CASE + PIVOT: Order status breakdown per customer")
+    def query_8_case_pivot(self, **params):
+        """
+        CASE: Pivot-style aggregation (orders by status per customer)
+        Parameters: min_orders, limit
+        """
+        return self.run_registered('query_8_case_pivot', **params)
     
     # =========================================================================
     # ADVANCED DATE ANALYSIS
     # =========================================================================
     
-    def query_9_date_analysis(self):
-        """Advanced date analysis: Sales by day of week"""
-        query = '''
-        SELECT 
-            CASE CAST(strftime('%w', order_date) AS INTEGER)
-                WHEN 0 THEN 'Sunday'
-                WHEN 1 THEN 'Monday'
-                WHEN 2 THEN 'Tuesday'
-                WHEN 3 THEN 'Wednesday'
-                WHEN 4 THEN 'Thursday'
-                WHEN 5 THEN 'Friday'
-                WHEN 6 THEN 'Saturday'
-            END as day_of_week,
-            CAST(strftime('%w', order_date) AS INTEGER) as day_num,
-            COUNT(*) as order_count,
-            ROUND(SUM(total_amount), 2) as total_revenue,
-            ROUND(AVG(total_amount), 2) as avg_order_value
-        FROM orders
-        WHERE status = 'Completed'
-        GROUP BY day_num
-        ORDER BY day_num;
-        '''
-        return self.run_query(query,
-            "DATE ANALYSIS: Sales patterns by day of week")
+    def query_9_date_analysis(self, **params):
+        """
+        Advanced date analysis: Sales by day of week
+        Parameters: status, start_date, end_date
+        """
+        return self.run_registered('query_9_date_analysis', **params)
     
-    def query_10_cohort_analysis(self):
-        """Advanced: Customer cohort analysis"""
-        query = '''
-        WITH customer_first_order AS (
-            SELECT 
-                customer_id,
-                strftime('%Y-%m', MIN(order_date)) as cohort_month,
-                MIN(order_date) as first_order_date
-            FROM orders
-            WHERE status = 'Completed'
-            GROUP BY customer_id
-        ),
-        cohort_stats AS (
-            SELECT 
-                cfo.cohort_month,
-                COUNT(DISTINCT cfo.customer_id) as customers_in_cohort,
-                COUNT(DISTINCT o.order_id) as total_orders,
-                ROUND(SUM(o.total_amount), 2) as total_revenue,
-                ROUND(AVG(o.total_amount), 2) as avg_order_value
-            FROM customer_first_order cfo
-            JOIN orders o ON cfo.customer_id = o.customer_id
-            WHERE o.status = 'Completed'
-            GROUP BY cfo.cohort_month
-        )
-        SELECT 
-            cohort_month,
-            customers_in_cohort,
-            total_orders,
-            total_revenue,
-            avg_order_value,
-            ROUND(total_revenue / customers_in_cohort, 2) as revenue_per_customer,
-            ROUND(total_orders * 1.0 / customers_in_cohort, 2) as orders_per_customer
-        FROM cohort_stats
-        ORDER BY cohort_month;
-        '''
-        return self.run_query(query,
-            "COHORT ANALYSIS: Performance by customer acquisition month")
+    def query_10_cohort_analysis(self, **params):
+        """
+        Advanced: Customer cohort analysis
+        Parameters: status
+        """
+        return self.run_registered('query_10_cohort_analysis', **params)
     
     def generate_executive_summary(self):
         """Generate comprehensive executive summary"""
@@ -442,6 +563,324 @@ class AdvancedSQLAnalyzer:
         print("✅ Executive Summary Complete")
         print("=" * 80)
     
+    # =========================================================================
+    # TOP-N PER GROUP (bounded heaps instead of ranking every row)
+    # =========================================================================
+
+    def top_n_per_group(self, query, group_by, order_by, n, params=None, batch_size=10_000):
+        """
+        Stream the rows of query and keep only the n best order_by values per group
+        Each group holds a min-heap of at most n rows, so memory and time grow
+        with n x groups instead of sorting every row of every partition.
+        Same rows as ROW_NUMBER() OVER (PARTITION BY group_by ORDER BY order_by
+        DESC) <= n (ties: first row seen wins); group_by=None is one group.
+        Returns a DataFrame sorted by group, best first, with rank_in_group
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(query, params or ())
+        columns = [column[0] for column in cursor.description]
+        group_idx = columns.index(group_by) if group_by else None
+        value_idx = columns.index(order_by)
+
+        heaps = {}
+        cutoff = {}   # group -> worst value kept, once its heap is full
+        seen = 0
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                seen += 1
+                key = row[group_idx] if group_idx is not None else None
+                value = row[value_idx]
+                # Fast path: most rows cannot beat a full heap's worst value
+                # (a NULL never does, and a tie loses to the earlier row)
+                if key in cutoff:
+                    worst = cutoff[key]
+                    if value is None or (worst is not None and value <= worst):
+                        continue
+                # NULLs sort last with DESC, like SQLite; -seen keeps earlier rows on ties
+                item = ((value is not None, value), -seen, row)
+                heap = heaps.setdefault(key, [])
+                if len(heap) < n:
+                    heapq.heappush(heap, item)
+                else:
+                    heapq.heappushpop(heap, item)   # pops item itself unless it is better
+                if len(heap) == n:
+                    cutoff[key] = heap[0][0][1]   # None while the worst kept row is NULL
+
+        records = []
+        for key in sorted(heaps, key=lambda k: (k is not None, k)):
+            for rank, (_, _, row) in enumerate(sorted(heaps[key], reverse=True), start=1):
+                records.append(row + (rank,))
+        return pd.DataFrame(records, columns=columns + ['rank_in_group'])
+
+    def query_3_top_n_streaming(self, n=2):
+        """Top N products per category with the bounded-heap operator (no window function)"""
+        description = f"TOP N PER GROUP (streaming heaps): Best {n} products in each category"
+        query = '''
+        SELECT 
+            p.category,
+            p.product_name,
+            SUM(o.total_amount) as revenue
+        FROM products p
+        JOIN orders o ON p.product_id = o.product_id
+        WHERE o.status = 'Completed'
+        GROUP BY p.category, p.product_name
+        '''
+        print("=" * 80)
+        print(f"📊 {description}")
+        print("=" * 80)
+        print(f"\nSQL Query:\n{query}\n")
+
+        df = self.top_n_per_group(query, 'category', 'revenue', n)
+        df = df.rename(columns={'rank_in_group': 'rank_in_category'})
+        print("Results:")
+        print(df.to_string(index=False))
+        print(f"\n✅ {len(df)} rows returned\n")
+        return df
+
+    # =========================================================================
+    # REVENUE STORE (incremental daily / monthly aggregates)
+    # =========================================================================
+
+    def _orders_fingerprint(self):
+        """(table version, row count, MAX(order_id)) of orders - moves with every load"""
+        try:
+            row = self.cursor.execute(
+                "SELECT version FROM table_versions WHERE table_name = 'orders'").fetchone()
+        except sqlite3.OperationalError:   # no load has bumped a version yet
+            row = None
+        count, max_order_id = self.cursor.execute(
+            "SELECT COUNT(*), MAX(order_id) FROM orders").fetchone()
+        return (row[0] if row else 0, count, max_order_id)
+
+    def _reconcile_revenue(self, table, key, revenue, group_by):
+        """
+        Rewrite the rows of a store table whose revenue differs from the
+        Completed orders (new, changed and vanished days or months)
+        Returns the first changed key (None if nothing changed) and the count
+        """
+        self.cursor.execute("DROP TABLE IF EXISTS temp.fresh_revenue")
+        self.cursor.execute(f'''
+            CREATE TEMP TABLE fresh_revenue AS
+            SELECT {group_by} AS {key}, SUM(total_amount) AS revenue
+            FROM orders
+            WHERE status = 'Completed'
+            GROUP BY {group_by}
+        ''')
+        changed = [row[0] for row in self.cursor.execute(f'''
+            SELECT f.{key} FROM fresh_revenue f
+            LEFT JOIN {table} s ON s.{key} = f.{key}
+            WHERE s.{revenue} IS NOT f.revenue
+            UNION
+            SELECT s.{key} FROM {table} s
+            WHERE s.{key} NOT IN (SELECT {key} FROM fresh_revenue)
+        ''')]
+        if changed:
+            self.cursor.execute(
+                f"DELETE FROM {table} WHERE {key} NOT IN (SELECT {key} FROM fresh_revenue)")
+            # running_total / prev_month_revenue are recomputed by the caller
+            extra = ', running_total' if table == 'daily_revenue' else ''
+            self.cursor.execute(f'''
+                INSERT INTO {table} ({key}, {revenue}{extra})
+                SELECT {key}, revenue{', 0' if extra else ''} FROM fresh_revenue WHERE true
+                ON CONFLICT({key}) DO UPDATE SET {revenue} = excluded.{revenue}
+                WHERE {revenue} IS NOT excluded.{revenue}
+            ''')
+        self.cursor.execute("DROP TABLE temp.fresh_revenue")
+        return (min(changed) if changed else None), len(changed)
+
+    def refresh_revenue_store(self, rebuild=False):
+        """
+        Bring daily_revenue / monthly_revenue up to date with the orders table
+        Nothing is read while the orders fingerprint (table version, row count,
+        MAX(order_id)) is unchanged. Otherwise each day's and month's Completed
+        revenue is compared with the store and only the differing rows are
+        rewritten - orders inserted below the old maximum id, status changes
+        and deletes included. Running totals and previous-month revenue are
+        then recomputed from the first changed date onward.
+        rebuild=True starts again from an empty store.
+        Returns the number of days and months rewritten
+        """
+        for statement in REVENUE_STORE_SCHEMA:
+            self.cursor.execute(statement)
+        if rebuild:
+            for table in ('daily_revenue', 'monthly_revenue', 'revenue_store_state'):
+                self.cursor.execute(f"DELETE FROM {table}")
+
+        fingerprint = self._orders_fingerprint()
+        state = self.cursor.execute(
+            "SELECT orders_version, order_count, max_order_id FROM revenue_store_state"
+        ).fetchone()
+        if state == fingerprint:
+            self.conn.commit()
+            return 0
+
+        # 1. Days and months whose revenue no longer matches the orders
+        first_day, days = self._reconcile_revenue(
+            'daily_revenue', 'sale_date', 'daily_revenue', 'DATE(order_date)')
+        first_month, months = self._reconcile_revenue(
+            'monthly_revenue', 'month', 'revenue', 'order_month')
+
+        if first_day is not None:
+            # 2. Running totals from the first affected day onward
+            base = self.cursor.execute('''
+                SELECT running_total FROM daily_revenue
+                WHERE sale_date < ? ORDER BY sale_date DESC LIMIT 1
+            ''', (first_day,)).fetchone()
+            self.cursor.execute('''
+                WITH suffix AS (
+                    SELECT 
+                        sale_date,
+                        SUM(daily_revenue) OVER (
+                            ORDER BY sale_date
+                            ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                        ) as cumulative
+                    FROM daily_revenue
+                    WHERE sale_date >= :first_day
+                )
+                UPDATE daily_revenue
+                SET running_total = :base + suffix.cumulative
+                FROM suffix
+                WHERE daily_revenue.sale_date = suffix.sale_date
+            ''', {'first_day': first_day, 'base': base[0] if base else 0})
+
+        if first_month is not None:
+            # 3. Previous-month revenue from the first affected month onward
+            #    (the month before it is included so LAG can see it)
+            self.cursor.execute('''
+                WITH suffix AS (
+                    SELECT 
+                        month,
+                        LAG(revenue, 1) OVER (ORDER BY month) as prev_month_revenue
+                    FROM monthly_revenue
+                    WHERE month >= COALESCE(
+                        (SELECT MAX(month) FROM monthly_revenue WHERE month < :first_month),
+                        :first_month)
+                )
+                UPDATE monthly_revenue
+                SET prev_month_revenue = suffix.prev_month_revenue
+                FROM suffix
+                WHERE monthly_revenue.month = suffix.month
+                  AND monthly_revenue.month >= :first_month
+            ''', {'first_month': first_month})
+
+        self.cursor.execute('''
+            INSERT INTO revenue_store_state (id, orders_version, order_count, max_order_id)
+            VALUES (1, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                orders_version = excluded.orders_version,
+                order_count = excluded.order_count,
+                max_order_id = excluded.max_order_id
+        ''', fingerprint)
+        self.conn.commit()
+        if days or months:
+            bump_table_versions(self.conn, ['daily_revenue', 'monthly_revenue'])
+
+        print(f"🔄 Revenue store: {days:,} days, {months:,} months updated\n")
+        return days + months
+
+    # =========================================================================
+    # COHORT RETENTION TRIANGLE
+    # =========================================================================
+
+    def query_11_cohort_retention(self, value='retention_rate', rebuild=False):
+        """
+        Advanced: Full retention triangle (cohort x months since first order)
+        Kept in the cohort_* tables; only customers with new orders are
+        re-aggregated, so loading a new month does not rescan the history.
+        value: retention_rate, customers, orders or revenue
+        """
+        print("\n" + "=" * 80)
+        print("📊 COHORT RETENTION: Cohort x months since first order")
+        print("=" * 80)
+
+        refreshed = self.cohorts.refresh(rebuild=rebuild)
+        self.conn.commit()
+        print(f"🔄 Cohort store: {refreshed:,} customers re-aggregated\n")
+
+        triangle = self.cohorts.triangle()
+        print(self.cohorts.matrix(value, triangle).to_string(na_rep=''))
+        print(f"\n📈 {triangle['cohort_month'].nunique()} cohorts, {len(triangle)} cells")
+        return triangle
+
+    # =========================================================================
+    # INDEX ADVISOR
+    # =========================================================================
+
+    CATALOGUE = [
+        'query_1_row_number', 'query_2_rank_products', 'query_3_top_n_per_group',
+        'query_4_running_total', 'query_5_multiple_ctes', 'query_6_recursive_cte',
+        'query_7_case_segmentation', 'query_8_case_pivot', 'query_9_date_analysis',
+        'query_10_cohort_analysis',
+    ]
+
+    def apply_index_migration(self):
+        """Create the partial/covering indexes and refresh planner statistics"""
+        print("\n" + "=" * 80)
+        print("🔧 APPLYING INDEX MIGRATION")
+        print("=" * 80)
+
+        for name, definition in INDEX_MIGRATION:
+            self.cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} {definition}")
+            print(f"   ✅ {name}")
+
+        # Statistics let the planner choose between the new indexes
+        self.cursor.execute("ANALYZE")
+        self.conn.commit()
+        print(f"\n✅ {len(INDEX_MIGRATION)} indexes in place")
+
+    def _catalogue_queries(self):
+        """(name, SQL, bound parameters) of every catalogued query, straight from the registry"""
+        return [(name, *QUERIES.bind(name)[::2]) for name in self.CATALOGUE]
+
+    def explain_query_catalogue(self):
+        """
+        EXPLAIN QUERY PLAN for every catalogued query
+        A query is flagged when the plan reads the whole orders table
+        (SCAN without USING INDEX); returns one row per query
+        """
+        print("\n" + "=" * 80)
+        print("🔍 QUERY PLAN REPORT")
+        print("=" * 80)
+
+        report = []
+        for name, query, params in self._catalogue_queries():
+            try:
+                plan = [row[3] for row in self.cursor.execute(f"EXPLAIN QUERY PLAN {query}", params or ())]
+            except sqlite3.OperationalError as e:   # e.g. the revenue store is not built yet
+                print(f"\n⚠️ NOT PLANNED  {name}: {e}")
+                report.append({'query': name, 'uses_index': False, 'covering': False,
+                               'full_scan_of_orders': False, 'indexes': '', 'plan': f"error: {e}"})
+                continue
+            aliases = {'orders'} | set(re.findall(r'\borders\s+(?:AS\s+)?(\w+)', query, re.IGNORECASE))
+            full_scans = [step for step in plan
+                          if step.startswith('SCAN ') and 'USING' not in step
+                          and step.split()[1] in aliases]
+            indexes = sorted({m for step in plan
+                              for m in re.findall(r'USING (?:COVERING )?INDEX (\w+)', step)})
+
+            report.append({
+                'query': name,
+                'uses_index': bool(indexes),
+                'covering': any('COVERING INDEX' in step for step in plan),
+                'full_scan_of_orders': bool(full_scans),
+                'indexes': ', '.join(indexes),
+                'plan': ' | '.join(plan),
+            })
+
+            status = "❌ FULL SCAN" if full_scans else "✅ INDEX"
+            print(f"\n{status}  {name}")
+            for step in plan:
+                print(f"      {step}")
+
+        report_df = pd.DataFrame(report)
+        planned = int((~report_df['plan'].str.startswith('error: ')).sum())
+        scans = int(report_df['full_scan_of_orders'].sum())
+        print(f"\n📈 {planned - scans}/{planned} planned queries avoid a full scan of orders")
+        return report_df
+
     def close(self):
         """Close database connection"""
         self.conn.close()
@@ -473,6 +912,8 @@ def main():
     input("Press Enter to continue...")
     analyzer.query_3_top_n_per_group()
     input("Press Enter to continue...")
+    analyzer.query_3_top_n_streaming()
+    input("Press Enter to continue...")
     analyzer.query_4_running_total()
     
     print("\n🔥 PART 2: COMMON TABLE EXPRESSIONS")
@@ -492,11 +933,21 @@ def main():
     analyzer.query_9_date_analysis()
     input("Press Enter to continue...")
     analyzer.query_10_cohort_analysis()
+    input("Press Enter to continue...")
+    analyzer.query_11_cohort_retention()
     
     print("\n🔥 PART 5: EXECUTIVE SUMMARY")
     input("Press Enter to generate report...")
     analyzer.generate_executive_summary()
     
+    print("\n🔥 PART 6: INDEX ADVISOR")
+    input("Press Enter to add indexes and check query plans...")
+    analyzer.apply_index_migration()
+    analyzer.explain_query_catalogue()
+    
+    # Query cache statistics
+    analyzer.cache.print_stats()
+
     # Close connection
     analyzer.close()
     
@@ -508,7 +959,7 @@ def main():
     print("✅ Common Table Expressions (CTEs)")
     print("✅ CASE statements for logic")
     print("✅ Advanced date analysis")
-    print("✅ Cohort analysis")
+    print("✅ Cohort analysis and retention triangles")
     print("✅ Complex business queries")
     print("\n🎯 These are ADVANCED skills that set you apart!")
 
@@ -10,183 +10,312 @@ import pandas as pd
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.chart import BarChart, Reference, LineChart
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import gzip
 import os
+import time
+
+# Sheets of the sales summary report: (sheet name, query)
+SUMMARY_SHEETS = [
+    ('Executive Summary', '''
+    SELECT 
+        'Total Customers' as metric,
+        COUNT(DISTINCT customer_id) as value
+    FROM customers
+    UNION ALL
+    SELECT 
+        'Total Orders',
+        COUNT(*)
+    FROM orders
+    UNION ALL
+    SELECT 
+        'Completed Orders',
+        SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END)
+    FROM orders
+    UNION ALL
+    SELECT 
+        'Total Revenue',
+        ROUND(SUM(CASE WHEN status = 'Completed' THEN total_amount ELSE 0 END), 2)
+    FROM orders
+    UNION ALL
+    SELECT 
+        'Average Order Value',
+        ROUND(AVG(CASE WHEN status = 'Completed' THEN total_amount END), 2)
+    FROM orders;
+    '''),
+    ('Top Customers', '''
+    SELECT 
+        c.name as Customer,
+        c.city as City,
+        c.customer_type as Type,
+        COUNT(o.order_id) as Orders,
+        ROUND(SUM(o.total_amount), 2) as Total_Spent,
+        ROUND(AVG(o.total_amount), 2) as Avg_Order
+    FROM customers c
+    JOIN orders o ON c.customer_id = o.customer_id
+    WHERE o.status = 'Completed'
+    GROUP BY c.customer_id, c.name, c.city, c.customer_type
+    ORDER BY Total_Spent DESC
+    LIMIT 20;
+    '''),
+    ('Product Performance', '''
+    SELECT 
+        p.product_name as Product,
+        p.category as Category,
+        p.price as Unit_Price,
+        SUM(o.quantity) as Units_Sold,
+        ROUND(SUM(o.total_amount), 2) as Revenue,
+        ROUND(AVG(o.total_amount), 2) as Avg_Sale
+    FROM products p
+    JOIN orders o ON p.product_id = o.product_id
+    WHERE o.status = 'Completed'
+    GROUP BY p.product_id, p.product_name, p.category, p.price
+    ORDER BY Revenue DESC;
+    '''),
+    ('City Analysis', '''
+    SELECT 
+        c.city as City,
+        COUNT(DISTINCT c.customer_id) as Customers,
+        COUNT(o.order_id) as Orders,
+        ROUND(SUM(o.total_amount), 2) as Revenue,
+        ROUND(AVG(o.total_amount), 2) as Avg_Order,
+        ROUND(SUM(o.total_amount) / COUNT(DISTINCT c.customer_id), 2) as Revenue_Per_Customer
+    FROM customers c
+    JOIN orders o ON c.customer_id = o.customer_id
+    WHERE o.status = 'Completed'
+    GROUP BY c.city
+    ORDER BY Revenue DESC;
+    '''),
+    ('Monthly Trends', '''
+    SELECT 
+        strftime('%Y-%m', order_date) as Month,
+        COUNT(*) as Orders,
+        ROUND(SUM(total_amount), 2) as Revenue,
+        ROUND(AVG(total_amount), 2) as Avg_Order
+    FROM orders
+    WHERE status = 'Completed'
+    GROUP BY strftime('%Y-%m', order_date)
+    ORDER BY Month;
+    '''),
+]
+
+# Report styles
+HEADER_FONT = Font(bold=True, color="FFFFFF", size=12)
+HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+NUMBER_ALIGNMENT = Alignment(horizontal="right")
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+
+# Advanced report: (sheet name, query, formatting)
+# formatting keys: headers, styled, chart ('bar' / 'line'), title, x_title, y_title
+ADVANCED_REPORT = [
+    ('Top Products', '''
+    SELECT 
+        p.product_name,
+        ROUND(SUM(o.total_amount), 2) as revenue
+    FROM products p
+    JOIN orders o ON p.product_id = o.product_id
+    WHERE o.status = 'Completed'
+    GROUP BY p.product_id, p.product_name
+    ORDER BY revenue DESC
+    LIMIT 10;
+    ''', {
+        'headers': ['Product', 'Revenue'],
+        'chart': 'bar',
+        'title': "Top 10 Products by Revenue",
+        'x_title': "Product",
+        'y_title': "Revenue (₹)",
+    }),
+    ('Monthly Trends', '''
+    SELECT 
+        strftime('%Y-%m', order_date) as month,
+        ROUND(SUM(total_amount), 2) as revenue
+    FROM orders
+    WHERE status = 'Completed'
+    GROUP BY strftime('%Y-%m', order_date)
+    ORDER BY month;
+    ''', {
+        'headers': ['Month', 'Revenue'],
+        'chart': 'line',
+        'title': "Monthly Revenue Trend",
+        'x_title': "Month",
+        'y_title': "Revenue (₹)",
+    }),
+]
+
+CHART_TYPES = {'bar': BarChart, 'line': LineChart}
+
+def _read_sheet_query(db_name, query):
+    """Worker for build_report: run one sheet query on its own READ-ONLY connection"""
+    db_uri = Path(db_name).resolve().as_uri() + '?mode=ro'
+    conn = sqlite3.connect(db_uri, uri=True)
+    try:
+        return pd.read_sql_query(query, conn)
+    finally:
+        conn.close()
+
+MAX_COLUMN_WIDTH = 50
+WIDTH_SAMPLE_ROWS = 1000
+
+def plan_column_widths(df, max_width=MAX_COLUMN_WIDTH, sample_rows=WIDTH_SAMPLE_ROWS):
+    """
+    Column widths (header + 2, capped at max_width) from DataFrame statistics
+    - integers: length of the min/max value (2 numbers per column)
+    - text/float: vectorized str.len() over at most sample_rows rows
+    Returns a list with one width per column, in column order.
+    """
+    if sample_rows and len(df) > sample_rows:
+        sample = df.sample(n=sample_rows, random_state=0)
+    else:
+        sample = df
+    
+    widths = []
+    for column in df.columns:
+        values = df[column]
+        longest = len(str(column))
+        if pd.api.types.is_integer_dtype(values) and len(values):
+            longest = max(longest, len(str(values.min())), len(str(values.max())))
+        elif len(sample):
+            longest = max(longest, int(sample[column].astype(str).str.len().max()))
+        widths.append(min(longest + 2, max_width))
+    return widths
+
+def apply_column_widths(ws, widths):
+    """Set worksheet column widths from a plan_column_widths() list"""
+    for col_idx, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
 
 class ExcelReportGenerator:
     """Automated Excel report generation from SQL queries"""
     
     def __init__(self, db_name='sales_analysis.db'):
         """Initialize database connection"""
+        self.db_name = db_name
         self.conn = sqlite3.connect(db_name)
+        self.width_plans = {}   # normalized query -> column widths, for the report being built
         print(f"✅ Connected to: {db_name}\n")
     
-    def create_sales_summary_report(self, output_file='Sales_Summary_Report.xlsx'):
-        """Generate comprehensive sales summary in Excel"""
+    def plan_widths(self, query, df):
+        """
+        Column widths for a query's result, planned once per report
+        (every report starts with an empty plan, so changed data is re-planned)
+        """
+        key = ' '.join(query.split())
+        if key not in self.width_plans:
+            self.width_plans[key] = plan_column_widths(df)
+        return self.width_plans[key]
+    
+    def create_sales_summary_report(self, output_file='Sales_Summary_Report.xlsx',
+                                    streaming=True, chunksize=50_000):
+        """
+        Generate comprehensive sales summary in Excel
+        streaming=True writes and styles every sheet in ONE pass through a
+        write-only workbook (memory stays flat, no reload/re-save).
+        streaming=False is the original pandas + format_excel_report path.
+        """
         
         print("="*70)
         print("📊 GENERATING SALES SUMMARY REPORT")
         print("="*70)
-        
-        # Create Excel writer
-        writer = pd.ExcelWriter(output_file, engine='openpyxl')
-        
-        # =====================================================================
-        # SHEET 1: Executive Summary
-        # =====================================================================
-        print("\n📄 Sheet 1: Executive Summary...")
-        
-        query = '''
-        SELECT 
-            'Total Customers' as metric,
-            COUNT(DISTINCT customer_id) as value
-        FROM customers
-        UNION ALL
-        SELECT 
-            'Total Orders',
-            COUNT(*)
-        FROM orders
-        UNION ALL
-        SELECT 
-            'Completed Orders',
-            SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END)
-        FROM orders
-        UNION ALL
-        SELECT 
-            'Total Revenue',
-            ROUND(SUM(CASE WHEN status = 'Completed' THEN total_amount ELSE 0 END), 2)
-        FROM orders
-        UNION ALL
-        SELECT 
-            'Average Order Value',
-            ROUND(AVG(CASE WHEN status = 'Completed' THEN total_amount END), 2)
-        FROM orders;
-        '''
-        
-        df_summary = pd.read_sql_query(query, self.conn)
-        df_summary.to_excel(writer, sheet_name='Executive Summary', index=False)
-        
-        # =====================================================================
-        # SHEET 2: Top Customers
-        # =====================================================================
-        print("📄 Sheet 2: Top Customers...")
-        
-        query = '''
-        SELECT 
-            c.name as Customer,
-            c.city as City,
-            c.customer_type as Type,
-            COUNT(o.order_id) as Orders,
-            ROUND(SUM(o.total_amount), 2) as Total_Spent,
-            ROUND(AVG(o.total_amount), 2) as Avg_Order
-        FROM customers c
-        JOIN orders o ON c.customer_id = o.customer_id
-        WHERE o.status = 'Completed'
-        GROUP BY c.customer_id, c.name, c.city, c.customer_type
-        ORDER BY Total_Spent DESC
-        LIMIT 20;
-        '''
-        
-        df_customers = pd.read_sql_query(query, self.conn)
-        df_customers.to_excel(writer, sheet_name='Top Customers', index=False)
-        
-        # =====================================================================
-        # SHEET 3: Product Performance
-        # =====================================================================
-        print("📄 Sheet 3: Product Performance...")
-        
-        query = '''
-        SELECT 
-            p.product_name as Product,
-            p.category as Category,
-            p.price as Unit_Price,
-            SUM(o.quantity) as Units_Sold,
-            ROUND(SUM(o.total_amount), 2) as Revenue,
-            ROUND(AVG(o.total_amount), 2) as Avg_Sale
-        FROM products p
-        JOIN orders o ON p.product_id = o.product_id
-        WHERE o.status = 'Completed'
-        GROUP BY p.product_id, p.product_name, p.category, p.price
-        ORDER BY Revenue DESC;
-        '''
-        
-        df_products = pd.read_sql_query(query, self.conn)
-        df_products.to_excel(writer, sheet_name='Product Performance', index=False)
-        
-        # =====================================================================
-        # SHEET 4: City Analysis
-        # =====================================================================
-        print("📄 Sheet 4: City Analysis...")
-        
-        query = '''
-        SELECT 
-            c.city as City,
-            COUNT(DISTINCT c.customer_id) as Customers,
-            COUNT(o.order_id) as Orders,
-            ROUND(SUM(o.total_amount), 2) as Revenue,
-            ROUND(AVG(o.total_amount), 2) as Avg_Order,
-            ROUND(SUM(o.total_amount) / COUNT(DISTINCT c.customer_id), 2) as Revenue_Per_Customer
-        FROM customers c
-        JOIN orders o ON c.customer_id = o.customer_id
-        WHERE o.status = 'Completed'
-        GROUP BY c.city
-        ORDER BY Revenue DESC;
-        '''
-        
-        df_cities = pd.read_sql_query(query, self.conn)
-        df_cities.to_excel(writer, sheet_name='City Analysis', index=False)
-        
-        # =====================================================================
-        # SHEET 5: Monthly Trends
-        # =====================================================================
-        print("📄 Sheet 5: Monthly Trends...")
-        
-        query = '''
-        SELECT 
-            strftime('%Y-%m', order_date) as Month,
-            COUNT(*) as Orders,
-            ROUND(SUM(total_amount), 2) as Revenue,
-            ROUND(AVG(total_amount), 2) as Avg_Order
-        FROM orders
-        WHERE status = 'Completed'
-        GROUP BY strftime('%Y-%m', order_date)
-        ORDER BY Month;
-        '''
-        
-        df_monthly = pd.read_sql_query(query, self.conn)
-        df_monthly.to_excel(writer, sheet_name='Monthly Trends', index=False)
-        
-        # Save the workbook
-        writer.close()
-        
-        # =====================================================================
-        # FORMAT THE EXCEL FILE
-        # =====================================================================
-        print("\n🎨 Formatting Excel file...")
-        self.format_excel_report(output_file)
+        print()
+        
+        self.width_plans.clear()
+        if streaming:
+            wb = Workbook(write_only=True)
+            for number, (sheet_name, query) in enumerate(SUMMARY_SHEETS, start=1):
+                print(f"📄 Sheet {number}: {sheet_name}...")
+                self._write_sheet_streaming(wb, sheet_name, query, chunksize)
+            wb.save(output_file)
+            print("\n🎨 Formatting applied while writing")
+        else:
+            widths = {}
+            
+            # Create Excel writer
+            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+                for number, (sheet_name, query) in enumerate(SUMMARY_SHEETS, start=1):
+                    print(f"📄 Sheet {number}: {sheet_name}...")
+                    df = pd.read_sql_query(query, self.conn)
+                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+                    widths[sheet_name] = self.plan_widths(query, df)
+            
+            # =================================================================
+            # FORMAT THE EXCEL FILE
+            # =================================================================
+            print("\n🎨 Formatting Excel file...")
+            self.format_excel_report(output_file, widths=widths)
         
         print(f"\n✅ Report generated: {output_file}")
-        print(f"📊 5 sheets created with formatted data and charts")
+        print(f"📊 {len(SUMMARY_SHEETS)} sheets created with formatted data and charts")
         
         return output_file
     
-    def format_excel_report(self, filename):
-        """Add professional formatting to Excel file"""
+    def _write_sheet_streaming(self, wb, sheet_name, query, chunksize=50_000):
+        """
+        Stream a query into a write-only worksheet, styling cells as they are
+        written: header style, borders, right-aligned numbers with number
+        formats. Column widths must be set before the first row in write-only
+        mode, so they are planned from the first chunk.
+        """
+        ws = wb.create_sheet(sheet_name)
+        rows = 0
+        
+        for chunk in pd.read_sql_query(query, self.conn, chunksize=chunksize):
+            if rows == 0:
+                # Column widths planned from the first chunk
+                apply_column_widths(ws, self.plan_widths(query, chunk))
+                
+                # Header row
+                header = []
+                for column in chunk.columns:
+                    cell = WriteOnlyCell(ws, value=column)
+                    cell.font = HEADER_FONT
+                    cell.fill = HEADER_FILL
+                    cell.alignment = HEADER_ALIGNMENT
+                    cell.border = THIN_BORDER
+                    header.append(cell)
+                ws.append(header)
+            
+            # Data rows
+            for values in chunk.itertuples(index=False, name=None):
+                row = []
+                for value in values:
+                    if pd.isna(value):
+                        value = None
+                    cell = WriteOnlyCell(ws, value=value)
+                    cell.border = THIN_BORDER
+                    if isinstance(value, (int, float)):
+                        cell.alignment = NUMBER_ALIGNMENT
+                        cell.number_format = '#,##0' if isinstance(value, int) else '#,##0.00'
+                    row.append(cell)
+                ws.append(row)
+            rows += len(chunk)
+        
+        return rows
+    
+    def format_excel_report(self, filename, widths=None):
+        """
+        Add professional formatting to Excel file
+        widths: {sheet name: column widths} from plan_widths(); sheets without
+        a plan are sized from their values with plan_column_widths()
+        """
         
         # Load the workbook
         wb = load_workbook(filename)
         
         # Define styles
-        header_font = Font(bold=True, color="FFFFFF", size=12)
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
-        
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        header_font = HEADER_FONT
+        header_fill = HEADER_FILL
+        header_alignment = HEADER_ALIGNMENT
+        border = THIN_BORDER
         
         # Format each sheet
         for sheet_name in wb.sheetnames:
@@ -199,20 +328,14 @@ class ExcelReportGenerator:
                 cell.alignment = header_alignment
                 cell.border = border
             
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+            # Column widths (planned from the data, not per-cell)
+            if widths and sheet_name in widths:
+                sheet_widths = widths[sheet_name]
+            else:
+                header = [cell.value for cell in ws[1]]
+                df = pd.DataFrame(list(ws.iter_rows(min_row=2, values_only=True)), columns=header)
+                sheet_widths = plan_column_widths(df)
+            apply_column_widths(ws, sheet_widths)
             
             # Add borders to all cells with data
             for row in ws.iter_rows(min_row=2, max_row=ws.max_row, max_col=ws.max_column):
@@ -229,121 +352,186 @@ class ExcelReportGenerator:
         wb.save(filename)
         print("   ✅ Professional formatting applied")
     
-    def create_advanced_report_with_charts(self, output_file='Advanced_Sales_Report.xlsx'):
+    def create_advanced_report_with_charts(self, output_file='Advanced_Sales_Report.xlsx',
+                                           parallel=True, max_workers=None):
         """Create report with charts and advanced formatting"""
         
         print("\n" + "="*70)
         print("📊 GENERATING ADVANCED REPORT WITH CHARTS")
         print("="*70)
         
-        # Create workbook
-        wb = Workbook()
-        wb.remove(wb.active)  # Remove default sheet
-        
-        # =====================================================================
-        # SHEET: Top Products Chart
-        # =====================================================================
-        print("\n📊 Creating Top Products chart...")
-        
-        ws_products = wb.create_sheet("Top Products")
-        
-        # Get data
-        query = '''
-        SELECT 
-            p.product_name,
-            ROUND(SUM(o.total_amount), 2) as revenue
-        FROM products p
-        JOIN orders o ON p.product_id = o.product_id
-        WHERE o.status = 'Completed'
-        GROUP BY p.product_id, p.product_name
-        ORDER BY revenue DESC
-        LIMIT 10;
-        '''
+        self.build_report(ADVANCED_REPORT, output_file, parallel=parallel, max_workers=max_workers)
         
-        df = pd.read_sql_query(query, self.conn)
-        
-        # Write headers
-        ws_products['A1'] = 'Product'
-        ws_products['B1'] = 'Revenue'
-        
-        # Write data
-        for idx, row in df.iterrows():
-            ws_products.cell(row=idx+2, column=1, value=row['product_name'])
-            ws_products.cell(row=idx+2, column=2, value=row['revenue'])
-        
-        # Create bar chart
-        chart = BarChart()
-        chart.title = "Top 10 Products by Revenue"
-        chart.x_axis.title = "Product"
-        chart.y_axis.title = "Revenue (₹)"
-        
-        data = Reference(ws_products, min_col=2, min_row=1, max_row=len(df)+1)
-        categories = Reference(ws_products, min_col=1, min_row=2, max_row=len(df)+1)
-        
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(categories)
-        chart.height = 15
-        chart.width = 25
-        
-        ws_products.add_chart(chart, "D2")
-        
-        # =====================================================================
-        # SHEET: Monthly Trend Chart
-        # =====================================================================
-        print("📈 Creating Monthly Trends chart...")
-        
-        ws_monthly = wb.create_sheet("Monthly Trends")
-        
-        # Get data
-        query = '''
-        SELECT 
-            strftime('%Y-%m', order_date) as month,
-            ROUND(SUM(total_amount), 2) as revenue
-        FROM orders
-        WHERE status = 'Completed'
-        GROUP BY strftime('%Y-%m', order_date)
-        ORDER BY month;
-        '''
-        
-        df = pd.read_sql_query(query, self.conn)
-        
-        # Write headers
-        ws_monthly['A1'] = 'Month'
-        ws_monthly['B1'] = 'Revenue'
-        
-        # Write data
-        for idx, row in df.iterrows():
-            ws_monthly.cell(row=idx+2, column=1, value=row['month'])
-            ws_monthly.cell(row=idx+2, column=2, value=row['revenue'])
-        
-        # Create line chart
-        chart = LineChart()
-        chart.title = "Monthly Revenue Trend"
-        chart.x_axis.title = "Month"
-        chart.y_axis.title = "Revenue (₹)"
+        print(f"\n✅ Advanced report generated: {output_file}")
+        print("📊 Includes data tables and professional charts")
         
-        data = Reference(ws_monthly, min_col=2, min_row=1, max_row=len(df)+1)
-        categories = Reference(ws_monthly, min_col=1, min_row=2, max_row=len(df)+1)
+        return output_file
+    
+    def build_report(self, report, output_file, parallel=True, max_workers=None):
+        """
+        Build a workbook from a declarative report: [(sheet name, query, formatting)]
+        parallel=True runs every sheet query at the same time, each on its own
+        read-only connection; the sheets are then written one by one, in order.
+        parallel=False runs the queries one after another on self.conn.
+        """
+        if not report:
+            raise ValueError("build_report needs at least one (sheet name, query, formatting) entry")
+        start = time.perf_counter()
+        queries = [query for _, query, _ in report]
+        self.width_plans.clear()
+        
+        if parallel:
+            # Workers open their own connections - make sure they see our writes
+            self.conn.commit()
+            with ThreadPoolExecutor(max_workers=max_workers or len(queries)) as pool:
+                frames = list(pool.map(_read_sheet_query, [self.db_name] * len(queries), queries))
+        else:
+            frames = [pd.read_sql_query(query, self.conn) for query in queries]
+        query_seconds = time.perf_counter() - start
         
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(categories)
-        chart.height = 15
-        chart.width = 25
+        # Create workbook
+        wb = Workbook()
+        wb.remove(wb.active)  # Remove default sheet
         
-        ws_monthly.add_chart(chart, "D2")
+        for (sheet_name, query, formatting), df in zip(report, frames):
+            print(f"📄 {sheet_name}: {len(df):,} rows")
+            self._write_report_sheet(wb, sheet_name, query, df, formatting)
         
         # Save workbook
         wb.save(output_file)
-        print(f"\n✅ Advanced report generated: {output_file}")
-        print("📊 Includes data tables and professional charts")
         
+        mode = "parallel" if parallel else "sequential"
+        print(f"⏱️  Queries: {query_seconds:.2f}s ({mode}), "
+              f"total: {time.perf_counter() - start:.2f}s")
         return output_file
     
-    def export_data_for_analysis(self, output_dir='exported_data'):
-        """Export multiple datasets as CSV for further analysis"""
+    def _write_report_sheet(self, wb, sheet_name, query, df, formatting):
+        """Write one sheet of build_report, with optional table style and chart"""
+        ws = wb.create_sheet(sheet_name)
+        
+        # Write headers and data
+        ws.append(formatting.get('headers', list(df.columns)))
+        for values in df.itertuples(index=False, name=None):
+            ws.append([None if pd.isna(value) else value for value in values])
+        
+        if formatting.get('styled'):
+            for cell in ws[1]:
+                cell.font = HEADER_FONT
+                cell.fill = HEADER_FILL
+                cell.alignment = HEADER_ALIGNMENT
+                cell.border = THIN_BORDER
+            for row in ws.iter_rows(min_row=2):
+                for cell in row:
+                    cell.border = THIN_BORDER
+                    if isinstance(cell.value, (int, float)):
+                        cell.alignment = NUMBER_ALIGNMENT
+            apply_column_widths(ws, self.plan_widths(query, df))
+        
+        if formatting.get('chart'):
+            chart = CHART_TYPES[formatting['chart']]()
+            chart.title = formatting.get('title')
+            chart.x_axis.title = formatting.get('x_title')
+            chart.y_axis.title = formatting.get('y_title')
+            
+            data = Reference(ws, min_col=2, min_row=1, max_row=len(df)+1)
+            categories = Reference(ws, min_col=1, min_row=2, max_row=len(df)+1)
+            
+            chart.add_data(data, titles_from_data=True)
+            chart.set_categories(categories)
+            chart.height = 15
+            chart.width = 25
+            
+            ws.add_chart(chart, "D2")
+        
+        return ws
+    
+    def _declared_column_types(self, query):
+        """
+        Declared SQLite type of each result column of query ('' for computed
+        columns such as COUNT or ROUND), read from a temporary view
+        """
+        self.conn.execute(f"CREATE TEMP VIEW export_columns AS {query.strip().rstrip(';')}")
+        try:
+            return [row[2].upper() for row in self.conn.execute("PRAGMA table_info(export_columns)")]
+        finally:
+            self.conn.execute("DROP VIEW export_columns")
+
+    @staticmethod
+    def _parquet_schema(declared_types, first_chunk):
+        """
+        One Arrow schema for every chunk of an export, fixed up front
+        - declared columns follow SQLite's type names (DATE is stored as text)
+        - computed columns are float64 if numeric in the first chunk (a later
+          chunk may hold NULLs, which pandas turns into floats), else string
+        """
+        import pyarrow as pa
+
+        fields = []
+        for column, declared in zip(first_chunk.columns, declared_types):
+            if 'INT' in declared:
+                arrow_type = pa.int64()
+            elif any(name in declared for name in ('CHAR', 'CLOB', 'TEXT', 'DATE', 'TIME')):
+                arrow_type = pa.string()
+            elif any(name in declared for name in ('REAL', 'FLOA', 'DOUB', 'DEC', 'NUM')):
+                arrow_type = pa.float64()
+            elif pd.api.types.is_numeric_dtype(first_chunk[column]):
+                arrow_type = pa.float64()
+            else:
+                arrow_type = pa.string()
+            fields.append(pa.field(column, arrow_type))
+        return pa.schema(fields)
+
+    def _stream_query_to_file(self, query, path, file_format='csv', chunksize=50_000):
+        """
+        Write a query result to disk chunk by chunk (bounded memory)
+        file_format: 'csv', 'csv.gz' (gzip-compressed CSV) or 'parquet' (needs pyarrow)
+        Returns (rows written, seconds)
+        """
+        start = time.perf_counter()
+        rows = 0
+        if file_format == 'parquet':
+            # Before the chunk cursor opens: a view cannot be dropped while it reads
+            declared_types = self._declared_column_types(query)
+        chunks = pd.read_sql_query(query, self.conn, chunksize=chunksize)
+
+        if file_format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            writer = None
+            try:
+                for chunk in chunks:
+                    if writer is None:
+                        schema = self._parquet_schema(declared_types, chunk)
+                        writer = pq.ParquetWriter(path, schema)
+                    # Every chunk is cast to the same schema, whatever pandas inferred
+                    table = pa.Table.from_pandas(chunk, preserve_index=False).cast(schema)
+                    writer.write_table(table)
+                    rows += len(chunk)
+            finally:
+                if writer is not None:
+                    writer.close()
+        elif file_format in ('csv', 'csv.gz'):
+            opener = gzip.open if file_format == 'csv.gz' else open
+            with opener(path, 'wt', newline='', encoding='utf-8') as f:
+                for chunk in chunks:
+                    chunk.to_csv(f, header=(rows == 0), index=False)
+                    rows += len(chunk)
+        else:
+            raise ValueError(f"Unknown file format '{file_format}' (use 'csv', 'csv.gz' or 'parquet')")
+
+        return rows, time.perf_counter() - start
+
+    def export_data_for_analysis(self, output_dir='exported_data', file_format='csv',
+                                 chunksize=50_000):
+        """
+        Export multiple datasets for further analysis
+        Rows are streamed chunksize at a time, so memory stays flat no matter
+        how big the tables are. file_format: 'csv', 'csv.gz' or 'parquet'
+        """
         
         print("\n" + "="*70)
-        print("📁 EXPORTING DATA TO CSV FILES")
+        print(f"📁 EXPORTING DATA TO {file_format.upper()} FILES")
         print("="*70)
         
         # Create output directory
@@ -351,71 +539,69 @@ class ExcelReportGenerator:
             os.makedirs(output_dir)
             print(f"✅ Created directory: {output_dir}")
         
-        # Export 1: All orders with details
-        print("\n📄 Exporting: complete_orders.csv...")
-        query = '''
-        SELECT 
-            o.order_id,
-            o.order_date,
-            c.name as customer_name,
-            c.city,
-            c.customer_type,
-            p.product_name,
-            p.category,
-            o.quantity,
-            o.total_amount,
-            o.status
-        FROM orders o
-        JOIN customers c ON o.customer_id = c.customer_id
-        JOIN products p ON o.product_id = o.product_id;
-        '''
-        df = pd.read_sql_query(query, self.conn)
-        df.to_csv(f'{output_dir}/complete_orders.csv', index=False)
-        print(f"   ✅ Exported {len(df)} orders")
-        
-        # Export 2: Customer summary
-        print("📄 Exporting: customer_summary.csv...")
-        query = '''
-        SELECT 
-            c.customer_id,
-            c.name,
-            c.email,
-            c.city,
-            c.customer_type,
-            c.join_date,
-            COUNT(o.order_id) as total_orders,
-            SUM(CASE WHEN o.status = 'Completed' THEN 1 ELSE 0 END) as completed_orders,
-            ROUND(SUM(CASE WHEN o.status = 'Completed' THEN o.total_amount ELSE 0 END), 2) as total_spent
-        FROM customers c
-        LEFT JOIN orders o ON c.customer_id = o.customer_id
-        GROUP BY c.customer_id, c.name, c.email, c.city, c.customer_type, c.join_date;
-        '''
-        df = pd.read_sql_query(query, self.conn)
-        df.to_csv(f'{output_dir}/customer_summary.csv', index=False)
-        print(f"   ✅ Exported {len(df)} customers")
-        
-        # Export 3: Product performance
-        print("📄 Exporting: product_performance.csv...")
-        query = '''
-        SELECT 
-            p.product_id,
-            p.product_name,
-            p.category,
-            p.price,
-            p.stock_quantity,
-            COUNT(o.order_id) as times_ordered,
-            SUM(o.quantity) as units_sold,
-            ROUND(SUM(o.total_amount), 2) as total_revenue
-        FROM products p
-        LEFT JOIN orders o ON p.product_id = o.product_id AND o.status = 'Completed'
-        GROUP BY p.product_id, p.product_name, p.category, p.price, p.stock_quantity;
-        '''
-        df = pd.read_sql_query(query, self.conn)
-        df.to_csv(f'{output_dir}/product_performance.csv', index=False)
-        print(f"   ✅ Exported {len(df)} products")
+        exports = [
+            # Export 1: All orders with details
+            ('complete_orders', 'orders', '''
+            SELECT 
+                o.order_id,
+                o.order_date,
+                c.name as customer_name,
+                c.city,
+                c.customer_type,
+                p.product_name,
+                p.category,
+                o.quantity,
+                o.total_amount,
+                o.status
+            FROM orders o
+            JOIN customers c ON o.customer_id = c.customer_id
+            JOIN products p ON o.product_id = p.product_id;
+            '''),
+            # Export 2: Customer summary
+            ('customer_summary', 'customers', '''
+            SELECT 
+                c.customer_id,
+                c.name,
+                c.email,
+                c.city,
+                c.customer_type,
+                c.join_date,
+                COUNT(o.order_id) as total_orders,
+                SUM(CASE WHEN o.status = 'Completed' THEN 1 ELSE 0 END) as completed_orders,
+                ROUND(SUM(CASE WHEN o.status = 'Completed' THEN o.total_amount ELSE 0 END), 2) as total_spent
+            FROM customers c
+            LEFT JOIN orders o ON c.customer_id = o.customer_id
+            GROUP BY c.customer_id, c.name, c.email, c.city, c.customer_type, c.join_date;
+            '''),
+            # Export 3: Product performance
+            ('product_performance', 'products', '''
+            SELECT 
+                p.product_id,
+                p.product_name,
+                p.category,
+                p.price,
+                p.stock_quantity,
+                COUNT(o.order_id) as times_ordered,
+                SUM(o.quantity) as units_sold,
+                ROUND(SUM(o.total_amount), 2) as total_revenue
+            FROM products p
+            LEFT JOIN orders o ON p.product_id = o.product_id AND o.status = 'Completed'
+            GROUP BY p.product_id, p.product_name, p.category, p.price, p.stock_quantity;
+            '''),
+        ]
+        
+        results = {}
+        for name, label, query in exports:
+            path = os.path.join(output_dir, f'{name}.{file_format}')
+            print(f"\n📄 Exporting: {os.path.basename(path)}...")
+            rows, seconds = self._stream_query_to_file(query, path, file_format, chunksize)
+            results[name] = rows
+            print(f"   ✅ Exported {rows:,} {label} in {seconds:.2f}s "
+                  f"({rows / max(seconds, 1e-9):,.0f} rows/sec)")
         
         print(f"\n✅ All data exported to: {output_dir}/")
         print("📊 Ready for Pandas analysis, visualization, or ML!")
+        return results
     
     def close(self):
         """Close database connection"""
@@ -0,0 +1,60 @@
+"""
+Tests for AdvancedSQLAnalyzer.top_n_per_group (run with: python -m pytest)
+The bounded-heap operator must return the same rows as ROW_NUMBER(),
+including NULL values, a NULL group and ties.
+"""
+
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from advanced_sql_analyzer import AdvancedSQLAnalyzer
+
+# seq is the order rows are streamed in, so ROW_NUMBER breaks ties the same way
+ROWS = '''
+    SELECT 1 AS seq, 'A' AS grp, 5 AS value UNION ALL
+    SELECT 2, 'A', NULL UNION ALL SELECT 3, 'A', 5 UNION ALL
+    SELECT 4, 'A', NULL UNION ALL SELECT 5, 'A', 7 UNION ALL
+    SELECT 6, 'A', 5 UNION ALL SELECT 7, 'B', NULL UNION ALL
+    SELECT 8, 'B', NULL UNION ALL SELECT 9, 'B', NULL UNION ALL
+    SELECT 10, 'B', 1 UNION ALL SELECT 11, NULL, 2 UNION ALL
+    SELECT 12, NULL, 2 UNION ALL SELECT 13, NULL, NULL
+'''
+
+
+@pytest.fixture
+def analyzer():
+    """Analyzer on an empty in-memory database"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzer = AdvancedSQLAnalyzer(':memory:')
+    yield analyzer
+    analyzer.conn.close()
+
+
+@pytest.mark.parametrize('n', [1, 2, 3, 5])
+def test_top_n_per_group_matches_row_number(analyzer, n):
+    expected = pd.read_sql_query(f'''
+        SELECT seq, grp, value, rank_in_group FROM (
+            SELECT *, ROW_NUMBER() OVER (
+                PARTITION BY grp ORDER BY value DESC, seq
+            ) AS rank_in_group
+            FROM ({ROWS})
+        )
+        WHERE rank_in_group <= ?
+        ORDER BY grp IS NOT NULL, grp, rank_in_group
+    ''', analyzer.conn, params=(n,))
+
+    streamed = analyzer.top_n_per_group(f"{ROWS} ORDER BY seq", 'grp', 'value', n, batch_size=4)
+
+    pd.testing.assert_frame_equal(streamed, expected, check_dtype=False)
+
+
+def test_top_n_per_group_keeps_first_of_tied_nulls(analyzer):
+    query = "SELECT 1 AS id, NULL AS v UNION ALL SELECT 2, NULL UNION ALL SELECT 3, NULL"
+
+    df = analyzer.top_n_per_group(query, None, 'v', 1)
+
+    assert df['id'].tolist() == [1]
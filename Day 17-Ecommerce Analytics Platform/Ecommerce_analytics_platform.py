@@ -21,14 +21,212 @@ import sqlite3
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import redirect_stdout
+import io
 import random
+import re
 import os
+import sys
+import time
 from pathlib import Path
 
+# The chart cache lives at the top of the repository (shared with the dashboards)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from chart_cache import ChartCache
+from cohort_retention import CohortRetentionStore
+
 # Set style for professional visualizations
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 
+# Report stages of the pipeline: name -> (platform method, stages it needs first)
+# Every stage only reads the loaded database, so none depend on each other yet
+REPORT_STAGES = {
+    'rfm': ('perform_rfm_analysis', []),
+    'cohorts': ('analyze_cohorts', []),
+    'products': ('analyze_product_performance', []),
+    'summary': ('generate_executive_summary', []),
+    'charts': ('create_visualizations', []),
+    'excel': ('generate_excel_report', []),
+}
+
+# Queries shared by the report methods and the index advisor (query plan report)
+PRODUCT_PERFORMANCE_QUERY = '''
+SELECT
+    p.product_id,
+    p.product_name,
+    p.category,
+    p.price,
+    p.cost,
+    ROUND((p.price - p.cost) / p.price * 100, 2) as margin_percent,
+    COUNT(o.order_id) as times_ordered,
+    SUM(o.quantity) as units_sold,
+    ROUND(SUM(o.subtotal), 2) as gross_revenue,
+    ROUND(SUM(o.discount_amount), 2) as total_discounts,
+    ROUND(SUM(o.total_amount), 2) as net_revenue,
+    ROUND(SUM((p.price - p.cost) * o.quantity), 2) as profit,
+    ROUND(AVG(o.total_amount), 2) as avg_order_value
+FROM products p 
+LEFT JOIN orders o ON p.product_id = o.product_id AND o.status = 'Completed'
+GROUP BY p.product_id, p.product_name, p.category, p.price, p.cost
+HAVING units_sold > 0
+ORDER BY profit DESC
+LIMIT 20;
+'''
+
+CATEGORY_REVENUE_QUERY = '''
+SELECT
+    p.category,
+    SUM(o.total_amount) as revenue
+FROM  products p
+JOIN orders o ON p.product_id = o.product_id
+WHERE o.status = 'Completed'
+GROUP BY p.category
+ORDER BY revenue DESC;
+'''
+
+MONTHLY_TREND_QUERY = '''
+SELECT
+    order_month as month,
+    SUM(total_amount) as revenue,
+    COUNT(*) as orders
+FROM orders
+WHERE status = 'Completed'
+GROUP BY order_month
+ORDER BY order_month;
+'''
+
+# Per-customer aggregate behind the customer_metrics table ({where} limits customers)
+CUSTOMER_METRICS_AGGREGATE = '''
+SELECT
+    customer_id,
+    MIN(CASE WHEN status = 'Completed' THEN order_date END),
+    MAX(CASE WHEN status = 'Completed' THEN order_date END),
+    COUNT(*),
+    SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN status = 'Completed' THEN subtotal ELSE 0 END),
+    SUM(CASE WHEN status = 'Completed' THEN discount_amount ELSE 0 END),
+    SUM(CASE WHEN status = 'Completed' THEN total_amount ELSE 0 END)
+FROM orders
+{where}
+GROUP BY customer_id
+'''
+
+# Indexes tailored to the queries above. They filter on status = 'Completed',
+# so the indexes are PARTIAL (completed orders only) and COVERING (they hold
+# every column the query reads, status included, so the orders table itself
+# is never touched).
+INDEX_MIGRATION = [
+    # PRODUCT_PERFORMANCE_QUERY, CATEGORY_REVENUE_QUERY
+    ('idx_orders_completed_product',
+     "ON orders(product_id, quantity, subtotal, discount_amount, total_amount, status) "
+     "WHERE status = 'Completed'"),
+    # MONTHLY_TREND_QUERY
+    ('idx_orders_completed_month',
+     "ON orders(order_month, total_amount, status) WHERE status = 'Completed'"),
+    # CUSTOMER_METRICS_AGGREGATE (all statuses, grouped by customer)
+    ('idx_orders_customer_metrics',
+     "ON orders(customer_id, status, order_date, subtotal, discount_amount, total_amount)"),
+]
+
+QUERY_CATALOGUE = {
+    'product_performance': PRODUCT_PERFORMANCE_QUERY,
+    'revenue_by_category': CATEGORY_REVENUE_QUERY,
+    'monthly_trend': MONTHLY_TREND_QUERY,
+    'customer_metrics_rebuild': CUSTOMER_METRICS_AGGREGATE.format(where=''),
+    'customer_metrics_refresh': CUSTOMER_METRICS_AGGREGATE.format(
+        where='WHERE customer_id IN (SELECT customer_id FROM affected_customers)'),
+}
+
+
+# Sheets of the Excel report: (sheet name, query, DataFrame.to_excel options)
+EXCEL_REPORT_SHEETS = [
+    ('Executive Summary', '''
+    SELECT
+        'Total Customers' as Metric,
+        COUNT(DISTINCT customer_id) as Value
+    FROM customers
+    UNION ALL
+    SELECT 'Total Revenue', ROUND(SUM(completed_revenue), 2)
+    FROM customer_metrics;
+    ''', {'index': False}),
+    ('Top Customers', '''
+    SELECT 
+        c.name as Customer,
+        c.city as City,
+        m.completed_orders as Orders,
+        ROUND(m.completed_revenue, 2) as Total_Spent
+    FROM customer_metrics m
+    JOIN customers c ON c.customer_id = m.customer_id
+    WHERE m.completed_orders > 0
+    ORDER BY Total_Spent DESC
+    LIMIT 50;
+    ''', {'index': False}),
+]
+
+def _run_report_stage(db_name, method_name):
+    """
+    Worker for run_report_pipeline (runs in a separate process)
+    Opens its own READ-ONLY connection and captures the stage's console output
+    """
+    log = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(log):
+        platform = EcommerceAnalyticsPlatform(db_name=db_name)
+        db_uri = Path(db_name).resolve().as_uri() + '?mode=ro'
+        platform.conn = sqlite3.connect(db_uri, uri=True)
+        try:
+            result = getattr(platform, method_name)()
+        finally:
+            platform.conn.close()
+    return result, time.perf_counter() - start, log.getvalue()
+
+
+def _read_sheet_query(db_name, query):
+    """Worker for generate_excel_report: run one sheet query on its own READ-ONLY connection"""
+    db_uri = Path(db_name).resolve().as_uri() + '?mode=ro'
+    conn = sqlite3.connect(db_uri, uri=True)
+    try:
+        return pd.read_sql_query(query, conn)
+    finally:
+        conn.close()
+
+
+# Draw functions for create_visualizations: draw(df) -> figure
+def _draw_revenue_by_category(df):
+    """Bar chart of CATEGORY_REVENUE_QUERY"""
+    fig = plt.figure(figsize=(12, 6))
+    sns.barplot(data=df, x='category', y='revenue', hue='category', palette='viridis', legend=False)
+    plt.title('Revenue by Product Category', fontsize=16, fontweight='bold')
+    plt.xlabel('Category', fontsize=12)
+    plt.ylabel('Revenue (₹)', fontsize=12)
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    return fig
+
+
+def _draw_monthly_trend(df):
+    """Revenue line and order bars of MONTHLY_TREND_QUERY"""
+    fig, ax1 = plt.subplots(figsize=(14, 6))
+
+    ax1.plot(df['month'], df['revenue'], marker='o', linewidth=2, color='#2E86AB')
+    ax1.set_xlabel('Month', fontsize=12)
+    ax1.set_ylabel('Revenue', fontsize=12)
+    ax1.tick_params(axis='y', labelcolor='#2E86AB')
+    ax1.grid(True, alpha=0.3)
+
+    ax2 = ax1.twinx()
+    ax2.bar(df['month'], df['orders'], alpha=0.3, color='#A23B72', label='Orders')
+    ax2.set_ylabel('Number of Orders', fontsize=12, color='#A23B72')
+    ax2.tick_params(axis='y', labelcolor='#A23B72')
+
+    plt.title('Monthly Revenue and Order Trends', fontsize=16, fontweight='bold')
+    plt.xticks(rotation=45, ha='right')
+    fig.tight_layout()
+    return fig
+
+
 class EcommerceAnalyticsPlatform:
     """
     Complete analytics platform for e-commerce business
@@ -181,7 +379,183 @@ class EcommerceAnalyticsPlatform:
         print(f"    ✅ Generated {len(self.orders_df)} orders")
 
         return self.customers_df, self.products_df, self.orders_df
-    
+
+    def generate_sample_data_vectorized(self, n_customers=200, n_products=50,
+                                        n_orders=100, seed=42):
+        """
+        Vectorized version of generate_sample_data for large datasets
+        Same tables and columns, but every field is drawn as a NumPy array
+        so 10M orders take seconds instead of hours
+        """
+        print("\n" + "="*80)
+        print("📥 PART 1: DATA GENERATION (vectorized)")
+        print("="*80)
+
+        rng = np.random.default_rng(seed)
+        today = np.datetime64(datetime.now().date(), 'D')
+
+        # Generate customers
+        print("\n1️⃣ Generating customers...")
+        cities = np.array(['Mumbai', 'Delhi', 'Banglore', 'Chennai', 'Pune',
+                           'Hyderabad', 'Kolkata', 'Ahmedabad'])
+        customer_types = np.array(['Regular', 'Premium', 'VIP'])
+
+        customer_ids = np.arange(1, n_customers + 1)
+        join_days = rng.integers(30, 731, size=n_customers)
+        self.customers_df = pd.DataFrame({
+            'customer_id': customer_ids,
+            'name': [f'Customer_{i}' for i in customer_ids],
+            'email': [f'customer{i}@email.com' for i in customer_ids],
+            'city': cities[rng.integers(0, len(cities), size=n_customers)],
+            'customer_type': customer_types[
+                rng.choice(len(customer_types), size=n_customers, p=[0.7, 0.2, 0.1])
+            ],
+            'join_date': np.datetime_as_string(today - join_days, unit='D')
+        })
+        print(f"    ✅ Generated {len(self.customers_df)} customers")
+
+        # Generate products
+        print("\n2️⃣ Generating products...")
+        categories = np.array(['Electronics', 'Clothing', 'Home & kitchen',
+                               'Books', 'Sports', 'Beauty', 'Toys'])
+
+        product_ids = np.arange(1, n_products + 1)
+        product_categories = categories[rng.integers(0, len(categories), size=n_products)]
+        base_price = rng.uniform(100, 5000, size=n_products)
+        self.products_df = pd.DataFrame({
+            'product_id': product_ids,
+            'product_name': [f'Product_{c}_{i}' for c, i in zip(product_categories, product_ids)],
+            'category': product_categories,
+            'price': np.round(base_price, 2),
+            'cost': np.round(base_price * 0.6, 2),   # 40% margin
+            'stock_quantity': rng.integers(10, 501, size=n_products)
+        })
+        print(f"    ✅ Generated {len(self.products_df)} products")
+
+        # Generate orders in one chunk
+        print("\n3️⃣ Generating orders...")
+        self.orders_df = next(self.iter_order_chunks(n_orders, chunk_size=max(n_orders, 1), rng=rng))
+        print(f"    ✅ Generated {len(self.orders_df)} orders")
+
+        return self.customers_df, self.products_df, self.orders_df
+
+    def iter_order_chunks(self, n_orders, chunk_size=1_000_000, seed=42,
+                          start_order_id=1, rng=None):
+        """
+        Yield orders as DataFrames of at most chunk_size rows
+        Uses the customers/products already generated, so call
+        generate_sample_data_vectorized (or generate_sample_data) first
+        """
+        if rng is None:
+            rng = np.random.default_rng(seed)
+
+        customer_ids = self.customers_df['customer_id'].to_numpy()
+        product_ids = self.products_df['product_id'].to_numpy()
+
+        # Price lookup table indexed by product_id -> one gather per chunk
+        price_lookup = np.zeros(product_ids.max() + 1)
+        price_lookup[product_ids] = self.products_df['price'].to_numpy()
+
+        # Orders are at most 365 days old, so precompute the date strings once
+        today = np.datetime64(datetime.now().date(), 'D')
+        date_lookup = np.datetime_as_string(today - np.arange(366), unit='D')
+
+        statuses = np.array(['Completed', 'Pending', 'Cancelled', 'Returned'])
+        discounts = np.array([0, 5, 10, 15, 20]) / 100
+
+        next_id = start_order_id
+        remaining = n_orders
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+
+            order_customers = customer_ids[rng.integers(0, len(customer_ids), size=size)]
+            order_products = product_ids[rng.integers(0, len(product_ids), size=size)]
+            quantity = rng.integers(1, 6, size=size)
+            discount = discounts[rng.integers(0, len(discounts), size=size)]
+
+            subtotal = price_lookup[order_products] * quantity
+            discount_amount = subtotal * discount
+            total_amount = subtotal - discount_amount
+
+            # Recent orders more likely
+            days_ago = np.minimum(rng.exponential(30, size=size).astype(np.int64), 365)
+
+            yield pd.DataFrame({
+                'order_id': np.arange(next_id, next_id + size),
+                'customer_id': order_customers,
+                'product_id': order_products,
+                'quantity': quantity,
+                'order_date': date_lookup[days_ago],
+                'subtotal': np.round(subtotal, 2),
+                'discount_percent': discount * 100,
+                'discount_amount': np.round(discount_amount, 2),
+                'total_amount': np.round(total_amount, 2),
+                'status': statuses[
+                    rng.choice(len(statuses), size=size, p=[0.75, 0.15, 0.07, 0.03])
+                ]
+            })
+
+            next_id += size
+            remaining -= size
+
+    def stream_orders(self, n_orders, chunk_size=1_000_000, sink='sqlite',
+                      output_dir=None, seed=42, start_order_id=None):
+        """
+        Generate orders chunk by chunk and write each chunk straight to a sink
+        sink='sqlite'  -> appended to the orders table (schema must exist);
+                          order ids continue after MAX(order_id) and the
+                          orders watermark moves with every committed chunk
+        sink='parquet' -> one file per chunk in output_dir (needs pyarrow)
+        start_order_id overrides the first order id (default 1 for parquet)
+        Only one chunk is held in memory at a time
+        """
+        print("\n" + "="*80)
+        print(f"🚚 STREAMING {n_orders:,} ORDERS → {sink.upper()}")
+        print("="*80)
+
+        if sink not in ('sqlite', 'parquet'):
+            raise ValueError(f"Unknown sink '{sink}' (use 'sqlite' or 'parquet')")
+
+        if sink == 'parquet':
+            output_dir = Path(output_dir) if output_dir else self.data_dir / 'orders_parquet'
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        if start_order_id is None:
+            start_order_id = 1
+            if sink == 'sqlite':
+                max_order_id = self.conn.execute("SELECT MAX(order_id) FROM orders").fetchone()[0]
+                start_order_id = (max_order_id or 0) + 1
+
+        start = datetime.now()
+        written = 0
+        chunks = self.iter_order_chunks(n_orders, chunk_size, seed, start_order_id=start_order_id)
+        for chunk_number, chunk in enumerate(chunks):
+            if sink == 'sqlite':
+                # executemany instead of to_sql (which commits on its own), so the
+                # chunk, the watermark and the metrics commit together
+                try:
+                    self.conn.executemany(
+                        f"INSERT INTO orders ({', '.join(chunk.columns)}) "
+                        f"VALUES ({', '.join('?' * len(chunk.columns))})",
+                        self._dataframe_rows(chunk)
+                    )
+                    self._update_order_watermark(chunk)
+                    self.refresh_customer_metrics(chunk['customer_id'])
+                    self.conn.commit()
+                except Exception:
+                    self.conn.rollback()
+                    raise
+            else:
+                chunk.to_parquet(output_dir / f'orders_{chunk_number:05d}.parquet', index=False)
+
+            written += len(chunk)
+            print(f"    ✅ Chunk {chunk_number + 1}: {written:,}/{n_orders:,} orders")
+
+        elapsed = (datetime.now() - start).total_seconds()
+        print(f"\n✅ Streamed {written:,} orders in {elapsed:.1f}s "
+              f"({written / max(elapsed, 1e-9):,.0f} rows/sec)")
+        return written
+
     # =========================================================================
     # PART 2: DATA CLEANING & VALIDATION
     # =========================================================================
@@ -273,10 +647,13 @@ class EcommerceAnalyticsPlatform:
     # PART 3: DATABASE SETUP
     # =========================================================================
 
-    def create_database_schema(self):
+    def create_database_schema(self, drop_existing=True):
         """
         Create normalized databse schema
         Following database design practices
+
+        drop_existing=False keeps existing tables, rows and indexes
+        (used by the incremental load)
         """
         print("\n" + "="*80)
         print("🗄️  PART 3: DATABASE SCHEMA CREATION")
@@ -285,14 +662,18 @@ class EcommerceAnalyticsPlatform:
         cursor = self.conn.cursor()
 
         # Drop existing tables
-        cursor.execute("DROP TABLE IF EXISTS orders")
-        cursor.execute("DROP TABLE IF EXISTS products")
-        cursor.execute("DROP TABLE IF EXISTS customers")
+        if drop_existing:
+            cursor.execute("DROP TABLE IF EXISTS orders")
+            cursor.execute("DROP TABLE IF EXISTS products")
+            cursor.execute("DROP TABLE IF EXISTS customers")
+            cursor.execute("DROP TABLE IF EXISTS load_watermark")
+            cursor.execute("DROP TABLE IF EXISTS customer_metrics")
+            CohortRetentionStore(self.conn).drop_schema()
 
         # Create customers table
         print("\n1️⃣ Creating customers table...")
         cursor.execute('''
-            CREATE TABLE customers (
+            CREATE TABLE IF NOT EXISTS customers (
                        customer_id INTEGER PRIMARY KEY,
                        name TEXT NOT NULL,
                        email TEXT UNIQUE NOT NULL,
@@ -305,7 +686,7 @@ class EcommerceAnalyticsPlatform:
         # Create products table
         print("2️⃣ Creating products table...")
         cursor.execute('''
-            CREATE TABLE products (
+            CREATE TABLE IF NOT EXISTS products (
                        product_id INTEGER PRIMARY KEY,
                        product_name TEXT NOT NULL,
                        category TEXT NOT NULL,
@@ -318,7 +699,7 @@ class EcommerceAnalyticsPlatform:
         # Create orders table
         print("3️⃣ Creating orders table...")
         cursor.execute('''
-            CREATE TABLE orders(
+            CREATE TABLE IF NOT EXISTS orders(
                        order_id INTEGER PRIMARY KEY,
                        customer_id INTEGER NOT NULL,
                        product_id INTEGER NOT NULL,
@@ -329,17 +710,51 @@ class EcommerceAnalyticsPlatform:
                        discount_amount DECIMAL(10, 2) DEFAULT 0,
                        total_amount DECIMAL(10, 2) NOT NULL,
                        status TEXT CHECK(status IN ('Completed', 'Pending', 'Cancelled', 'Returned')),
+                       order_month TEXT GENERATED ALWAYS AS (strftime('%Y-%m', order_date)) STORED,
                        FOREIGN KEY (customer_id) REFERENCES customers(customer_id),
                        FOREIGN KEY (product_id) REFERENCES products(product_id)
                        )
                 ''')
         
+        # Databases created before order_month existed
+        self._ensure_order_month_column()
+
         # Create indexes for performance
         print("4️⃣ Creating indexes...")
-        cursor.execute('CREATE INDEX idx_orders_customer ON orders(customer_id)')
-        cursor.execute('CREATE INDEX idx_orders_product ON orders(product_id)')
-        cursor.execute('CREATE INDEX idx_orders_date ON orders(order_date)')
-        cursor.execute('CREATE INDEX idx_orders_status ON orders(status)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_customer ON orders(customer_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_product ON orders(product_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_date ON orders(order_date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)')
+
+        # High-water mark for incremental loads
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS load_watermark (
+                       table_name TEXT PRIMARY KEY,
+                       last_order_date DATE,
+                       last_order_id INTEGER,
+                       loaded_at TIMESTAMP
+                       )
+                ''')
+
+        # Per-customer summary maintained on every order load (see
+        # refresh_customer_metrics) so reports never re-aggregate orders
+        print("5️⃣ Creating customer_metrics summary table...")
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS customer_metrics (
+                       customer_id INTEGER PRIMARY KEY,
+                       first_order_date DATE,
+                       last_order_date DATE,
+                       total_orders INTEGER NOT NULL DEFAULT 0,
+                       completed_orders INTEGER NOT NULL DEFAULT 0,
+                       completed_subtotal DECIMAL(12, 2) NOT NULL DEFAULT 0,
+                       completed_discount DECIMAL(12, 2) NOT NULL DEFAULT 0,
+                       completed_revenue DECIMAL(12, 2) NOT NULL DEFAULT 0
+                       )
+                ''')
+
+        # Cohort retention triangle, maintained alongside customer_metrics
+        print("6️⃣ Creating cohort retention tables...")
+        CohortRetentionStore(self.conn).create_schema()
 
         self.conn.commit()
         print("\n✅ Database schema created with indexes")
@@ -360,6 +775,9 @@ class EcommerceAnalyticsPlatform:
 
         print("\n3️⃣ Loading orders...")
         self.orders_df.to_sql('orders', self.conn, if_exists='append', index=False)
+        self._update_order_watermark(self.orders_df)
+        self.refresh_customer_metrics()
+        self.conn.commit()
         print(f"   ✅ Loaded {len(self.orders_df)} orders")
 
         # Verify
@@ -376,6 +794,238 @@ class EcommerceAnalyticsPlatform:
         print(f"    📦 {product_count} products")
         print(f"    🛒 {order_count} orders")
 
+    def bulk_load_to_database(self, batch_size=100_000):
+        """
+        High-throughput alternative to load_data_to_database
+        - WAL journal + synchronous=OFF while loading
+        - executemany in large batches inside ONE transaction
+        - secondary indexes dropped before the load and rebuilt afterwards
+        """
+        print("\n" + "="*80)
+        print("📤 PART 4: BULK LOADING DATA TO DATABASE")
+        print("="*80)
+
+        start = datetime.now()
+        tables = [
+            ('customers', self.customers_df),
+            ('products', self.products_df),
+            ('orders', self.orders_df),
+        ]
+
+        # PRAGMAs must be set outside a transaction; the previous values are
+        # restored when the load ends
+        self.conn.commit()
+        load_pragmas = {
+            'journal_mode': 'WAL',
+            'synchronous': 'OFF',
+            'temp_store': 'MEMORY',
+            'cache_size': -200000,      # ~200 MB page cache
+        }
+        previous_pragmas = {
+            name: self.conn.execute(f"PRAGMA {name}").fetchone()[0] for name in load_pragmas
+        }
+        for name, value in load_pragmas.items():
+            self.conn.execute(f"PRAGMA {name} = {value}")
+
+        # Remember secondary indexes (auto-indexes for PK/UNIQUE have no sql)
+        cursor = self.conn.cursor()
+        cursor.execute(f'''
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'index' AND sql IS NOT NULL
+              AND tbl_name IN ({', '.join('?' * len(tables))})
+        ''', [name for name, _ in tables])
+        indexes = cursor.fetchall()
+
+        try:
+            cursor.execute("BEGIN")
+
+            print(f"\n1️⃣ Dropping {len(indexes)} secondary indexes...")
+            for name, _ in indexes:
+                cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+            for step, (table, df) in enumerate(tables, start=2):
+                print(f"\n{step}️⃣ Loading {table}...")
+                placeholders = ', '.join('?' * len(df.columns))
+                sql = f"INSERT INTO {table} ({', '.join(df.columns)}) VALUES ({placeholders})"
+                for batch_start in range(0, len(df), batch_size):
+                    batch = df.iloc[batch_start:batch_start + batch_size]
+                    cursor.executemany(sql, self._dataframe_rows(batch))
+                print(f"   ✅ Loaded {len(df):,} {table}")
+
+            print(f"\n5️⃣ Rebuilding {len(indexes)} indexes...")
+            for _, index_sql in indexes:
+                cursor.execute(index_sql)
+
+            self._update_order_watermark(self.orders_df)
+            self.refresh_customer_metrics()
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            for name, value in previous_pragmas.items():
+                self.conn.execute(f"PRAGMA {name} = {value}")
+
+        elapsed = (datetime.now() - start).total_seconds()
+        total_rows = sum(len(df) for _, df in tables)
+        print(f"\n✅ Bulk load complete: {total_rows:,} rows in {elapsed:.2f}s "
+              f"({total_rows / max(elapsed, 1e-9):,.0f} rows/sec)")
+        return elapsed
+
+    def refresh_customer_metrics(self, customer_ids=None):
+        """
+        Recompute customer_metrics rows (and the cohort retention triangle)
+        from orders
+        customer_ids=None rebuilds the whole table; otherwise only the given
+        customers are re-aggregated (an index lookup each), so the cost of an
+        incremental load follows the size of the delta, not of the history.
+        first/last_order_date, completed_* only count 'Completed' orders.
+        """
+        aggregate_sql = CUSTOMER_METRICS_AGGREGATE
+
+        cursor = self.conn.cursor()
+        if customer_ids is None:
+            cursor.execute("DELETE FROM customer_metrics")
+            cursor.execute("INSERT INTO customer_metrics " + aggregate_sql.format(where=""))
+            refreshed = cursor.rowcount
+        else:
+            ids = sorted({int(c) for c in customer_ids})
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS affected_customers (customer_id INTEGER PRIMARY KEY)")
+            cursor.execute("DELETE FROM affected_customers")
+            cursor.executemany("INSERT INTO affected_customers VALUES (?)", [(c,) for c in ids])
+            # Customers whose orders all disappeared must lose their row too
+            cursor.execute('''
+                DELETE FROM customer_metrics
+                WHERE customer_id IN (SELECT customer_id FROM affected_customers)
+            ''')
+            cursor.execute("INSERT INTO customer_metrics " + aggregate_sql.format(
+                where="WHERE customer_id IN (SELECT customer_id FROM affected_customers)"
+            ))
+            refreshed = len(ids)
+
+        CohortRetentionStore(self.conn).refresh(customer_ids, rebuild=customer_ids is None)
+        return refreshed
+
+    @staticmethod
+    def _dataframe_rows(df):
+        """
+        Turn a DataFrame into tuples of plain Python values for executemany
+        (sqlite3 cannot bind NumPy scalars, and NaN must become NULL)
+        """
+        columns = []
+        for col in df.columns:
+            series = df[col]
+            if series.isna().any():
+                series = series.astype(object).where(series.notna(), None)
+            columns.append(series.tolist())
+        return zip(*columns)
+
+    def _upsert_dataframe(self, table, df, key):
+        """
+        INSERT new rows and UPDATE changed rows of df into table, keyed on key
+        Rows identical to what is already stored are left untouched
+        Returns the number of rows inserted or updated
+        """
+        if df.empty:
+            return 0
+
+        columns = list(df.columns)
+        value_columns = [c for c in columns if c != key]
+        placeholders = ', '.join('?' * len(columns))
+        updates = ', '.join(f"{c} = excluded.{c}" for c in value_columns)
+        changed = ' OR '.join(f"{table}.{c} IS NOT excluded.{c}" for c in value_columns)
+
+        sql = f'''
+            INSERT INTO {table} ({', '.join(columns)})
+            VALUES ({placeholders})
+            ON CONFLICT({key}) DO UPDATE SET {updates}
+            WHERE {changed}
+        '''
+
+        changes_before = self.conn.total_changes
+        self.conn.executemany(sql, self._dataframe_rows(df))
+        return self.conn.total_changes - changes_before
+
+    def get_order_watermark(self):
+        """Return (last_order_date, last_order_id) of the last load, or (None, None)"""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT last_order_date, last_order_id FROM load_watermark WHERE table_name = 'orders'"
+        )
+        row = cursor.fetchone()
+        return row if row else (None, None)
+
+    def _update_order_watermark(self, orders_df):
+        """Move the orders high-water mark forward to the newest loaded order"""
+        if orders_df.empty:
+            return
+
+        self.conn.execute('''
+            INSERT INTO load_watermark (table_name, last_order_date, last_order_id, loaded_at)
+            VALUES ('orders', ?, ?, ?)
+            ON CONFLICT(table_name) DO UPDATE SET
+                last_order_date = MAX(last_order_date, excluded.last_order_date),
+                last_order_id = MAX(last_order_id, excluded.last_order_id),
+                loaded_at = excluded.loaded_at
+        ''', (
+            str(orders_df['order_date'].astype(str).max()),
+            int(orders_df['order_id'].max()),
+            datetime.now().isoformat(timespec='seconds')
+        ))
+
+    def load_data_incremental(self):
+        """
+        Append-only load: upsert only new or changed rows
+        Keeps existing tables and indexes, and uses a high-water mark on
+        order_date/order_id so only the orders since the last load are sent
+        """
+        print("\n" + "="*80)
+        print("📤 PART 4: INCREMENTAL LOAD TO DATABASE")
+        print("="*80)
+
+        # Make sure the schema exists, without dropping anything
+        self.create_database_schema(drop_existing=False)
+
+        last_date, last_id = self.get_order_watermark()
+        if last_date is None:
+            print("\n    No watermark found - first load, sending all orders")
+            new_orders = self.orders_df
+        else:
+            print(f"\n    Watermark: order_date={last_date}, order_id={last_id}")
+            # Re-send the boundary day so late status changes are picked up
+            order_dates = self.orders_df['order_date'].astype(str)
+            new_orders = self.orders_df[
+                (order_dates >= str(last_date)) | (self.orders_df['order_id'] > last_id)
+            ]
+
+        try:
+            print("\n1️⃣ Upserting customers...")
+            changed = self._upsert_dataframe('customers', self.customers_df, 'customer_id')
+            print(f"   ✅ {changed} customers inserted/updated")
+
+            print("\n2️⃣ Upserting products...")
+            changed = self._upsert_dataframe('products', self.products_df, 'product_id')
+            print(f"   ✅ {changed} products inserted/updated")
+
+            print("\n3️⃣ Upserting orders...")
+            changed = self._upsert_dataframe('orders', new_orders, 'order_id')
+            print(f"   ✅ {changed} of {len(new_orders)} candidate orders inserted/updated")
+
+            self._update_order_watermark(new_orders)
+
+            print("\n4️⃣ Refreshing customer metrics...")
+            refreshed = self.refresh_customer_metrics(new_orders['customer_id'])
+            print(f"   ✅ {refreshed} customers refreshed")
+
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        last_date, last_id = self.get_order_watermark()
+        print(f"\n✅ Incremental load complete (watermark: {last_date}, order_id {last_id})")
+        return len(new_orders)
+
     # =========================================================================
     # PART 5: ADVANCED ANALYTICS
     # =========================================================================
@@ -390,20 +1040,19 @@ class EcommerceAnalyticsPlatform:
         print("="*80)
 
         query = '''
-        WITH customer_metrics AS (
+        WITH rfm_base AS (
             SELECT
                 c.customer_id,
                 c.name,
                 c.city,
                 c.customer_type,
-                MAX(o.order_date) as last_order_date,
-                julianday('now') - julianday(MAX(o.order_date)) as recency_days,
-                COUNT(o.order_id) as frequency,
-                SUM(o.total_amount) as monetary
-            FROM customers c
-            LEFT JOIN orders o ON c.customer_id = o.customer_id
-            WHERE o.status = 'Completed'
-            GROUP BY c.customer_id, c.name, c.city, c.customer_type
+                m.last_order_date,
+                julianday('now') - julianday(m.last_order_date) as recency_days,
+                m.completed_orders as frequency,
+                m.completed_revenue as monetary
+            FROM customer_metrics m
+            JOIN customers c ON c.customer_id = m.customer_id
+            WHERE m.completed_orders > 0
         )
         SELECT
             customer_id,
@@ -421,7 +1070,7 @@ class EcommerceAnalyticsPlatform:
                 WHEN recency_days > 180 THEN 'Lost'
                 ELSE 'New/Low Value'
             END as rfm_segment
-        FROM customer_metrics
+        FROM rfm_base
         ORDER BY monetary DESC;
         '''
 
@@ -450,25 +1099,16 @@ class EcommerceAnalyticsPlatform:
         print("="*80)
 
         query = '''
-        WITH customer_cohorts AS (
-            SELECT 
-                customer_id,
-                strftime('%Y-%m', MIN(order_date)) as cohort_month
-            FROM  orders
-            WHERE status = 'Completed'
-            GROUP BY customer_id
-        )
         SELECT
-            cc.cohort_month,
-            COUNT(DISTINCT cc.customer_id) as customers,
-            COUNT(o.order_id) as orders,
-            ROUND(SUM(o.total_amount), 2) as revenue,
-            ROUND(AVG(o.total_amount), 2) as avg_order_value,
-            ROUND(SUM(o.total_amount) / COUNT(DISTINCT cc.customer_id), 2) as revenue_per_customer
-        FROM customer_cohorts cc
-        JOIN orders o ON cc.customer_id = o.customer_id
-        WHERE o.status = 'Completed'
-        GROUP BY cc.cohort_month
+            strftime('%Y-%m', first_order_date) as cohort_month,
+            COUNT(*) as customers,
+            SUM(completed_orders) as orders,
+            ROUND(SUM(completed_revenue), 2) as revenue,
+            ROUND(SUM(completed_revenue) / SUM(completed_orders), 2) as avg_order_value,
+            ROUND(SUM(completed_revenue) / COUNT(*), 2) as revenue_per_customer
+        FROM customer_metrics
+        WHERE completed_orders > 0
+        GROUP BY cohort_month
         ORDER BY cohort_month;
         '''
 
@@ -477,11 +1117,21 @@ class EcommerceAnalyticsPlatform:
         print("\n📊 Cohort Performance:")
         print(cohort_df.to_string(index=False))
 
+        # Retention triangle, kept up to date by refresh_customer_metrics
+        store = CohortRetentionStore(self.conn)
+        triangle = store.triangle()
+        print("\n📉 Retention (% of cohort ordering N months after their first order):")
+        print(store.matrix('retention_rate', triangle).to_string(na_rep=''))
+
         # Save
         output_file = self.data_dir / 'cohort_analysis.csv'
         cohort_df.to_csv(output_file, index=False)
         print(f"\n✅ Cohort analysis saved to: {output_file}")
 
+        triangle_file = self.data_dir / 'cohort_retention.csv'
+        triangle.to_csv(triangle_file, index=False)
+        print(f"✅ Retention triangle saved to: {triangle_file}")
+
         return cohort_df
     
     def analyze_product_performance(self):
@@ -490,30 +1140,7 @@ class EcommerceAnalyticsPlatform:
         print("📦 PRODUCT PERFORMANCE ANALYSIS")
         print("="*80)
 
-        query = '''
-        SELECT
-            p.product_id,
-            p.product_name,
-            p.category,
-            p.price,
-            p.cost,
-            ROUND((p.price - p.cost) / p.price * 100, 2) as margin_percent,
-            COUNT(o.order_id) as times_ordered,
-            SUM(o.quantity) as units_sold,
-            ROUND(SUM(o.subtotal), 2) as gross_revenue,
-            ROUND(SUM(o.discount_amount), 2) as total_discounts,
-            ROUND(SUM(o.total_amount), 2) as net_revenue,
-            ROUND(SUM((p.price - p.cost) * o.quantity), 2) as profit,
-            ROUND(AVG(o.total_amount), 2) as avg_order_value
-        FROM products p 
-        LEFT JOIN orders o ON p.product_id = o.product_id AND o.status = 'Completed'
-        GROUP BY p.product_id, p.product_name, p.category, p.price, p.cost
-        HAVING units_sold > 0
-        ORDER BY profit DESC
-        LIMIT 20;
-        '''
-
-        product_df = pd.read_sql_query(query, self.conn)
+        product_df = pd.read_sql_query(PRODUCT_PERFORMANCE_QUERY, self.conn)
 
         print("\n🏆 Top 20 Products by Profit:")
         print(product_df[['product_name', 'category', 'units_sold', 'net_revenue', 'profit',]].to_string(index=False))
@@ -533,18 +1160,18 @@ class EcommerceAnalyticsPlatform:
 
         query = '''
         SELECT
-            COUNT(DISTINCT c.customer_id) as total_customers,
-            COUNT(DISTINCT CASE WHEN o.order_id IS NOT NULL THEN c.customer_id END) as active_customers,
-            COUNT(o.order_id) as total_orders,
-            SUM(CASE WHEN o.status = 'Completed' THEN 1 ELSE 0 END) as completed_orders,
-            ROUND(SUM(CASE WHEN o.status = 'Completed' THEN o.subtotal ELSE 0 END), 2) as gross_revenue,
-            ROUND(SUM(CASE WHEN o.status = 'Completed' THEN o.discount_amount ELSE 0 END), 2) as total_discount,
-            ROUND(SUM(CASE WHEN o.status = 'Completed' THEN o.total_amount ELSE 0 END), 2) as net_revenue,
-            ROUND(AVG(CASE WHEN o.status = 'Completed' THEN o. total_amount END), 2) as avg_order_value,
-            ROUND(SUM(CASE WHEN o.status = 'Completed' THEN o.total_amount END) /
-            COUNT(DISTINCT CASE WHEN o.status = 'Completed' THEN c.customer_id END), 2) as revenue_per_customer
+            COUNT(c.customer_id) as total_customers,
+            COUNT(CASE WHEN m.total_orders > 0 THEN 1 END) as active_customers,
+            COALESCE(SUM(m.total_orders), 0) as total_orders,
+            COALESCE(SUM(m.completed_orders), 0) as completed_orders,
+            ROUND(COALESCE(SUM(m.completed_subtotal), 0), 2) as gross_revenue,
+            ROUND(COALESCE(SUM(m.completed_discount), 0), 2) as total_discount,
+            ROUND(COALESCE(SUM(m.completed_revenue), 0), 2) as net_revenue,
+            ROUND(SUM(m.completed_revenue) / SUM(m.completed_orders), 2) as avg_order_value,
+            ROUND(SUM(m.completed_revenue) /
+            COUNT(CASE WHEN m.completed_orders > 0 THEN 1 END), 2) as revenue_per_customer
         FROM customers c
-        LEFT JOIN orders o ON c.customer_id = o.customer_id;
+        LEFT JOIN customer_metrics m ON c.customer_id = m.customer_id;
         '''
 
         summary = pd.read_sql_query(query, self.conn).iloc[0]
@@ -573,119 +1200,215 @@ class EcommerceAnalyticsPlatform:
         print("📊 GENERATING VISUALIZATIONS")
         print("="*80)
 
+        cache = ChartCache(self.charts_dir / '.chart_cache.json')
+
         # 1. Revenue by Category 
         print("\n Creating revenue by category chart...")
-        query = '''
-        SELECT
-            p.category,
-            SUM(o.total_amount) as revenue
-        FROM  products p
-        JOIN orders o ON p.product_id = o.product_id
-        WHERE o.status = 'Completed'
-        GROUP BY p.category
-        ORDER BY revenue DESC;
-        '''
-        df = pd.read_sql_query(query, self.conn)
-
-        plt.figure(figsize=(12, 6))
-        sns.barplot(data=df, x='category', y='revenue', hue='category', palette='viridis', legend=False)
-        plt.title('Revenue by Product Category', fontsize=16, fontweight='bold')
-        plt.xlabel('Category', fontsize=12)
-        plt.ylabel('Revenue (₹)', fontsize=12)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        plt.savefig(self.charts_dir / 'revenue_by_category.png', dpi=300)
-        plt.close()
-        print(f"   ✅ Saved: revenue_by_category.png")
+        df = pd.read_sql_query(CATEGORY_REVENUE_QUERY, self.conn)
+
+        if cache.render(self.charts_dir / 'revenue_by_category.png', df, _draw_revenue_by_category, dpi=300):
+            print(f"   ✅ Saved: revenue_by_category.png")
+        else:
+            print(f"   ⏭️  Up to date: revenue_by_category.png")
 
         # 2. Monthly Revenue Trend
         print("\n2️⃣ Creating monthly trend chart...")
-        query = '''
-        SELECT
-            strftime('%Y-%m', order_date) as month,
-            SUM(total_amount) as revenue,
-            COUNT(*) as orders
-        FROM orders
-        WHERE status = 'Completed'
-        GROUP BY month
-        ORDER BY month;
-        '''
-        df = pd.read_sql_query(query, self.conn)
-
-        fig, ax1 = plt.subplots(figsize=(14, 6))
+        df = pd.read_sql_query(MONTHLY_TREND_QUERY, self.conn)
 
-        ax1.plot(df['month'], df['revenue'], marker='o', linewidth=2, color='#2E86AB')
-        ax1.set_xlabel('Month', fontsize=12)
-        ax1.set_ylabel('Revenue', fontsize=12)
-        ax1.tick_params(axis='y', labelcolor='#2E86AB')
-        ax1.grid(True, alpha=0.3)
-
-        ax2 = ax1.twinx()
-        ax2.bar(df['month'], df['orders'], alpha=0.3, color='#A23B72', label='Orders')
-        ax2.set_ylabel('Number of Orders', fontsize=12, color='#A23B72')
-        ax2.tick_params(axis='y', labelcolor='#A23B72')
-
-        plt.title('Monthly Revenue and Order Trends', fontsize=16, fontweight='bold')
-        plt.xticks(rotation=45, ha='right')
-        fig.tight_layout()
-        plt.savefig(self.charts_dir / 'monthly_trend.png', dpi=300)
-        plt.close()
-        print(f"   ✅ Saved: montly_trends.png")
+        if cache.render(self.charts_dir / 'monthly_trend.png', df, _draw_monthly_trend, dpi=300):
+            print(f"   ✅ Saved: monthly_trend.png")
+        else:
+            print(f"   ⏭️  Up to date: monthly_trend.png")
 
+        cache.print_stats()
         print(f"\n ✅ All visualizations saved to: {self.charts_dir}/")
 
     # =========================================================================
     # PART 7: EXCEL REPORTING
     # =========================================================================
 
-    def generate_excel_report(self):
-        """Generate comprehensive Excel report"""
+    def generate_excel_report(self, sheets=None, parallel=True, max_workers=None):
+        """
+        Generate comprehensive Excel report
+        sheets: [(sheet name, query, to_excel options)], EXCEL_REPORT_SHEETS by default
+        parallel=True runs all sheet queries at once on separate read-only
+        connections, then writes the sheets in order
+        """
         print("\n" + "="*80)
         print("📄 GENERATING EXCEL REPORT")
         print("="*80)
 
+        sheets = sheets or EXCEL_REPORT_SHEETS
+        queries = [query for _, query, _ in sheets]
+
+        start = time.perf_counter()
+        if parallel:
+            # Workers open their own connections - make sure they see our writes
+            self.conn.commit()
+            with ThreadPoolExecutor(max_workers=max_workers or len(queries)) as pool:
+                frames = list(pool.map(_read_sheet_query, [self.db_name] * len(queries), queries))
+        else:
+            frames = [pd.read_sql_query(query, self.conn) for query in queries]
+        query_seconds = time.perf_counter() - start
+
         output_file = self.reports_dir / f'Analytics_Report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
+        print()
         with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            # Sheet 1: Executive Summary
-            print("\n1️⃣ Creating Executive Summary sheet...")
-            summary_query = '''
-            SELECT
-                'Total Customers' as Metric,
-                COUNT(DISTINCT customer_id) as Value
-            FROM customers
-            UNION ALL
-            SELECT 'Total Revenue', ROUND(SUM(CASE WHEN status = 'Completed' THEN total_amount ELSE 0 END), 2)
-            FROM orders;
-            '''
-            pd.read_sql_query(summary_query, self.conn).to_excel(
-                writer, sheet_name='Executive Summary', index=False
-            )
+            for number, ((sheet_name, _, options), df) in enumerate(zip(sheets, frames), start=1):
+                print(f"{number}. Creating {sheet_name} sheet...")
+                df.to_excel(writer, sheet_name=sheet_name, **options)
+
+        mode = "parallel" if parallel else "sequential"
+        print(f"\n⏱️  Queries: {query_seconds:.2f}s ({mode}), "
+              f"total: {time.perf_counter() - start:.2f}s")
+        print(f"✅ Excel report saved: {output_file}")
+        return output_file
+
+    # =========================================================================
+    # PART 8: INDEX ADVISOR
+    # =========================================================================
 
-            # Sheet 2: Top Customers
-            print("2️⃣ Creating Top Customers sheet...")
-            customers_query = '''
-            SELECT 
-                c.name as Customer,
-                c.city as City,
-                COUNT(o.order_id) as Orders,
-                ROUND(SUM(o.total_amount), 2) as Total_Spent
-            FROM customers c
-            JOIN orders o ON c.customer_id = o.customer_id
-            WHERE o.status = 'Completed'
-            GROUP BY c.customer_id
-            ORDER BY Total_Spent DESC
-            LIMIT 50;
-            '''
-            pd.read_sql_query(customers_query, self.conn).to_excel(
-                writer, sheet_name='Top Customers', index=False
+    def _ensure_order_month_column(self):
+        """
+        Add the generated order_month column to databases created before it
+        existed. SQLite can only ADD a VIRTUAL generated column (new schemas
+        get a STORED one); indexing it stores the value anyway.
+        """
+        cursor = self.conn.cursor()
+        columns = [row[1] for row in cursor.execute("PRAGMA table_xinfo(orders)")]
+        if columns and 'order_month' not in columns:
+            cursor.execute(
+                "ALTER TABLE orders ADD COLUMN order_month TEXT "
+                "GENERATED ALWAYS AS (strftime('%Y-%m', order_date)) VIRTUAL"
             )
+            self.conn.commit()
 
-        print(f"\n✅ Excel report saved: {output_file}")
-        return output_file
+    def apply_index_migration(self):
+        """Create the partial/covering indexes and refresh planner statistics"""
+        print("\n" + "="*80)
+        print("🔧 INDEX MIGRATION")
+        print("="*80)
+
+        self._ensure_order_month_column()
+        cursor = self.conn.cursor()
+        for name, definition in INDEX_MIGRATION:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} {definition}")
+            print(f"   ✅ {name}")
+
+        # Statistics let the planner pick the best of the available indexes
+        cursor.execute("ANALYZE")
+        self.conn.commit()
+        print(f"\n✅ {len(INDEX_MIGRATION)} indexes in place")
+
+    def explain_query_catalogue(self):
+        """
+        EXPLAIN QUERY PLAN for every query in QUERY_CATALOGUE
+        Flags queries whose plan reads the whole orders table
+        """
+        print("\n" + "="*80)
+        print("🔍 QUERY PLAN REPORT")
+        print("="*80)
+
+        cursor = self.conn.cursor()
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS affected_customers (customer_id INTEGER PRIMARY KEY)")
+
+        report = []
+        for name, query in QUERY_CATALOGUE.items():
+            plan = [row[3] for row in cursor.execute(f"EXPLAIN QUERY PLAN {query}")]
+            full_scans = [step for step in plan
+                          if step.split()[:2] in (['SCAN', 'o'], ['SCAN', 'orders'])
+                          and 'USING' not in step]
+            indexes = sorted({index for step in plan
+                              for index in re.findall(r'USING (?:COVERING )?INDEX (\w+)', step)})
+            report.append({
+                'query': name,
+                'uses_index': bool(indexes),
+                'covering': any('COVERING INDEX' in step for step in plan),
+                'full_scan_of_orders': bool(full_scans),
+                'indexes': ', '.join(indexes),
+                'plan': ' | '.join(plan),
+            })
+
+            print(f"\n{'❌ FULL SCAN' if full_scans else '✅ INDEX'}  {name}")
+            for step in plan:
+                print(f"      {step}")
+
+        report_df = pd.DataFrame(report)
+        scans = int(report_df['full_scan_of_orders'].sum())
+        print(f"\n📈 {len(report_df) - scans}/{len(report_df)} queries avoid a full scan of orders")
+
+        output_file = self.data_dir / 'query_plan_report.csv'
+        report_df.to_csv(output_file, index=False)
+        print(f"✅ Query plan report saved to: {output_file}")
+        return report_df
+
+    # =========================================================================
+    # PART 9: NON-INTERACTIVE PIPELINE RUNNER
+    # =========================================================================
+
+    def run_report_pipeline(self, stages=None, max_workers=None):
+        """
+        Run the report stages without input() pauses
+        A stage starts as soon as all of its dependencies have finished, in a
+        process pool with one read-only SQLite connection per stage, so the
+        whole set takes about as long as the slowest stage.
+        Returns {stage_name: result}
+        """
+        print("\n" + "="*80)
+        print("⚙️  REPORT PIPELINE")
+        print("="*80)
+
+        stages = stages or REPORT_STAGES
+        for name, (_, deps) in stages.items():
+            unknown = [d for d in deps if d not in stages]
+            if unknown:
+                raise ValueError(f"Stage '{name}' depends on unknown stage(s): {unknown}")
+
+        # Commit so the worker connections see everything that was loaded
+        if self.conn:
+            self.conn.commit()
+
+        results, timings = {}, {}
+        pending = dict(stages)
+        running = {}
+        pipeline_start = time.perf_counter()
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            while pending or running:
+                # Submit every stage whose dependencies are done
+                ready = [name for name, (_, deps) in pending.items()
+                         if all(d in results for d in deps)]
+                for name in ready:
+                    method_name, _ = pending.pop(name)
+                    running[pool.submit(_run_report_stage, self.db_name, method_name)] = name
+
+                if not running:
+                    raise ValueError(f"Dependency cycle between stages: {list(pending)}")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name], timings[name], log = future.result()
+                    print(log, end='')
+                    print(f"\n   ⏱️  Stage '{name}' finished in {timings[name]:.2f}s")
+
+        total = time.perf_counter() - pipeline_start
+        print("\n" + "="*80)
+        print("⏱️  PIPELINE STAGE TIMINGS")
+        print("="*80)
+        for name, seconds in sorted(timings.items(), key=lambda item: -item[1]):
+            print(f"    {name:12s}: {seconds:6.2f}s")
+        print(f"\n    Wall time:    {total:6.2f}s  (sum of stages: {sum(timings.values()):.2f}s)")
+
+        return results
     
 
-def main():
-    """Main Execution"""
+def main(interactive=True):
+    """
+    Main Execution
+    interactive=False (python Ecommerce_analytics_platform.py --batch) skips
+    the prompts and runs all reports through the parallel pipeline runner
+    """
 
     # Initialize platform
     platform = EcommerceAnalyticsPlatform()
@@ -705,27 +1428,32 @@ def main():
 
         # Part 4: Load data
         platform.load_data_to_database()
+        platform.apply_index_migration()
 
-        # Part 5: Analytics
-        input("\nPress Enter to perform RFM analysis...")
-        platform.perform_rfm_analysis()
+        if not interactive:
+            # Parts 5-7 in parallel
+            platform.run_report_pipeline()
+        else:
+            # Part 5: Analytics
+            input("\nPress Enter to perform RFM analysis...")
+            platform.perform_rfm_analysis()
 
-        input("\nPress Enter to perform cohort analysis...")
-        platform.analyze_cohorts()
+            input("\nPress Enter to perform cohort analysis...")
+            platform.analyze_cohorts()
 
-        input("\nPress Enter to analyze product performance...")
-        platform.analyze_product_performance()
+            input("\nPress Enter to analyze product performance...")
+            platform.analyze_product_performance()
 
-        input("\nPress Enter to view executive summary...")
-        platform.generate_executive_summary()
+            input("\nPress Enter to view executive summary...")
+            platform.generate_executive_summary()
 
-        # Part 6: Visualizations
-        input("\nPress Enter to generate visualizations...")
-        platform.create_visualizations()
+            # Part 6: Visualizations
+            input("\nPress Enter to generate visualizations...")
+            platform.create_visualizations()
 
-        # Part 7: Excel Report
-        input("\nPress Enter to generate Excel report...")
-        platform.generate_excel_report()
+            # Part 7: Excel Report
+            input("\nPress Enter to generate Excel report...")
+            platform.generate_excel_report()
 
         # Success
         print("\n" + "="*80)
@@ -744,4 +1472,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(interactive='--batch' not in sys.argv)
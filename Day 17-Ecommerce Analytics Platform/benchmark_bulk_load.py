@@ -0,0 +1,102 @@
+"""
+BENCHMARK: SQLite bulk loader vs. the original loading path
+
+Loads the same 1M generated orders twice into a fresh database:
+- Day 17: load_data_to_database (pandas to_sql)  vs. bulk_load_to_database
+- Day 15: plain executemany + commit             vs. bulk_insert
+
+Usage:
+    python benchmark_bulk_load.py [n_orders]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent / 'DAY 15-SQL Basics'))
+
+from Ecommerce_analytics_platform import EcommerceAnalyticsPlatform
+from sales_database_analyzer import SalesDatabaseAnalyzer
+
+
+def benchmark_platform(orders_source, db_path, use_bulk):
+    """Load the generated data into a fresh platform database, return seconds"""
+    platform = EcommerceAnalyticsPlatform(db_name=str(db_path))
+    platform.connect_database()
+    platform.customers_df = orders_source.customers_df
+    platform.products_df = orders_source.products_df
+    platform.orders_df = orders_source.orders_df
+    platform.create_database_schema()
+
+    start = time.perf_counter()
+    if use_bulk:
+        platform.bulk_load_to_database()
+    else:
+        platform.load_data_to_database()
+    elapsed = time.perf_counter() - start
+
+    platform.close_database()
+    return elapsed
+
+
+def benchmark_day15(order_rows, db_path, use_bulk):
+    """Load orders into a fresh Day 15 database, return seconds"""
+    analyzer = SalesDatabaseAnalyzer(str(db_path))
+    analyzer.create_tables()
+
+    start = time.perf_counter()
+    if use_bulk:
+        analyzer.bulk_insert('orders', order_rows)
+    else:
+        analyzer.cursor.executemany('''
+            INSERT OR IGNORE INTO orders
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', order_rows)
+        analyzer.conn.commit()
+    elapsed = time.perf_counter() - start
+
+    analyzer.close()
+    return elapsed
+
+
+def main():
+    n_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        os.chdir(tmp)   # platform creates its output folders in the cwd
+
+        source = EcommerceAnalyticsPlatform(db_name=str(tmp / 'unused.db'))
+        source.generate_sample_data_vectorized(n_customers=10_000, n_products=500,
+                                               n_orders=n_orders)
+
+        results = {}
+        results['Day 17 to_sql (current)'] = benchmark_platform(source, tmp / 'a.db', False)
+        results['Day 17 bulk_load_to_database'] = benchmark_platform(source, tmp / 'b.db', True)
+
+        day15_rows = list(zip(
+            source.orders_df['order_id'].tolist(),
+            source.orders_df['customer_id'].tolist(),
+            source.orders_df['product_id'].tolist(),
+            source.orders_df['quantity'].tolist(),
+            source.orders_df['order_date'].tolist(),
+            source.orders_df['total_amount'].tolist(),
+            source.orders_df['status'].tolist(),
+        ))
+        results['Day 15 executemany (current)'] = benchmark_day15(day15_rows, tmp / 'c.db', False)
+        results['Day 15 bulk_insert'] = benchmark_day15(day15_rows, tmp / 'd.db', True)
+
+        os.chdir(HERE)
+
+    print("\n" + "="*80)
+    print(f"⏱️  BULK LOAD BENCHMARK ({n_orders:,} orders)")
+    print("="*80)
+    for name, seconds in results.items():
+        print(f"    {name:32s}: {seconds:7.2f}s  ({n_orders / seconds:>12,.0f} orders/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+BENCHMARK: parallel vs. sequential multi-sheet Excel reports
+
+Builds 1M-order databases, then times each report builder with its sheet
+queries run one after another (parallel=False, the original behaviour) and
+all at once on separate read-only connections (parallel=True):
+- Day 17: generate_excel_report
+- Day 16: create_advanced_report_with_charts
+- Day 16: build_report over the 5 sales summary sheets
+
+Usage:
+    python benchmark_excel_report.py [n_orders]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent / 'DAY 15-SQL Basics'))
+sys.path.insert(0, str(HERE.parent / 'DAY 16-Advanced SQL'))
+
+from Ecommerce_analytics_platform import EcommerceAnalyticsPlatform
+from sales_database_analyzer import SalesDatabaseAnalyzer
+from excel_automation import ExcelReportGenerator, SUMMARY_SHEETS
+
+
+def timed(function, *args, **kwargs):
+    """Run function, return seconds"""
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    n_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    summary_report = [(name, query, {'styled': True}) for name, query in SUMMARY_SHEETS]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        os.chdir(tmp)   # platform creates its output folders in the cwd
+
+        # Day 17 database
+        platform = EcommerceAnalyticsPlatform(db_name=str(tmp / 'platform.db'))
+        platform.connect_database()
+        platform.generate_sample_data_vectorized(n_customers=10_000, n_products=500,
+                                                 n_orders=n_orders)
+        platform.create_database_schema()
+        platform.bulk_load_to_database()
+
+        # Day 15/16 database
+        analyzer = SalesDatabaseAnalyzer(str(tmp / 'sales.db'))
+        analyzer.create_tables()
+        analyzer.populate_sample_data(n_customers=10_000, n_orders=n_orders)
+        analyzer.close()
+        generator = ExcelReportGenerator(str(tmp / 'sales.db'))
+
+        results = {}
+        for parallel in (False, True):
+            mode = 'parallel' if parallel else 'sequential'
+            results[f'Day 17 Excel report ({mode})'] = timed(
+                platform.generate_excel_report, parallel=parallel)
+            results[f'Day 16 advanced report ({mode})'] = timed(
+                generator.create_advanced_report_with_charts,
+                str(tmp / f'advanced_{mode}.xlsx'), parallel=parallel)
+            results[f'Day 16 summary sheets ({mode})'] = timed(
+                generator.build_report, summary_report,
+                str(tmp / f'summary_{mode}.xlsx'), parallel=parallel)
+
+        generator.close()
+        platform.close_database()
+        os.chdir(HERE)
+
+    print("\n" + "="*80)
+    print(f"⏱️  EXCEL REPORT BENCHMARK ({n_orders:,} orders)")
+    print("="*80)
+    for name, seconds in results.items():
+        print(f"    {name:40s}: {seconds:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,17 +9,42 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import sys
+import time
+
+from chart_cache import ChartCache
 
 # Set style
 sns.set_style('whitegrid')
 sns.set_palette('husl')
 
+# Base prices
+PRODUCT_PRICES = {
+    'Laptop': 1200,
+    'Mouse': 25,
+    'Keyboard': 75,
+    'Monitor': 300,
+    'Headphones': 150
+}
+
+REGIONS = ['North', 'South', 'East', 'West']
+
 class SalesDashboard:
     """Professional sales analytics dashboard"""
     
-    def __init__(self):
-        """Initialize dashboard with sample data"""
-        self.data = self.generate_sample_data()
+    def __init__(self, n_days=None, orders_per_day=(5, 15)):
+        """
+        Initialize dashboard with sample data
+        n_days: use the vectorized generator for that many days (load testing)
+        """
+        if n_days is None:
+            self.data = self.generate_sample_data()
+        else:
+            self.data = self.generate_sample_data_vectorized(n_days, *orders_per_day)
+        self.aggregates = None
+        self.chart_cache = ChartCache()
         
     def generate_sample_data(self):
         """Generate realistic sales data"""
@@ -29,10 +54,10 @@ class SalesDashboard:
         dates = pd.date_range(end=datetime.now(), periods=180, freq='D')
         
         # Products
-        products = ['Laptop', 'Mouse', 'Keyboard', 'Monitor', 'Headphones']
+        products = list(PRODUCT_PRICES)
         
         # Regions
-        regions = ['North', 'South', 'East', 'West']
+        regions = REGIONS
         
         # Generate data
         data = []
@@ -41,16 +66,7 @@ class SalesDashboard:
                 region = np.random.choice(regions)
                 quantity = np.random.randint(1, 10)
                 
-                # Base prices
-                prices = {
-                    'Laptop': 1200,
-                    'Mouse': 25,
-                    'Keyboard': 75,
-                    'Monitor': 300,
-                    'Headphones': 150
-                }
-                
-                price = prices[product]
+                price = PRODUCT_PRICES[product]
                 revenue = price * quantity
                 
                 data.append({
@@ -71,6 +87,53 @@ class SalesDashboard:
         
         return df
     
+    def generate_sample_data_vectorized(self, n_days=180, min_orders=5, max_orders=15, seed=42):
+        """
+        Vectorized version of generate_sample_data for load testing
+        Orders per day, products, regions and quantities are drawn as arrays
+        and prices are looked up through the product codes, so years of data
+        with millions of rows take seconds. Same columns as generate_sample_data.
+        """
+        rng = np.random.default_rng(seed)
+        
+        dates = pd.date_range(end=datetime.now(), periods=n_days, freq='D')
+        
+        # Sorted categories -> groupby output in the same order as plain strings
+        products = np.array(sorted(PRODUCT_PRICES))
+        prices = np.array([PRODUCT_PRICES[p] for p in products])
+        regions = np.array(sorted(REGIONS))
+        
+        # Orders per day, then one array entry per order
+        orders_per_day = rng.integers(min_orders, max_orders, size=n_days)
+        n_orders = int(orders_per_day.sum())
+        
+        product_codes = rng.integers(0, len(products), size=n_orders)
+        region_codes = rng.integers(0, len(regions), size=n_orders)
+        quantity = rng.integers(1, 10, size=n_orders)
+        price = prices[product_codes]
+        
+        def per_order(day_values):
+            """Repeat one value per day for each order of that day (as a category)"""
+            categorical = pd.Categorical(day_values)
+            return pd.Categorical.from_codes(np.repeat(categorical.codes, orders_per_day),
+                                             categories=categorical.categories)
+        
+        df = pd.DataFrame({
+            'Date': np.repeat(dates.values, orders_per_day),
+            'Product': pd.Categorical.from_codes(product_codes, categories=products),
+            'Region': pd.Categorical.from_codes(region_codes, categories=regions),
+            'Quantity': quantity,
+            'Price': price,
+            'Revenue': price * quantity
+        })
+        
+        # Calculated columns: computed once per day, not once per row
+        df['Month'] = per_order(dates.month_name())
+        df['Week'] = np.repeat(dates.isocalendar().week.to_numpy(), orders_per_day)
+        df['Weekday'] = per_order(dates.day_name())
+        
+        return df
+    
     def overview_stats(self):
         """Print key metrics"""
         print("=" * 60)
@@ -87,277 +150,162 @@ class SalesDashboard:
         print(f"💵 Average Order Value: ${avg_order_value:,.2f}")
         print(f"🛒 Total Items Sold: {total_items_sold:,}")
         
+        aggregates = self.get_aggregates()
+        
         # Top product
-        top_product = self.data.groupby('Product')['Revenue'].sum().idxmax()
-        top_revenue = self.data.groupby('Product')['Revenue'].sum().max()
+        top_product = aggregates['product_revenue'].idxmax()
+        top_revenue = aggregates['product_revenue'].max()
         
         print(f"\n🏆 Top Product: {top_product} (${top_revenue:,.2f})")
         
         # Top region
-        top_region = self.data.groupby('Region')['Revenue'].sum().idxmax()
-        region_revenue = self.data.groupby('Region')['Revenue'].sum().max()
+        top_region = aggregates['regional'].idxmax()
+        region_revenue = aggregates['regional'].max()
         
         print(f"🌍 Top Region: {top_region} (${region_revenue:,.2f})")
         print("=" * 60)
     
-    def create_revenue_trend(self):
-        """Chart 1: Monthly revenue trend"""
-        # Aggregate by month
-        monthly = self.data.groupby(self.data['Date'].dt.to_period('M'))['Revenue'].sum()
-        
-        plt.figure(figsize=(12, 5))
-        
-        # Convert Period to string for plotting
-        months = [str(m) for m in monthly.index]
-        
-        plt.plot(months, monthly.values, marker='o', linewidth=2.5, 
-                color='#2E86AB', markersize=8)
-        
-        plt.title('Monthly Revenue Trend', fontsize=16, fontweight='bold', pad=20)
-        plt.xlabel('Month', fontsize=12)
-        plt.ylabel('Revenue ($)', fontsize=12)
-        plt.grid(True, alpha=0.3, linestyle='--')
-        plt.xticks(rotation=45)
-        
-        # Add value labels on points
-        for i, (x, y) in enumerate(zip(months, monthly.values)):
-            if i % 2 == 0:  # Label every other point to avoid clutter
-                plt.text(x, y, f'${y/1000:.0f}K', 
-                        ha='center', va='bottom', fontsize=9)
+    def compute_aggregates(self):
+        """
+        Compute every aggregate the charts need ONCE (one groupby per key)
+        Returns a dict of small Series/DataFrames that is shared by all
+        charts and cheap to send to worker processes
+        """
+        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         
-        plt.tight_layout()
-        plt.savefig('chart1_revenue_trend.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        by_product = self.data.groupby('Product').agg(
+            Revenue=('Revenue', 'sum'),
+            Price=('Price', 'mean'),
+            Quantity=('Quantity', 'sum')
+        )
         
-        print("✅ Chart 1 saved: chart1_revenue_trend.png")
+        self.aggregates = {
+            'monthly': self.data.groupby(self.data['Date'].dt.to_period('M'))['Revenue'].sum(),
+            'product_revenue': by_product['Revenue'],
+            'regional': self.data.groupby('Region')['Revenue'].sum(),
+            'weekday': self.data.groupby('Weekday')['Revenue'].sum().reindex(day_order),
+            'heatmap': self.data.pivot_table(
+                values='Quantity',
+                index='Product',
+                columns='Region',
+                aggfunc='sum'
+            ),
+            'product_price_quantity': by_product[['Price', 'Quantity']].reset_index(),
+        }
+        return self.aggregates
+    
+    def get_aggregates(self):
+        """Shared aggregates (computed on first use; call compute_aggregates() after changing self.data)"""
+        if self.aggregates is None:
+            self.compute_aggregates()
+        return self.aggregates
+    
+    def _save_chart(self, name, number):
+        """
+        Draw one chart, save it at dpi=300 and show it
+        If the saved file is up to date, it is shown instead of redrawn
+        """
+        filename, draw, _ = CHARTS[name]
+        path = f'{filename}.png'
+        inputs = chart_inputs(name, self.get_aggregates())
+        
+        if self.chart_cache.render(path, inputs, draw, show=True, dpi=300, bbox_inches='tight'):
+            print(f"✅ Chart {number} saved: {path}")
+        else:
+            print(f"⏭️  Chart {number} up to date: {path}")
+    
+    def create_revenue_trend(self):
+        """Chart 1: Monthly revenue trend"""
+        self._save_chart('revenue_trend', 1)
     
     def create_product_comparison(self):
         """Chart 2: Product revenue comparison"""
-        product_revenue = self.data.groupby('Product')['Revenue'].sum().sort_values(ascending=True)
-        
-        plt.figure(figsize=(10, 6))
-        
-        colors = plt.cm.viridis(np.linspace(0.3, 0.9, len(product_revenue)))
-        
-        bars = plt.barh(product_revenue.index, product_revenue.values, color=colors)
-        
-        plt.title('Total Revenue by Product', fontsize=16, fontweight='bold', pad=20)
-        plt.xlabel('Revenue ($)', fontsize=12)
-        plt.ylabel('Product', fontsize=12)
-        plt.grid(axis='x', alpha=0.3, linestyle='--')
-        
-        # Add value labels
-        for bar in bars:
-            width = bar.get_width()
-            plt.text(width, bar.get_y() + bar.get_height()/2,
-                    f'${width/1000:.0f}K',
-                    ha='left', va='center', fontsize=10, fontweight='bold')
-        
-        plt.tight_layout()
-        plt.savefig('chart2_product_comparison.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        print("✅ Chart 2 saved: chart2_product_comparison.png")
+        self._save_chart('product_comparison', 2)
     
     def create_regional_performance(self):
         """Chart 3: Regional sales performance"""
-        regional = self.data.groupby('Region')['Revenue'].sum()
-        
-        plt.figure(figsize=(8, 8))
-        
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
-        explode = (0.05, 0.05, 0.05, 0.05)
-        
-        wedges, texts, autotexts = plt.pie(regional.values, 
-                                           labels=regional.index,
-                                           autopct='%1.1f%%',
-                                           colors=colors,
-                                           explode=explode,
-                                           shadow=True,
-                                           startangle=90)
-        
-        # Style percentage text
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-            autotext.set_fontsize(11)
-        
-        # Style labels
-        for text in texts:
-            text.set_fontsize(12)
-            text.set_fontweight('bold')
-        
-        plt.title('Revenue Distribution by Region', fontsize=16, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        plt.savefig('chart3_regional_performance.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        print("✅ Chart 3 saved: chart3_regional_performance.png")
+        self._save_chart('regional_performance', 3)
     
     def create_weekday_analysis(self):
         """Chart 4: Sales by day of week"""
-        # Order days properly
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
-        weekday_sales = self.data.groupby('Weekday')['Revenue'].sum()
-        weekday_sales = weekday_sales.reindex(day_order)
-        
-        plt.figure(figsize=(12, 6))
-        
-        bars = plt.bar(weekday_sales.index, weekday_sales.values, 
-                      color='skyblue', edgecolor='navy', linewidth=1.5)
-        
-        # Highlight weekend
-        bars[5].set_color('lightcoral')
-        bars[6].set_color('lightcoral')
-        
-        plt.title('Sales Performance by Day of Week', fontsize=16, fontweight='bold', pad=20)
-        plt.xlabel('Day', fontsize=12)
-        plt.ylabel('Revenue ($)', fontsize=12)
-        plt.xticks(rotation=45)
-        plt.grid(axis='y', alpha=0.3, linestyle='--')
-        
-        # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2, height,
-                    f'${height/1000:.0f}K',
-                    ha='center', va='bottom', fontsize=9)
-        
-        plt.tight_layout()
-        plt.savefig('chart4_weekday_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        print("✅ Chart 4 saved: chart4_weekday_analysis.png")
+        self._save_chart('weekday_analysis', 4)
     
     def create_product_quantity_heatmap(self):
         """Chart 5: Product sales by region (heatmap)"""
-        # Pivot table: Product vs Region
-        heatmap_data = self.data.pivot_table(
-            values='Quantity',
-            index='Product',
-            columns='Region',
-            aggfunc='sum'
-        )
-        
-        plt.figure(figsize=(10, 6))
-        
-        sns.heatmap(heatmap_data, annot=True, fmt='.0f', cmap='YlOrRd',
-                   linewidths=0.5, cbar_kws={'label': 'Total Quantity'})
-        
-        plt.title('Product Sales Quantity by Region', fontsize=16, fontweight='bold', pad=20)
-        plt.xlabel('Region', fontsize=12)
-        plt.ylabel('Product', fontsize=12)
-        
-        plt.tight_layout()
-        plt.savefig('chart5_product_region_heatmap.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        print("✅ Chart 5 saved: chart5_product_region_heatmap.png")
+        self._save_chart('product_region_heatmap', 5)
     
     def create_price_quantity_scatter(self):
         """Chart 6: Price vs Quantity relationship"""
-        # Aggregate by product
-        product_data = self.data.groupby('Product').agg({
-            'Price': 'mean',
-            'Quantity': 'sum'
-        }).reset_index()
-        
-        plt.figure(figsize=(10, 6))
-        
-        scatter = plt.scatter(product_data['Price'], 
-                            product_data['Quantity'],
-                            s=500, alpha=0.6, c=range(len(product_data)),
-                            cmap='viridis', edgecolors='black', linewidth=2)
-        
-        # Add product labels
-        for idx, row in product_data.iterrows():
-            plt.annotate(row['Product'], 
-                        (row['Price'], row['Quantity']),
-                        fontsize=11, fontweight='bold',
-                        ha='center', va='center')
-        
-        plt.title('Price vs Total Quantity Sold', fontsize=16, fontweight='bold', pad=20)
-        plt.xlabel('Average Price ($)', fontsize=12)
-        plt.ylabel('Total Quantity Sold', fontsize=12)
-        plt.grid(True, alpha=0.3, linestyle='--')
-        
-        plt.tight_layout()
-        plt.savefig('chart6_price_quantity_scatter.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        print("✅ Chart 6 saved: chart6_price_quantity_scatter.png")
+        self._save_chart('price_quantity_scatter', 6)
     
     def create_comprehensive_dashboard(self):
         """Chart 7: All-in-one dashboard (subplots)"""
-        fig = plt.figure(figsize=(16, 10))
-        
-        # Layout: 2x3 grid
-        gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
-        
-        # 1. Monthly trend
-        ax1 = fig.add_subplot(gs[0, :2])
-        monthly = self.data.groupby(self.data['Date'].dt.to_period('M'))['Revenue'].sum()
-        months = [str(m) for m in monthly.index]
-        ax1.plot(months, monthly.values, marker='o', linewidth=2, color='#2E86AB')
-        ax1.set_title('Monthly Revenue Trend', fontweight='bold')
-        ax1.grid(True, alpha=0.3)
-        ax1.tick_params(axis='x', rotation=45)
-        
-        # 2. Product comparison
-        ax2 = fig.add_subplot(gs[0, 2])
-        product_rev = self.data.groupby('Product')['Revenue'].sum().sort_values()
-        ax2.barh(product_rev.index, product_rev.values, color='skyblue')
-        ax2.set_title('Product Revenue', fontweight='bold')
-        ax2.set_xlabel('Revenue ($)')
-        
-        # 3. Regional pie
-        ax3 = fig.add_subplot(gs[1, 0])
-        regional = self.data.groupby('Region')['Revenue'].sum()
-        ax3.pie(regional.values, labels=regional.index, autopct='%1.1f%%')
-        ax3.set_title('Regional Distribution', fontweight='bold')
-        
-        # 4. Weekday bars
-        ax4 = fig.add_subplot(gs[1, 1])
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        weekday = self.data.groupby('Weekday')['Revenue'].sum().reindex(day_order)
-        ax4.bar(range(len(weekday)), weekday.values, color='lightcoral')
-        ax4.set_xticks(range(len(weekday)))
-        ax4.set_xticklabels(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
-        ax4.set_title('Weekday Sales', fontweight='bold')
-        ax4.grid(axis='y', alpha=0.3)
-        
-        # 5. Top products table
-        ax5 = fig.add_subplot(gs[1, 2])
-        ax5.axis('off')
-        top_products = self.data.groupby('Product')['Revenue'].sum().sort_values(ascending=False).head(5)
-        table_data = [[f"${v/1000:.1f}K"] for v in top_products.values]
-        table = ax5.table(cellText=table_data,
-                         rowLabels=top_products.index,
-                         colLabels=['Revenue'],
-                         cellLoc='center',
-                         loc='center')
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1, 2)
-        ax5.set_title('Top 5 Products', fontweight='bold', pad=20)
-        
-        fig.suptitle('📊 COMPLETE SALES ANALYTICS DASHBOARD', 
-                    fontsize=18, fontweight='bold', y=0.98)
-        
-        plt.savefig('chart7_comprehensive_dashboard.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        print("✅ Chart 7 saved: chart7_comprehensive_dashboard.png")
-    
-    def run_complete_analysis(self):
-        """Generate all visualizations"""
+        self._save_chart('comprehensive_dashboard', 7)
+    
+    def render_charts_batch(self, output_dir='.', dpi=300, fmt='png', preview=False,
+                            preview_dpi=72, charts=None, max_workers=None):
+        """
+        Headless batch rendering: no plt.show(), charts drawn in parallel
+        Aggregates are computed once here and shared with every worker process.
+        dpi / fmt: resolution and file format (png, pdf, svg, ...)
+        preview=True: quick low-resolution refresh (preview_dpi) saved in
+        output_dir/preview so the full-resolution files are left alone
+        Charts whose aggregates and settings did not change are skipped
+        Returns the list of files written
+        """
+        print("\n🖨️  BATCH RENDERING CHARTS" + (" (preview)" if preview else ""))
+        print("-" * 60)
+        
+        start = time.perf_counter()
+        aggregates = self.get_aggregates()
+        
+        output_dir = Path(output_dir)
+        if preview:
+            output_dir = output_dir / 'preview'
+            dpi = preview_dpi
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        names = []
+        for name in charts or list(CHARTS):
+            filename, draw, _ = CHARTS[name]
+            path = output_dir / f'{filename}.{fmt}'
+            inputs = chart_inputs(name, aggregates)
+            if self.chart_cache.needs_render(path, inputs, {'dpi': dpi, 'fmt': fmt}, draw):
+                names.append(name)
+            else:
+                print(f"⏭️  Up to date: {path}")
+        
+        files = []
+        if names:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(_render_chart, name, chart_inputs(name, aggregates),
+                                output_dir / f'{CHARTS[name][0]}.{fmt}', dpi)
+                    for name in names
+                ]
+                for future in futures:
+                    path, seconds = future.result()
+                    self.chart_cache.saved(path)
+                    files.append(path)
+                    print(f"✅ {path} ({seconds:.2f}s)")
+        
+        print(f"\n⏱️  {len(files)} charts at {dpi} dpi in {time.perf_counter() - start:.2f}s")
+        self.chart_cache.print_stats()
+        return files
+    
+    def run_complete_analysis(self, batch=False, **render_options):
+        """
+        Generate all visualizations
+        batch=True renders headless in parallel (see render_charts_batch)
+        """
         print("\n🚀 GENERATING COMPLETE SALES DASHBOARD...\n")
         
         # Show stats
         self.overview_stats()
         
+        if batch:
+            return self.render_charts_batch(**render_options)
+        
         print("\n📈 Creating visualizations...\n")
         
         # Create all charts
@@ -369,6 +317,8 @@ class SalesDashboard:
         self.create_price_quantity_scatter()
         self.create_comprehensive_dashboard()
         
+        self.chart_cache.print_stats()
+        
         print("\n" + "=" * 60)
         print("✅ ALL VISUALIZATIONS CREATED SUCCESSFULLY!")
         print("=" * 60)
@@ -383,8 +333,267 @@ class SalesDashboard:
         print("\n💡 These charts are ready for presentations!")
 
 
+# =============================================================================
+# CHART DRAWING
+# Each function draws one chart from the shared aggregates and returns the
+# figure - used by the interactive chart methods and by the batch renderer
+# =============================================================================
+
+def draw_revenue_trend(agg):
+    """Chart 1: Monthly revenue trend"""
+    monthly = agg['monthly']
+    
+    fig = plt.figure(figsize=(12, 5))
+    
+    # Convert Period to string for plotting
+    months = [str(m) for m in monthly.index]
+    
+    plt.plot(months, monthly.values, marker='o', linewidth=2.5, 
+            color='#2E86AB', markersize=8)
+    
+    plt.title('Monthly Revenue Trend', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Month', fontsize=12)
+    plt.ylabel('Revenue ($)', fontsize=12)
+    plt.grid(True, alpha=0.3, linestyle='--')
+    plt.xticks(rotation=45)
+    
+    # Add value labels on points
+    for i, (x, y) in enumerate(zip(months, monthly.values)):
+        if i % 2 == 0:  # Label every other point to avoid clutter
+            plt.text(x, y, f'${y/1000:.0f}K', 
+                    ha='center', va='bottom', fontsize=9)
+    
+    plt.tight_layout()
+    return fig
+
+def draw_product_comparison(agg):
+    """Chart 2: Product revenue comparison"""
+    product_revenue = agg['product_revenue'].sort_values(ascending=True)
+    
+    fig = plt.figure(figsize=(10, 6))
+    
+    colors = plt.cm.viridis(np.linspace(0.3, 0.9, len(product_revenue)))
+    
+    bars = plt.barh(product_revenue.index, product_revenue.values, color=colors)
+    
+    plt.title('Total Revenue by Product', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Revenue ($)', fontsize=12)
+    plt.ylabel('Product', fontsize=12)
+    plt.grid(axis='x', alpha=0.3, linestyle='--')
+    
+    # Add value labels
+    for bar in bars:
+        width = bar.get_width()
+        plt.text(width, bar.get_y() + bar.get_height()/2,
+                f'${width/1000:.0f}K',
+                ha='left', va='center', fontsize=10, fontweight='bold')
+    
+    plt.tight_layout()
+    return fig
+
+def draw_regional_performance(agg):
+    """Chart 3: Regional sales performance"""
+    regional = agg['regional']
+    
+    fig = plt.figure(figsize=(8, 8))
+    
+    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
+    explode = (0.05, 0.05, 0.05, 0.05)
+    
+    wedges, texts, autotexts = plt.pie(regional.values, 
+                                       labels=regional.index,
+                                       autopct='%1.1f%%',
+                                       colors=colors,
+                                       explode=explode,
+                                       shadow=True,
+                                       startangle=90)
+    
+    # Style percentage text
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+        autotext.set_fontsize(11)
+    
+    # Style labels
+    for text in texts:
+        text.set_fontsize(12)
+        text.set_fontweight('bold')
+    
+    plt.title('Revenue Distribution by Region', fontsize=16, fontweight='bold', pad=20)
+    
+    plt.tight_layout()
+    return fig
+
+def draw_weekday_analysis(agg):
+    """Chart 4: Sales by day of week"""
+    weekday_sales = agg['weekday']
+    
+    fig = plt.figure(figsize=(12, 6))
+    
+    bars = plt.bar(weekday_sales.index, weekday_sales.values, 
+                  color='skyblue', edgecolor='navy', linewidth=1.5)
+    
+    # Highlight weekend
+    bars[5].set_color('lightcoral')
+    bars[6].set_color('lightcoral')
+    
+    plt.title('Sales Performance by Day of Week', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Day', fontsize=12)
+    plt.ylabel('Revenue ($)', fontsize=12)
+    plt.xticks(rotation=45)
+    plt.grid(axis='y', alpha=0.3, linestyle='--')
+    
+    # Add value labels
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2, height,
+                f'${height/1000:.0f}K',
+                ha='center', va='bottom', fontsize=9)
+    
+    plt.tight_layout()
+    return fig
+
+def draw_product_quantity_heatmap(agg):
+    """Chart 5: Product sales by region (heatmap)"""
+    fig = plt.figure(figsize=(10, 6))
+    
+    sns.heatmap(agg['heatmap'], annot=True, fmt='.0f', cmap='YlOrRd',
+               linewidths=0.5, cbar_kws={'label': 'Total Quantity'})
+    
+    plt.title('Product Sales Quantity by Region', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Region', fontsize=12)
+    plt.ylabel('Product', fontsize=12)
+    
+    plt.tight_layout()
+    return fig
+
+def draw_price_quantity_scatter(agg):
+    """Chart 6: Price vs Quantity relationship"""
+    product_data = agg['product_price_quantity']
+    
+    fig = plt.figure(figsize=(10, 6))
+    
+    scatter = plt.scatter(product_data['Price'], 
+                        product_data['Quantity'],
+                        s=500, alpha=0.6, c=range(len(product_data)),
+                        cmap='viridis', edgecolors='black', linewidth=2)
+    
+    # Add product labels
+    for idx, row in product_data.iterrows():
+        plt.annotate(row['Product'], 
+                    (row['Price'], row['Quantity']),
+                    fontsize=11, fontweight='bold',
+                    ha='center', va='center')
+    
+    plt.title('Price vs Total Quantity Sold', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Average Price ($)', fontsize=12)
+    plt.ylabel('Total Quantity Sold', fontsize=12)
+    plt.grid(True, alpha=0.3, linestyle='--')
+    
+    plt.tight_layout()
+    return fig
+
+def draw_comprehensive_dashboard(agg):
+    """Chart 7: All-in-one dashboard (subplots)"""
+    fig = plt.figure(figsize=(16, 10))
+    
+    # Layout: 2x3 grid
+    gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
+    
+    # 1. Monthly trend
+    ax1 = fig.add_subplot(gs[0, :2])
+    monthly = agg['monthly']
+    months = [str(m) for m in monthly.index]
+    ax1.plot(months, monthly.values, marker='o', linewidth=2, color='#2E86AB')
+    ax1.set_title('Monthly Revenue Trend', fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    ax1.tick_params(axis='x', rotation=45)
+    
+    # 2. Product comparison
+    ax2 = fig.add_subplot(gs[0, 2])
+    product_rev = agg['product_revenue'].sort_values()
+    ax2.barh(product_rev.index, product_rev.values, color='skyblue')
+    ax2.set_title('Product Revenue', fontweight='bold')
+    ax2.set_xlabel('Revenue ($)')
+    
+    # 3. Regional pie
+    ax3 = fig.add_subplot(gs[1, 0])
+    regional = agg['regional']
+    ax3.pie(regional.values, labels=regional.index, autopct='%1.1f%%')
+    ax3.set_title('Regional Distribution', fontweight='bold')
+    
+    # 4. Weekday bars
+    ax4 = fig.add_subplot(gs[1, 1])
+    weekday = agg['weekday']
+    ax4.bar(range(len(weekday)), weekday.values, color='lightcoral')
+    ax4.set_xticks(range(len(weekday)))
+    ax4.set_xticklabels(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
+    ax4.set_title('Weekday Sales', fontweight='bold')
+    ax4.grid(axis='y', alpha=0.3)
+    
+    # 5. Top products table
+    ax5 = fig.add_subplot(gs[1, 2])
+    ax5.axis('off')
+    top_products = agg['product_revenue'].sort_values(ascending=False).head(5)
+    table_data = [[f"${v/1000:.1f}K"] for v in top_products.values]
+    table = ax5.table(cellText=table_data,
+                     rowLabels=top_products.index,
+                     colLabels=['Revenue'],
+                     cellLoc='center',
+                     loc='center')
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1, 2)
+    ax5.set_title('Top 5 Products', fontweight='bold', pad=20)
+    
+    fig.suptitle('📊 COMPLETE SALES ANALYTICS DASHBOARD', 
+                fontsize=18, fontweight='bold', y=0.98)
+    
+    return fig
+
+# Chart name -> (file name without extension, draw function, aggregates it reads)
+CHARTS = {
+    'revenue_trend': ('chart1_revenue_trend', draw_revenue_trend, ['monthly']),
+    'product_comparison': ('chart2_product_comparison', draw_product_comparison,
+                           ['product_revenue']),
+    'regional_performance': ('chart3_regional_performance', draw_regional_performance,
+                             ['regional']),
+    'weekday_analysis': ('chart4_weekday_analysis', draw_weekday_analysis, ['weekday']),
+    'product_region_heatmap': ('chart5_product_region_heatmap', draw_product_quantity_heatmap,
+                               ['heatmap']),
+    'price_quantity_scatter': ('chart6_price_quantity_scatter', draw_price_quantity_scatter,
+                               ['product_price_quantity']),
+    'comprehensive_dashboard': ('chart7_comprehensive_dashboard', draw_comprehensive_dashboard,
+                                ['monthly', 'product_revenue', 'regional', 'weekday']),
+}
+
+def chart_inputs(name, aggregates):
+    """
+    The slice of the aggregates one chart draws from - fingerprinted by the
+    chart cache, so a change to one aggregate only re-renders its charts
+    """
+    return {key: aggregates[key] for key in CHARTS[name][2]}
+
+def _render_chart(name, aggregates, path, dpi):
+    """
+    Worker for render_charts_batch (runs in a separate process)
+    Headless: the Agg backend never opens a window
+    """
+    plt.switch_backend('Agg')
+    start = time.perf_counter()
+    _, draw, _ = CHARTS[name]
+    fig = draw(aggregates)
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return path, time.perf_counter() - start
+
+
 # Run the dashboard
+# python Sales_Analytics_Dashboard.py --batch [--preview]  -> headless parallel rendering
 if __name__ == "__main__":    
     dashboard = SalesDashboard()
-    dashboard.run_complete_analysis()
+    if '--batch' in sys.argv:
+        dashboard.run_complete_analysis(batch=True, preview='--preview' in sys.argv)
+    else:
+        dashboard.run_complete_analysis()
     
\ No newline at end of file
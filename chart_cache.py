@@ -0,0 +1,139 @@
+"""
+CHART OUTPUT CACHE
+Shared by SalesDashboard, the Day 17 analytics platform and kaggle_analysis.py
+
+Rendering a 300 dpi PNG takes far longer than computing the small aggregate
+it shows. Each chart is fingerprinted by hashing its aggregated input data
+and its plot parameters; if the image file exists and was drawn from the same
+fingerprint, rendering is skipped.
+
+Fingerprints live in a small JSON manifest next to the charts.
+
+Usage:
+    def draw_chart(data):
+        fig, ax = plt.subplots()
+        ...
+        return fig
+
+    cache = ChartCache('.chart_cache.json')
+    cache.render('chart.png', data, draw_chart, show=True, dpi=300)
+    cache.print_stats()
+
+The draw function's bytecode is part of the fingerprint, so a styling edit
+re-renders the chart. Up-to-date charts can still be shown (show=True): the
+saved image is displayed instead of redrawing it.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pandas as pd
+import matplotlib.pyplot as plt
+
+
+def _hash_data(obj, digest):
+    """Feed a DataFrame / Series / dict / list / scalar into digest"""
+    if isinstance(obj, pd.DataFrame):
+        digest.update(repr((list(obj.columns), list(obj.dtypes.astype(str)))).encode())
+        digest.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, pd.Series):
+        digest.update(repr((obj.name, str(obj.dtype))).encode())
+        digest.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=str):
+            digest.update(repr(key).encode())
+            _hash_data(obj[key], digest)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            _hash_data(item, digest)
+    else:
+        digest.update(repr(obj).encode())
+
+
+def _hash_function(function, digest):
+    """Feed a draw function's bytecode into digest, so editing it re-renders the chart"""
+    code = function.__code__
+    digest.update(code.co_code)
+    digest.update(repr([c for c in code.co_consts if not hasattr(c, 'co_code')]).encode())
+
+
+def show_saved(path, dpi):
+    """Display a saved chart image at the size it was drawn (dpi it was saved at)"""
+    image = plt.imread(path)
+    height, width = image.shape[:2]
+    fig, ax = plt.subplots(figsize=(width / dpi, height / dpi))
+    ax.imshow(image)
+    ax.axis('off')
+    plt.show()
+    plt.close(fig)
+
+
+class ChartCache:
+    """Skip re-rendering charts whose input data and parameters did not change"""
+
+    def __init__(self, manifest_path='.chart_cache.json'):
+        self.manifest_path = Path(manifest_path)
+        try:
+            self.manifest = json.loads(self.manifest_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.manifest = {}
+        self.pending = {}   # path -> fingerprint waiting for saved()
+
+        self.rendered = 0
+        self.skipped = 0
+
+    @staticmethod
+    def fingerprint(data, params=None, draw=None):
+        """Hash of the aggregated input data, plot parameters and draw function"""
+        digest = hashlib.sha256()
+        _hash_data(data, digest)
+        digest.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+        if draw is not None:
+            _hash_function(draw, digest)
+        return digest.hexdigest()
+
+    def needs_render(self, path, data, params=None, draw=None):
+        """
+        True if path is missing or was drawn from different data / params
+        (call saved(path) after writing it); False counts as a skipped chart
+        """
+        key = str(path)
+        fingerprint = self.fingerprint(data, params, draw)
+        if self.manifest.get(key) == fingerprint and Path(path).exists():
+            self.skipped += 1
+            return False
+        self.pending[key] = fingerprint
+        return True
+
+    def saved(self, path):
+        """Record that path was rendered from the data given to needs_render()"""
+        key = str(path)
+        self.manifest[key] = self.pending.pop(key)
+        self.rendered += 1
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(self.manifest, indent=2, sort_keys=True))
+
+    def render(self, path, data, draw, params=None, show=False, **savefig_kwargs):
+        """
+        Draw and save a chart unless it is up to date
+        draw(data) must return the matplotlib figure
+        show=True displays the chart either way (the saved image when skipped)
+        Returns True if the chart was rendered, False if skipped
+        """
+        if not self.needs_render(path, data, {**(params or {}), **savefig_kwargs}, draw):
+            if show:
+                show_saved(path, savefig_kwargs.get('dpi', plt.rcParams['figure.dpi']))
+            return False
+        fig = draw(data)
+        fig.savefig(path, **savefig_kwargs)
+        self.saved(path)
+        if show:
+            plt.show()
+        plt.close(fig)
+        return True
+
+    def print_stats(self):
+        """Display how many charts were rendered and skipped"""
+        print(f"\n🖼️  Chart cache: {self.rendered} rendered, "
+              f"{self.skipped} skipped (up to date)")
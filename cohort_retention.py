@@ -0,0 +1,246 @@
+"""
+COHORT RETENTION TRIANGLE
+Shared by AdvancedSQLAnalyzer (Day 16) and the Day 17 analytics platform
+
+A retention triangle has one cell per (cohort month, months since first
+order), holding the customers active in that month plus their orders and
+revenue. Instead of one query per cohort or per offset, the triangle is kept
+in SQLite and built in one pass:
+- cohort_activity:  one row per customer per month with completed orders
+                    (a single GROUP BY over orders)
+- cohort_members:   each customer's first month = their cohort
+- cohort_retention: the triangle itself (a single GROUP BY over the two above)
+
+Loading new orders only re-aggregates the customers that have them: their old
+contribution is subtracted from the triangle, their activity is rebuilt from
+orders, and the new contribution is added back. A customer whose first order
+arrives late simply moves cohort.
+
+Works on any orders table with customer_id, order_id, order_date,
+total_amount and status columns.
+
+Usage:
+    store = CohortRetentionStore(conn)
+    store.refresh()                    # new orders since the last refresh
+    store.refresh(customer_ids=[...])  # or exactly these customers
+    triangle = store.triangle()        # long format, one row per cell
+    matrix = store.matrix('retention_rate')
+"""
+
+import pandas as pd
+
+COHORT_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS cohort_activity (
+        customer_id INTEGER NOT NULL,
+        order_month TEXT NOT NULL,
+        month_index INTEGER NOT NULL,
+        orders INTEGER NOT NULL,
+        revenue REAL NOT NULL,
+        PRIMARY KEY (customer_id, order_month)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS cohort_members (
+        customer_id INTEGER PRIMARY KEY,
+        cohort_month TEXT NOT NULL,
+        cohort_index INTEGER NOT NULL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS cohort_retention (
+        cohort_month TEXT NOT NULL,
+        months_since INTEGER NOT NULL,
+        customers INTEGER NOT NULL,
+        orders INTEGER NOT NULL,
+        revenue REAL NOT NULL,
+        PRIMARY KEY (cohort_month, months_since)
+    ) WITHOUT ROWID
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS cohort_retention_watermark (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        last_order_id INTEGER NOT NULL
+    )
+    ''',
+]
+
+COHORT_TABLES = ['cohort_activity', 'cohort_members', 'cohort_retention',
+                 'cohort_retention_watermark']
+
+# Completed orders per customer per month; month_index = year * 12 + month
+# so months_since is a subtraction ({where} limits customers)
+ACTIVITY_AGGREGATE = '''
+SELECT
+    customer_id,
+    strftime('%Y-%m', order_date),
+    CAST(strftime('%Y', order_date) AS INTEGER) * 12
+        + CAST(strftime('%m', order_date) AS INTEGER),
+    COUNT(*),
+    SUM(total_amount)
+FROM orders
+WHERE status = 'Completed' {where}
+GROUP BY customer_id, strftime('%Y-%m', order_date)
+'''
+
+MEMBERS_AGGREGATE = '''
+SELECT customer_id, MIN(order_month), MIN(month_index)
+FROM cohort_activity
+{where}
+GROUP BY customer_id
+'''
+
+# One row per (customer, month) in cohort_activity, so COUNT(*) = customers
+CELL_AGGREGATE = '''
+SELECT
+    m.cohort_month,
+    a.month_index - m.cohort_index,
+    COUNT(*),
+    SUM(a.orders),
+    SUM(a.revenue)
+FROM cohort_activity a
+JOIN cohort_members m ON m.customer_id = a.customer_id
+{where}
+GROUP BY m.cohort_month, a.month_index - m.cohort_index
+'''
+
+AFFECTED = "customer_id IN (SELECT customer_id FROM cohort_affected_customers)"
+
+
+class CohortRetentionStore:
+    """Cohort x months-since-first-order triangle, maintained incrementally"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def create_schema(self):
+        """Create the cohort tables if they do not exist"""
+        for statement in COHORT_SCHEMA:
+            self.conn.execute(statement)
+
+    def drop_schema(self):
+        """Drop the cohort tables (used when the orders table is recreated)"""
+        for table in COHORT_TABLES:
+            self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+
+    def last_order_id(self):
+        """order_id up to which the triangle is known to be current (0 if never built)"""
+        row = self.conn.execute(
+            "SELECT last_order_id FROM cohort_retention_watermark").fetchone()
+        return row[0] if row else 0
+
+    def refresh(self, customer_ids=None, rebuild=False):
+        """
+        Bring the triangle up to date with the orders table
+        - rebuild=True (or an empty store): one pass over all completed orders
+        - customer_ids: re-aggregate these customers, plus any customer with
+          orders above the watermark (pass them when existing orders changed)
+        - otherwise: only customers with orders above the watermark
+        Does not commit; returns the number of customers re-aggregated
+        """
+        self.create_schema()
+        cursor = self.conn.cursor()
+
+        last_order_id = self.last_order_id()
+        max_order_id = cursor.execute("SELECT MAX(order_id) FROM orders").fetchone()[0] or 0
+
+        if rebuild or last_order_id == 0:
+            refreshed = self._rebuild(cursor)
+        else:
+            cursor.execute('''
+                CREATE TEMP TABLE IF NOT EXISTS cohort_affected_customers (
+                    customer_id INTEGER PRIMARY KEY
+                )
+            ''')
+            cursor.execute("DELETE FROM cohort_affected_customers")
+            if customer_ids is not None:
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO cohort_affected_customers VALUES (?)",
+                    [(int(c),) for c in set(customer_ids)]
+                )
+            cursor.execute('''
+                INSERT OR IGNORE INTO cohort_affected_customers
+                SELECT DISTINCT customer_id FROM orders WHERE order_id > ?
+            ''', (last_order_id,))
+            refreshed = cursor.execute(
+                "SELECT COUNT(*) FROM cohort_affected_customers").fetchone()[0]
+            if refreshed:
+                self._refresh_customers(cursor)
+
+        cursor.execute('''
+            INSERT INTO cohort_retention_watermark (id, last_order_id) VALUES (1, ?)
+            ON CONFLICT(id) DO UPDATE SET last_order_id = excluded.last_order_id
+        ''', (max_order_id,))
+        return refreshed
+
+    def _rebuild(self, cursor):
+        """Whole triangle from scratch: one scan of orders, then the small tables"""
+        for table in ('cohort_activity', 'cohort_members', 'cohort_retention'):
+            cursor.execute(f"DELETE FROM {table}")
+        cursor.execute("INSERT INTO cohort_activity " + ACTIVITY_AGGREGATE.format(where=''))
+        cursor.execute("INSERT INTO cohort_members " + MEMBERS_AGGREGATE.format(where=''))
+        cursor.execute("INSERT INTO cohort_retention " + CELL_AGGREGATE.format(where=''))
+        return cursor.execute("SELECT COUNT(*) FROM cohort_members").fetchone()[0]
+
+    def _refresh_customers(self, cursor):
+        """Swap the contribution of the customers in cohort_affected_customers"""
+        # 1. Take their old contribution out of the triangle
+        cursor.execute(f'''
+            WITH old (cohort_month, months_since, n_customers, n_orders, n_revenue) AS (
+                {CELL_AGGREGATE.format(where='WHERE a.' + AFFECTED)}
+            )
+            UPDATE cohort_retention
+            SET customers = customers - old.n_customers,
+                orders = orders - old.n_orders,
+                revenue = revenue - old.n_revenue
+            FROM old
+            WHERE cohort_retention.cohort_month = old.cohort_month
+              AND cohort_retention.months_since = old.months_since
+        ''')
+
+        # 2. Re-aggregate their activity (index lookups by customer_id)
+        cursor.execute(f"DELETE FROM cohort_activity WHERE {AFFECTED}")
+        cursor.execute(f"DELETE FROM cohort_members WHERE {AFFECTED}")
+        cursor.execute("INSERT INTO cohort_activity " + ACTIVITY_AGGREGATE.format(
+            where='AND ' + AFFECTED))
+        cursor.execute("INSERT INTO cohort_members " + MEMBERS_AGGREGATE.format(
+            where='WHERE ' + AFFECTED))
+
+        # 3. Add the new contribution back, drop cells nobody is left in
+        cursor.execute(f'''
+            INSERT INTO cohort_retention (cohort_month, months_since, customers, orders, revenue)
+            {CELL_AGGREGATE.format(where='WHERE a.' + AFFECTED)}
+            ON CONFLICT(cohort_month, months_since) DO UPDATE SET
+                customers = customers + excluded.customers,
+                orders = orders + excluded.orders,
+                revenue = revenue + excluded.revenue
+        ''')
+        cursor.execute("DELETE FROM cohort_retention WHERE customers <= 0")
+
+    def triangle(self):
+        """
+        Long format triangle: cohort_month, months_since, customers, orders,
+        revenue, cohort_size and retention_rate (% of the cohort still active)
+        """
+        return pd.read_sql_query('''
+            SELECT
+                cohort_month,
+                months_since,
+                customers,
+                orders,
+                ROUND(revenue, 2) as revenue,
+                FIRST_VALUE(customers) OVER (
+                    PARTITION BY cohort_month ORDER BY months_since
+                ) as cohort_size,
+                ROUND(100.0 * customers / FIRST_VALUE(customers) OVER (
+                    PARTITION BY cohort_month ORDER BY months_since
+                ), 1) as retention_rate
+            FROM cohort_retention
+            ORDER BY cohort_month, months_since
+        ''', self.conn)
+
+    def matrix(self, value='retention_rate', triangle=None):
+        """Cohort months down, months since first order across, value in each cell"""
+        if triangle is None:
+            triangle = self.triangle()
+        return triangle.pivot(index='cohort_month', columns='months_since', values=value)
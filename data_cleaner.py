@@ -5,17 +5,125 @@ Handles: Missing values, duplicates, outliers, inconsistencies, validation
 This is production-ready data cleaning!
 """
 
+import io
+import json
+import sqlite3
+import sys
+import tempfile
+import time
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, redirect_stdout
 from datetime import datetime
+from pathlib import Path
+
+# What read_csv gives a text column: object in pandas 2, str in pandas 3
+TEXT_DTYPE = pd.Series(dtype=str).dtype
+
+
+class CleaningPolicy:
+    """
+    Pre-answered cleaning decisions, so DataCleaner can run without input()
+
+    Each decision is looked up for a column in this order:
+    columns -> dtypes ('numeric', 'text' or 'datetime') -> top-level default
+
+    Example (the same structure works as JSON or YAML):
+        {
+            "missing": "fill",       # columns >50% missing: drop or fill
+            "outliers": "cap",       # remove, cap or keep
+            "case": "skip",          # title, lower, upper or skip
+            "dtypes": {"text": {"case": "title"}},
+            "columns": {"Notes": {"missing": "drop"}, "Age": {"outliers": "remove"}}
+        }
+    """
+
+    CHOICES = {
+        'missing': ('drop', 'fill'),
+        'outliers': ('remove', 'cap', 'keep'),
+        'case': ('title', 'lower', 'upper', 'skip'),
+    }
+    # Unanswered decisions never remove or rewrite data
+    DEFAULTS = {'missing': 'fill', 'outliers': 'keep', 'case': 'skip'}
+    DTYPES = ('numeric', 'text', 'datetime')
+
+    def __init__(self, policy=None):
+        policy = dict(policy or {})
+        self.defaults = self._check(dict(self.DEFAULTS, **{
+            key: policy.pop(key) for key in self.CHOICES if key in policy
+        }), 'policy')
+        self.dtypes = {dtype: self._check(rules, f"dtypes.{dtype}")
+                       for dtype, rules in (policy.pop('dtypes', None) or {}).items()}
+        self.columns = {col: self._check(rules, f"columns.{col}")
+                        for col, rules in (policy.pop('columns', None) or {}).items()}
+
+        unknown_dtypes = set(self.dtypes) - set(self.DTYPES)
+        if unknown_dtypes:
+            raise ValueError(f"Unknown dtype group(s) {sorted(unknown_dtypes)} "
+                             f"(use {', '.join(self.DTYPES)})")
+        if policy:
+            raise ValueError(f"Unknown policy key(s): {sorted(policy)}")
+
+    def _check(self, rules, where):
+        """Validate one set of decisions (a copy: the caller's dict is left as it was)"""
+        rules = dict(rules)
+        for decision, choice in rules.items():
+            if decision not in self.CHOICES:
+                raise ValueError(f"{where}: unknown decision '{decision}' "
+                                 f"(use {', '.join(self.CHOICES)})")
+            if decision == 'case' and choice is None:   # case: null in YAML / JSON
+                rules[decision] = choice = 'skip'
+            if choice not in self.CHOICES[decision]:
+                raise ValueError(f"{where}.{decision}: '{choice}' is not one of "
+                                 f"{', '.join(self.CHOICES[decision])}")
+        return rules
+
+    @classmethod
+    def load(cls, source):
+        """Build a policy from a dict, a CleaningPolicy, or a .json / .yaml / .yml file"""
+        if isinstance(source, cls):
+            return source
+        if source is None or isinstance(source, dict):
+            return cls(source)
+
+        path = str(source)
+        with open(path, encoding='utf-8') as f:
+            if path.endswith(('.yaml', '.yml')):
+                import yaml   # needs pyyaml
+                return cls(yaml.safe_load(f))
+            return cls(json.load(f))
+
+    @staticmethod
+    def dtype_group(dtype):
+        """'numeric', 'datetime' or 'text' for a pandas dtype"""
+        if pd.api.types.is_numeric_dtype(dtype):
+            return 'numeric'
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return 'datetime'
+        return 'text'
+
+    def decide(self, decision, column, dtype=None):
+        """Answer one decision for one column"""
+        for rules in (self.columns.get(column),
+                      self.dtypes.get(self.dtype_group(dtype)) if dtype is not None else None,
+                      self.defaults):
+            if rules and decision in rules:
+                return rules[decision]
+
 
 class DataCleaner:
     """Comprehensive data cleaning pipeline"""
     
-    def __init__(self, df):
+    def __init__(self, df, policy=None):
+        """
+        policy: CleaningPolicy, dict or JSON/YAML file answering the per-column
+        questions; None asks with input() as before
+        """
         self.df = df.copy()
-        self.original_df = df.copy()
+        self.original_df = df       # only read for the report, never changed
         self.cleaning_log = []
+        self.policy = CleaningPolicy.load(policy) if policy is not None else None
     
     def log_action(self, action):
         """Log cleaning actions"""
@@ -74,8 +182,12 @@ class DataCleaner:
             
             # If >50% missing, consider dropping column
             if missing_pct > 50:
-                if input(f"  Column '{col}' has {missing_pct:.1f}% missing. Drop? (y/n): ").lower() == 'y':
-                    self.df = self.df.drop(columns=[col])
+                if self.policy is not None:
+                    drop = self.policy.decide('missing', col, self.df[col].dtype) == 'drop'
+                else:
+                    drop = input(f"  Column '{col}' has {missing_pct:.1f}% missing. Drop? (y/n): ").lower() == 'y'
+                if drop:
+                    del self.df[col]
                     self.log_action(f"Dropped column '{col}' (too many missing values)")
                     continue
             
@@ -135,15 +247,19 @@ class DataCleaner:
                 print(f"  Outliers detected: {outliers}")
                 print(f"  Valid range: {lower_bound:.2f} to {upper_bound:.2f}")
                 
-                action = input(f"  Action? (1=Remove, 2=Cap, 3=Keep): ")
+                if self.policy is not None:
+                    action = self.policy.decide('outliers', col, self.df[col].dtype)
+                else:
+                    action = {'1': 'remove', '2': 'cap'}.get(
+                        input(f"  Action? (1=Remove, 2=Cap, 3=Keep): "), 'keep')
                 
-                if action == '1':
+                if action == 'remove':
                     mask = (self.df[col] >= lower_bound) & (self.df[col] <= upper_bound)
                     removed = (~mask).sum()
                     self.df = self.df[mask]
                     self.log_action(f"Removed {removed} outliers from '{col}'")
                 
-                elif action == '2':
+                elif action == 'cap':
                     self.df[col] = self.df[col].clip(lower=lower_bound, upper=upper_bound)
                     self.log_action(f"Capped {outliers} outliers in '{col}'")
                 
@@ -155,7 +271,8 @@ class DataCleaner:
         print("\n🔧 STANDARDIZING TEXT...")
         
         if columns is None:
-            columns = self.df.select_dtypes(include=['object']).columns
+            columns = [col for col in self.df.columns
+                       if CleaningPolicy.dtype_group(self.df[col].dtype) == 'text']
         
         
         for col in columns:
@@ -164,27 +281,32 @@ class DataCleaner:
             if 'date' in col.lower():
                 continue
         
-            # Strip whitespace
-            mask = self.df[col].notna()
-            before = self.df.loc[mask, col].astype(str).str.strip()
-            changed = (self.df.loc[mask, col] != before).sum()
+            # Strip whitespace (the column is replaced, not written into)
+            values = self.df[col]
+            mask = values.notna()
+            stripped = values.where(~mask, values.astype(str).str.strip())
+            changed = ((values != stripped) & mask).sum()
             
             if changed > 0:
-                self.df.loc[mask, col] = before
+                self.df[col] = stripped
                 self.log_action(f"Removed whitespace from {changed} values in '{col}'")
             
-            # Standardize case (ask user)
-            print(f"\n  Column: {col}")
-            print(f"  Sample values: {self.df[col].head(3).tolist()}")
-            case_action = input("  Standardize case? (1=Title, 2=Lower, 3=Upper, 4=Skip): ")
+            # Standardize case (policy, or ask user)
+            if self.policy is not None:
+                case_action = self.policy.decide('case', col, self.df[col].dtype)
+            else:
+                print(f"\n  Column: {col}")
+                print(f"  Sample values: {self.df[col].head(3).tolist()}")
+                case_action = {'1': 'title', '2': 'lower', '3': 'upper'}.get(
+                    input("  Standardize case? (1=Title, 2=Lower, 3=Upper, 4=Skip): "), 'skip')
             
-            if case_action == '1':
+            if case_action == 'title':
                 self.df[col] = self.df[col].str.title()
                 self.log_action(f"Converted '{col}' to title case")
-            elif case_action == '2':
+            elif case_action == 'lower':
                 self.df[col] = self.df[col].str.lower()
                 self.log_action(f"Converted '{col}' to lowercase")
-            elif case_action == '3':
+            elif case_action == 'upper':
                 self.df[col] = self.df[col].str.upper()
                 self.log_action(f"Converted '{col}' to uppercase")
     
@@ -198,7 +320,7 @@ class DataCleaner:
                 continue
 
             # Try to convert to numeric if possible
-            if self.df[col].dtype == 'object':
+            if CleaningPolicy.dtype_group(self.df[col].dtype) == 'text':   # object, or str in pandas 3
                 try:
                     converted = pd.to_numeric(self.df[col], errors='coerce')
                     if converted.notna().sum() / len(converted) > 0.8:
@@ -211,11 +333,23 @@ class DataCleaner:
             if 'date' in col.lower() or 'time' in col.lower():
                 try:
                     self.df[col] = pd.to_datetime(self.df[col], errors='coerce')
-                    if self.df[col].dtype == 'datetime64[ns]':
+                    if pd.api.types.is_datetime64_any_dtype(self.df[col]):
                         self.log_action(f"Converted '{col}' to datetime")
                 except:
                     pass
     
+    def clean_all(self):
+        """
+        Run every cleaning step in a fixed order (the same order as
+        ChunkedDataCleaner); with a policy nothing waits for input()
+        """
+        self.fix_data_types()
+        self.handle_missing_values()
+        self.handle_outliers()
+        self.standardize_text()
+        self.remove_duplicates()
+        return self.df
+    
     def validate_data(self):
         """Validate cleaned data"""
         print("\n" + "="*70)
@@ -280,6 +414,555 @@ class DataCleaner:
             print(f"\n✗ Error saving: {e}")
             return False
 
+class ChunkedDataCleaner:
+    """
+    Out-of-core version of DataCleaner for CSV files bigger than memory
+
+    read_csv infers dtypes per chunk, so a scan first settles the dtype each
+    column has in the whole file; both passes read every chunk with it.
+    Pass 1 reads the file chunk by chunk and keeps only what the decisions
+    need: numeric conversion rates, missing counts and value counts for
+    modes. The numeric columns are spilled to temporary files (8 bytes per
+    value) and read back one chunk at a time for exact medians and IQR
+    bounds, which are found in sorted runs on disk (np.memmap).
+    Pass 2 streams every chunk through the same steps DataCleaner runs, in
+    this order, and appends it to the output file:
+        fix data types -> missing values -> outliers -> text -> duplicates
+    Duplicates are found through 64-bit row hashes kept in a temporary
+    SQLite table, so at most one chunk of rows is in memory at a time
+    (value counts for the modes still grow with the distinct text values).
+    """
+
+    def __init__(self, input_file, chunksize=100_000, outlier_action='cap',
+                 case_style=None, drop_missing_above=None, policy=None, **read_csv_kwargs):
+        """
+        outlier_action: 'remove', 'cap' or 'keep' (asked per column in DataCleaner)
+        case_style: None, 'title', 'lower' or 'upper'
+        drop_missing_above: drop columns with more than this % missing (None = keep all)
+        policy: CleaningPolicy, dict or JSON/YAML file with per-column / per-dtype
+        decisions; replaces outlier_action and case_style when given
+        """
+        if policy is None:
+            policy = {'outliers': outlier_action, 'case': case_style}
+
+        self.input_file = input_file
+        self.chunksize = chunksize
+        self.policy = CleaningPolicy.load(policy)
+        self.drop_missing_above = drop_missing_above
+        self.read_csv_kwargs = read_csv_kwargs
+        self.column_dtypes = None   # set by the first _read_chunks()
+        self.cleaning_log = []
+        self.stats = None
+        self.rows_in = 0
+        self.rows_out = 0
+
+    def log_action(self, action):
+        """Log cleaning actions"""
+        self.cleaning_log.append(action)
+        print(f"  ✓ {action}")
+
+    def _read_chunks(self):
+        """Yield the input file one chunk at a time, every chunk with the same dtypes"""
+        kwargs = self.read_csv_kwargs
+        if 'dtype' not in kwargs:
+            if self.column_dtypes is None:
+                self.column_dtypes = self._scan_dtypes()
+            kwargs = dict(kwargs, dtype=self.column_dtypes)
+        return pd.read_csv(self.input_file, chunksize=self.chunksize, **kwargs)
+
+    def _scan_dtypes(self):
+        """
+        The dtype read_csv gives each column when it reads the whole file
+        (a column with a few text values in its last rows is numeric in the
+        first chunks and text in the last one; the whole column is text)
+        """
+        dtypes = {}
+        for chunk in pd.read_csv(self.input_file, chunksize=self.chunksize, **self.read_csv_kwargs):
+            for col, dtype in chunk.dtypes.items():
+                if col not in dtypes or dtypes[col] == dtype:
+                    dtypes[col] = dtype
+                elif dtypes[col].kind in 'iuf' and dtype.kind in 'iuf':
+                    dtypes[col] = np.result_type(dtypes[col], dtype)   # int and float: float64
+                else:
+                    dtypes[col] = TEXT_DTYPE
+        # parse_dates columns are left to read_csv
+        return {col: dtype for col, dtype in dtypes.items() if dtype.kind != 'M'}
+
+    # ----- Pass 1: global statistics -----
+
+    def _column_chunks(self, path, fill=None):
+        """A spilled column read back one chunk at a time: (rows, values with NaN filled)"""
+        n_rows = Path(path).stat().st_size // 8
+        for start in range(0, n_rows, self.chunksize):
+            rows = slice(start, start + self.chunksize)
+            part = np.fromfile(path, dtype='float64', count=self.chunksize, offset=start * 8)
+            if fill is not None:
+                part[np.isnan(part)] = fill
+            yield rows, part
+
+    @staticmethod
+    def _sorted_runs(path, parts):
+        """Sort every part on its own and write them to path; returns the runs, memmapped"""
+        ends = [0]
+        with open(path, 'wb') as f:
+            for part in parts:
+                part = np.sort(part[~np.isnan(part)])
+                f.write(part.tobytes())
+                ends.append(ends[-1] + len(part))
+        if ends[-1] == 0:
+            return []
+        data = np.memmap(path, dtype='float64', mode='r')
+        return [data[start:end] for start, end in zip(ends, ends[1:]) if end > start]
+
+    @staticmethod
+    def _kth_smallest(runs, k):
+        """
+        k-th smallest value (from 0) of sorted runs, without merging them
+        Bisects on the float's bit pattern (ordered like the values), counting
+        the values <= x with one searchsorted per run
+        """
+        def key(value):
+            bits = int(np.float64(value).view(np.uint64))
+            return bits ^ 0xFFFFFFFFFFFFFFFF if bits >> 63 else bits | 1 << 63
+
+        def value(key):
+            bits = key ^ 1 << 63 if key >> 63 else key ^ 0xFFFFFFFFFFFFFFFF
+            return float(np.uint64(bits).view(np.float64))
+
+        low = key(min(run[0] for run in runs))
+        high = key(max(run[-1] for run in runs))
+        while low < high:
+            middle = (low + high) // 2
+            if sum(int(np.searchsorted(run, value(middle), side='right')) for run in runs) > k:
+                high = middle
+            else:
+                low = middle + 1
+        return value(low) + 0.0   # -0.0 -> 0.0
+
+    def _quantiles(self, runs, quantiles):
+        """np.quantile (linear) of the values in sorted runs"""
+        n = sum(len(run) for run in runs)
+        if n == 0:
+            return [np.nan] * len(quantiles)
+        result = []
+        for q in quantiles:
+            index = (n - 1) * q
+            below = int(np.floor(index))
+            pair = [self._kth_smallest(runs, below), self._kth_smallest(runs, min(below + 1, n - 1))]
+            result.append(float(np.quantile(pair, index - below)))
+        return result
+
+    def _median(self, runs):
+        """np.nanmedian of the values in sorted runs"""
+        n = sum(len(run) for run in runs)
+        if n == 0:
+            return np.nan
+        middle = [self._kth_smallest(runs, k) for k in sorted({(n - 1) // 2, n // 2})]
+        return float(np.mean(middle))
+
+    def compute_statistics(self):
+        """
+        Pass 1: everything pass 2 needs to clean one chunk on its own
+        (conversions, fill values, outlier bounds, final dtypes)
+        Numeric columns go through temporary files, removed afterwards
+        """
+        with tempfile.TemporaryDirectory(prefix='chunked_cleaner_') as tmp:
+            return self._compute_statistics(Path(tmp))
+
+    def _compute_statistics(self, tmp):
+        """compute_statistics, with tmp as the directory for the spilled columns"""
+        print("\n🔍 PASS 1: COMPUTING GLOBAL STATISTICS...")
+        skip_numeric = ['Employee_ID', 'Name', 'Department', 'City']
+
+        n_rows = 0
+        columns = None
+        object_columns = set()      # text dtype: object, or str in pandas 3
+        text_columns = set()        # what DataCleaner.standardize_text selects
+        float_columns = set()       # float64 in at least one chunk
+        converted_float = set()     # float64 after pd.to_numeric in at least one chunk
+        convertible = {}            # col -> values pd.to_numeric can parse
+        missing = {}                # col -> missing values, raw and after numeric conversion
+        missing_converted = {}
+        spilled = {}                # col -> file its float64 values are appended to
+        value_counts = {}           # col -> counts of non-numeric values (for the mode)
+
+        with ExitStack() as files:
+            for chunk in self._read_chunks():
+                if columns is None:
+                    columns = list(chunk.columns)
+                n_rows += len(chunk)
+                text_columns.update(col for col in columns
+                                    if CleaningPolicy.dtype_group(chunk[col].dtype) == 'text')
+
+                for col in columns:
+                    values = chunk[col]
+                    is_date = col not in skip_numeric and ('date' in col.lower() or 'time' in col.lower())
+                    if is_date:
+                        values = pd.to_datetime(values, errors='coerce')
+
+                    is_text = CleaningPolicy.dtype_group(values.dtype) == 'text'
+                    if is_text:
+                        object_columns.add(col)
+                    if values.dtype == 'float64':
+                        float_columns.add(col)
+                    missing[col] = missing.get(col, 0) + int(values.isnull().sum())
+
+                    if values.dtype.kind not in 'iuf':
+                        counts = values.value_counts()
+                        value_counts[col] = counts if col not in value_counts else \
+                            value_counts[col].add(counts, fill_value=0)
+
+                    # Numeric columns, and text columns that might become numeric.
+                    # A spill file holds one value per row of the file (NaN for
+                    # chunks where the column is not numeric), so its rows line
+                    # up with the kept-rows mask
+                    if col in skip_numeric or is_date:
+                        continue
+                    converted = pd.to_numeric(values, errors='coerce') if is_text else values
+                    if converted.dtype.kind not in 'iuf':
+                        if col in spilled:
+                            spilled[col].write(np.full(len(chunk), np.nan).tobytes())
+                        continue
+                    parsed = int(converted.notna().sum())
+                    convertible[col] = convertible.get(col, 0) + parsed
+                    missing_converted[col] = missing_converted.get(col, 0) + len(converted) - parsed
+                    if is_text and converted.dtype == 'float64':
+                        converted_float.add(col)
+                    if col not in spilled:
+                        spilled[col] = files.enter_context(open(tmp / f'column_{len(spilled)}.f8', 'wb'))
+                        spilled[col].write(np.full(n_rows - len(chunk), np.nan).tobytes())
+                    spilled[col].write(converted.to_numpy(dtype='float64').tobytes())
+
+        if columns is None:
+            raise ValueError(f"'{self.input_file}' has no rows")
+
+        # Same rules as DataCleaner.fix_data_types
+        numeric_conversions = [col for col in columns
+                               if col in object_columns and col in convertible
+                               and convertible[col] / n_rows > 0.8]
+        datetime_columns = [col for col in columns
+                            if col not in skip_numeric
+                            and ('date' in col.lower() or 'time' in col.lower())]
+        numeric_columns = [col for col in columns
+                           if col in spilled and col not in datetime_columns
+                           and (col not in object_columns or col in numeric_conversions)]
+        for col in numeric_conversions:
+            missing[col] = missing_converted[col]
+            if col in converted_float:
+                float_columns.add(col)
+
+        def dtype_of(col):
+            """dtype the column has after the type fixes, for policy lookups"""
+            if col in numeric_columns:
+                return 'float64'
+            return 'datetime64[ns]' if col in datetime_columns else 'object'
+
+        # Columns to drop, fill values (DataCleaner.handle_missing_values)
+        dropped = []
+        for col in columns:
+            missing_pct = missing[col] / n_rows * 100
+            if self.drop_missing_above is not None and missing_pct > self.drop_missing_above:
+                dropped.append(col)
+            elif missing_pct > 50 and self.policy.decide('missing', col, dtype_of(col)) == 'drop':
+                dropped.append(col)
+
+        fill_values = {}
+        column_files = {col: spilled[col].name for col in numeric_columns if col not in dropped}
+        for col in columns:
+            if col in dropped or missing[col] == 0:
+                continue
+            if col in column_files:
+                runs = self._sorted_runs(tmp / 'sorted.f8', (part for _, part in
+                                                             self._column_chunks(column_files[col])))
+                median_val = self._median(runs)
+                del runs
+                fill_values[col] = median_val
+                float_columns.add(col)
+            elif value_counts[col].empty:
+                fill_values[col] = 'Unknown'
+            else:
+                counts = value_counts[col]
+                # Smallest of the most frequent values, as Series.mode()[0]
+                fill_values[col] = pd.Series(counts.index[counts == counts.max()]).mode()[0]
+        del value_counts
+
+        # Outlier bounds (DataCleaner.handle_outliers), one column after the
+        # other so removed rows no longer count for the next column; the kept
+        # rows are a memmapped mask
+        bounds = {}
+        keep = np.memmap(tmp / 'keep.bool', dtype=bool, mode='w+', shape=n_rows)
+        keep[:] = True
+        for col, path in column_files.items():
+            fill = fill_values.get(col)
+            runs = self._sorted_runs(tmp / 'sorted.f8', (part[keep[rows]] for rows, part in
+                                                         self._column_chunks(path, fill)))
+            Q1, Q3 = self._quantiles(runs, [0.25, 0.75])
+            del runs
+            IQR = Q3 - Q1
+            lower_bound = Q1 - 1.5 * IQR
+            upper_bound = Q3 + 1.5 * IQR
+            outliers = 0
+            for rows, part in self._column_chunks(path, fill):
+                outliers += int((keep[rows] & ~((part >= lower_bound) & (part <= upper_bound))).sum())
+            if outliers == 0:
+                continue
+            action = self.policy.decide('outliers', col, dtype_of(col))
+            bounds[col] = (lower_bound, upper_bound, outliers, action)
+            if action == 'remove':
+                for rows, part in self._column_chunks(path, fill):
+                    keep[rows] &= (part >= lower_bound) & (part <= upper_bound)
+            elif action == 'cap':
+                float_columns.add(col)
+        del column_files, keep
+
+        text_columns = [col for col in columns
+                        if col in text_columns and col not in numeric_conversions
+                        and col not in datetime_columns and col not in dropped
+                        and 'date' not in col.lower()]
+
+        self.stats = {
+            'rows': n_rows,
+            'dropped': dropped,
+            'numeric_conversions': numeric_conversions,
+            'datetime_columns': datetime_columns,
+            'fill_values': fill_values,
+            'missing': {col: missing[col] for col in fill_values},
+            'bounds': bounds,
+            'text_columns': text_columns,
+            'case': {col: self.policy.decide('case', col, 'object') for col in text_columns},
+            'dtypes': {col: 'float64' if col in float_columns else 'int64'
+                       for col in numeric_columns if col not in dropped},
+        }
+        print(f"  ✓ {n_rows:,} rows, {len(columns)} columns scanned")
+        return self.stats
+
+    # ----- Pass 2: stream chunks through the steps -----
+
+    def clean_chunk(self, chunk, counters):
+        """Apply every step to one chunk with the global statistics from pass 1"""
+        stats = self.stats
+        chunk = chunk.drop(columns=stats['dropped'])
+
+        # Fix data types
+        for col in stats['numeric_conversions']:
+            if col in chunk.columns:
+                chunk[col] = pd.to_numeric(chunk[col], errors='coerce')
+        for col in stats['datetime_columns']:
+            if col in chunk.columns:
+                chunk[col] = pd.to_datetime(chunk[col], errors='coerce')
+
+        # Missing values
+        for col, fill_value in stats['fill_values'].items():
+            chunk[col] = chunk[col].fillna(fill_value)
+
+        # Outliers
+        for col, (lower_bound, upper_bound, _, action) in stats['bounds'].items():
+            if action == 'remove':
+                mask = (chunk[col] >= lower_bound) & (chunk[col] <= upper_bound)
+                chunk = chunk[mask]
+            elif action == 'cap':
+                chunk[col] = chunk[col].clip(lower=lower_bound, upper=upper_bound)
+
+        # Text: strip whitespace (the column is replaced, not written into), then case
+        for col in stats['text_columns']:
+            values = chunk[col]
+            mask = values.notna()
+            stripped = values.where(~mask, values.astype(str).str.strip())
+            changed = ((values != stripped) & mask).sum()
+            if changed > 0:
+                chunk[col] = stripped
+                counters[f'whitespace:{col}'] = counters.get(f'whitespace:{col}', 0) + int(changed)
+            if stats['case'][col] != 'skip':
+                chunk[col] = getattr(chunk[col].str, stats['case'][col])()
+
+        # Same dtype in every chunk, so the CSV is written the same way throughout
+        chunk = chunk.astype(stats['dtypes'])
+
+        # Duplicates: drop rows already seen in this or an earlier chunk
+        # (SQLite stores hashes as signed 64-bit integers)
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy().view('int64')
+        duplicate = pd.Series(hashes).duplicated().to_numpy()
+        self.seen_hashes.execute("DELETE FROM chunk_hashes")
+        self.seen_hashes.executemany("INSERT INTO chunk_hashes VALUES (?)",
+                                     ((int(h),) for h in hashes[~duplicate]))
+        seen = [row[0] for row in self.seen_hashes.execute(
+            "SELECT hash FROM chunk_hashes JOIN seen_hashes USING (hash)")]
+        duplicate = duplicate | np.isin(hashes, seen)
+        self.seen_hashes.execute(
+            "INSERT OR IGNORE INTO seen_hashes SELECT hash FROM chunk_hashes")
+        counters['duplicates'] = counters.get('duplicates', 0) + int(duplicate.sum())
+        return chunk[~duplicate]
+
+    def run(self, output_file='cleaned_data.csv'):
+        """Clean the whole file: pass 1 for statistics, pass 2 to clean and write"""
+        print("\n" + "="*70)
+        print(f"🧹 CHUNKED CLEANING: {self.input_file} ({self.chunksize:,} rows per chunk)")
+        print("="*70)
+        start = datetime.now()
+
+        stats = self.compute_statistics()
+
+        print("\n🔧 PASS 2: CLEANING AND WRITING CHUNKS...")
+        # '' is a private on-disk database, deleted when it is closed
+        self.seen_hashes = sqlite3.connect('')
+        self.seen_hashes.execute("CREATE TABLE seen_hashes (hash INTEGER PRIMARY KEY)")
+        self.seen_hashes.execute("CREATE TABLE chunk_hashes (hash INTEGER)")
+        counters = {}
+        self.rows_in = self.rows_out = 0
+        try:
+            for number, chunk in enumerate(self._read_chunks()):
+                self.rows_in += len(chunk)
+                cleaned = self.clean_chunk(chunk, counters)
+                cleaned.to_csv(output_file, mode='w' if number == 0 else 'a',
+                               header=number == 0, index=False)
+                self.rows_out += len(cleaned)
+        finally:
+            self.seen_hashes.close()
+            self.seen_hashes = None
+
+        # Same log entries as the in-memory steps
+        for col in stats['dropped']:
+            self.log_action(f"Dropped column '{col}' (too many missing values)")
+        for col in stats['numeric_conversions']:
+            if col not in stats['dropped']:
+                self.log_action(f"Converted '{col}' to numeric")
+        for col in stats['datetime_columns']:
+            if col not in stats['dropped']:
+                self.log_action(f"Converted '{col}' to datetime")
+        for col, fill_value in stats['fill_values'].items():
+            count = stats['missing'][col]
+            if col in stats['dtypes']:
+                self.log_action(f"Filled {count} missing values in '{col}' with median ({fill_value:.2f})")
+            elif fill_value == 'Unknown':
+                self.log_action(f"Filled {count} missing values in '{col}' with 'Unknown'")
+            else:
+                self.log_action(f"Filled {count} missing values in '{col}' with mode ('{fill_value}')")
+        for col, (_, _, outliers, action) in stats['bounds'].items():
+            if action == 'remove':
+                self.log_action(f"Removed {outliers} outliers from '{col}'")
+            elif action == 'cap':
+                self.log_action(f"Capped {outliers} outliers in '{col}'")
+            else:
+                self.log_action(f"Kept {outliers} outliers in '{col}'")
+        for col in stats['text_columns']:
+            if counters.get(f'whitespace:{col}'):
+                self.log_action(f"Removed whitespace from {counters[f'whitespace:{col}']} values in '{col}'")
+            if stats['case'][col] != 'skip':
+                case_name = {'title': 'title case', 'lower': 'lowercase', 'upper': 'uppercase'}
+                self.log_action(f"Converted '{col}' to {case_name[stats['case'][col]]}")
+        if counters.get('duplicates'):
+            self.log_action(f"Removed {counters['duplicates']} duplicate rows")
+        else:
+            self.log_action("No duplicates found")
+
+        elapsed = (datetime.now() - start).total_seconds()
+        print(f"\n✓ {self.rows_in:,} rows in, {self.rows_out:,} rows out → '{output_file}' "
+              f"({elapsed:.1f}s)")
+        return self.rows_out
+
+def _clean_file(input_file, output_file, policy, chunksize):
+    """
+    Worker for clean_directory (runs in a separate process)
+    Cleans one file with its own cleaner and captures its console output;
+    errors are returned, not raised, so one bad file never stops the batch
+    """
+    log = io.StringIO()
+    start = time.perf_counter()
+    result = {'file': Path(input_file).name, 'output': str(output_file), 'status': 'ok',
+              'rows_in': None, 'rows_out': None, 'seconds': None, 'error': '', 'actions': []}
+    try:
+        with redirect_stdout(log):
+            if chunksize:
+                cleaner = ChunkedDataCleaner(input_file, chunksize=chunksize, policy=policy)
+                cleaner.run(output_file)
+                result['rows_in'], result['rows_out'] = cleaner.rows_in, cleaner.rows_out
+            else:
+                cleaner = DataCleaner(pd.read_csv(input_file), policy=policy)
+                cleaner.clean_all()
+                cleaner.df.to_csv(output_file, index=False)
+                result['rows_in'], result['rows_out'] = len(cleaner.original_df), len(cleaner.df)
+        result['actions'] = cleaner.cleaning_log
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def clean_directory(input_dir, output_dir=None, policy=None, pattern='*.csv',
+                    max_workers=None, chunksize=None, log_file='cleaning_log.csv'):
+    """
+    Clean every CSV in input_dir in parallel, one process per file
+    - output_dir (default input_dir/cleaned) gets the cleaned files under
+      their original names, next to one consolidated log_file
+    - policy answers every cleaning decision (see CleaningPolicy), so no
+      worker ever waits for input()
+    - chunksize: use ChunkedDataCleaner for each file (large files)
+    Failed files are reported and logged; the rest of the batch carries on.
+    Returns one summary row per file as a DataFrame
+    """
+    print("="*70)
+    print("🗂️  BATCH CLEANING")
+    print("="*70)
+
+    input_dir = Path(input_dir)
+    output_dir = Path(output_dir) if output_dir else input_dir / 'cleaned'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    files = sorted(path for path in input_dir.glob(pattern) if path.is_file())
+
+    # Load the policy once, so a broken policy fails before any work starts
+    policy = CleaningPolicy.load(policy)
+    print(f"\n{len(files)} files from '{input_dir}' → '{output_dir}'")
+
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_clean_file, path, output_dir / path.name, policy, chunksize): path
+                   for path in files}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:   # the worker process itself died
+                result = {'file': futures[future].name, 'output': '', 'status': 'failed',
+                          'rows_in': None, 'rows_out': None, 'seconds': None,
+                          'error': f"{type(e).__name__}: {e}", 'actions': []}
+            results.append(result)
+            if result['status'] == 'ok':
+                print(f"  ✓ {result['file']}: {result['rows_in']:,} → {result['rows_out']:,} rows "
+                      f"({result['seconds']:.2f}s)")
+            else:
+                print(f"  ✗ {result['file']}: {result['error']}")
+
+    # Consolidated log: one row per cleaning action (one row for a failed file)
+    log_rows = []
+    for result in sorted(results, key=lambda r: r['file']):
+        details = {key: result[key] for key in
+                   ('file', 'status', 'rows_in', 'rows_out', 'seconds', 'error')}
+        for number, action in enumerate(result['actions'] or [''], 1):
+            log_rows.append({**details, 'step': number if action else None, 'action': action})
+    log_path = output_dir / log_file
+    log_df = pd.DataFrame(log_rows, columns=['file', 'status', 'rows_in', 'rows_out', 'seconds',
+                                             'error', 'step', 'action'])
+    log_df = log_df.astype({'rows_in': 'Int64', 'rows_out': 'Int64', 'step': 'Int64'})
+    log_df.round({'seconds': 3}).to_csv(log_path, index=False)
+
+    summary = pd.DataFrame(results, columns=['file', 'status', 'rows_in', 'rows_out',
+                                             'seconds', 'error', 'output'])
+    summary = summary.astype({'rows_in': 'Int64', 'rows_out': 'Int64'})
+    summary = summary.sort_values('file').reset_index(drop=True)
+    failed = (summary['status'] != 'ok').sum()
+
+    print("\n" + "-"*70)
+    print(f"✓ {len(summary) - failed} cleaned, ✗ {failed} failed "
+          f"in {time.perf_counter() - start:.2f}s (sum of files: {summary['seconds'].sum():.2f}s)")
+    slowest = summary.dropna(subset=['seconds']).nlargest(5, 'seconds')
+    if not slowest.empty:
+        print("\nSlowest files:")
+        for _, row in slowest.iterrows():
+            print(f"  {row['file']:40s} {row['seconds']:7.2f}s")
+    print(f"\n✓ Cleaning log saved to '{log_path}'")
+    return summary
+
 # Main function
 def main():
     print("="*70)
@@ -290,8 +973,9 @@ def main():
     print("\n1. Load your dataset")
     print("  Option 1: Use sample messy data")
     print("  Option 2: Load from CSV file")
+    print("  Option 3: Clean a large CSV file in chunks (out-of-core)")
     
-    choice = input("\nChoice (1/2): ")
+    choice = input("\nChoice (1/2/3): ")
     
     if choice == '1':
         # Generate sample messy data
@@ -304,6 +988,29 @@ def main():
         })
         print("\n✓ Sample messy data loaded")
     
+    elif choice == '3':
+        filename = input("Enter CSV filename: ")
+        output = input("Enter output filename (default: 'cleaned_data.csv'): ").strip()
+        chunksize = input("Rows per chunk (default: 100000): ").strip()
+        policy = input("Cleaning policy file (JSON/YAML, Enter to choose actions now): ").strip()
+        if not policy:
+            action = input("Outlier action? (1=Remove, 2=Cap, 3=Keep): ")
+            case_action = input("Standardize case? (1=Title, 2=Lower, 3=Upper, 4=Skip): ")
+            policy = {'outliers': {'1': 'remove', '2': 'cap'}.get(action, 'keep'),
+                      'case': {'1': 'title', '2': 'lower', '3': 'upper'}.get(case_action, 'skip')}
+        try:
+            cleaner = ChunkedDataCleaner(
+                filename,
+                chunksize=int(chunksize) if chunksize else 100_000,
+                policy=policy,
+            )
+            cleaner.run(output or 'cleaned_data.csv')
+        except Exception as e:
+            print(f"\n✗ Error: {e}")
+            return
+        print("\n✓ Cleaning complete!")
+        return
+    
     else:
         filename = input("Enter CSV filename: ")
         try:
@@ -313,6 +1020,21 @@ def main():
             print(f"\n✗ Error: {e}")
             return
     
+    # Policy file: clean unattended, no menu
+    policy = input("\nCleaning policy file (JSON/YAML, Enter for the interactive menu): ").strip()
+    if policy:
+        try:
+            cleaner = DataCleaner(df, policy=policy)
+        except Exception as e:
+            print(f"\n✗ Error: {e}")
+            return
+        cleaner.get_data_profile()
+        cleaner.clean_all()
+        cleaner.validate_data()
+        cleaner.get_cleaning_report()
+        cleaner.save_cleaned_data()
+        return
+    
     # Create cleaner
     cleaner = DataCleaner(df)
     
@@ -363,5 +1085,10 @@ def main():
         else:
             print("✗ Invalid choice!")
 
+# python data_cleaner.py --batch INPUT_DIR [POLICY_FILE]  -> clean every CSV in parallel
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if '--batch' in sys.argv:
+        args = [arg for arg in sys.argv[1:] if arg != '--batch']
+        clean_directory(args[0], policy=args[1] if len(args) > 1 else None)
+    else:
+        main()
\ No newline at end of file
@@ -16,9 +16,15 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
+from pathlib import Path
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
+# The chart cache lives at the top of the repository (shared with the dashboards)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from chart_cache import ChartCache
+
 # Set visualization style
 sns.set_style('whitegrid')
 sns.set_palette('husl')
@@ -275,111 +281,130 @@ print("\n" + "=" * 80)
 print("📈 PART 6: CREATING VISUALIZATIONS")
 print("=" * 80)
 
+# Charts are only re-drawn when the data behind them or their draw function changed
+chart_cache = ChartCache('.chart_cache.json')
+chart_settings = {'show': True, 'dpi': 300, 'bbox_inches': 'tight'}
+
+
+def save_chart(path, data, draw):
+    """Draw, save and show one chart (the saved PNG is shown if it is up to date)"""
+    if chart_cache.render(path, data, draw, **chart_settings):
+        print(f"✅ Saved: {path}")
+    else:
+        print(f"⏭️  Up to date: {path}")
+
+
 # 6.1: Revenue by Category
 print("\n📊 Creating Chart 1: Revenue by Category...")
-plt.figure(figsize=(12, 6))
 category_revenue = df.groupby('Category')['Final_Amount'].sum().sort_values(ascending=False)
-bars = plt.bar(category_revenue.index, category_revenue.values, 
-               color='skyblue', edgecolor='navy', linewidth=2)
-
-for bar in bars:
-    height = bar.get_height()
-    plt.text(bar.get_x() + bar.get_width()/2, height,
-            f'₹{height/100000:.1f}L',
-            ha='center', va='bottom', fontsize=11, fontweight='bold')
-
-plt.title('Total Revenue by Product Category', fontsize=16, fontweight='bold', pad=20)
-plt.xlabel('Category', fontsize=12)
-plt.ylabel('Revenue (₹)', fontsize=12)
-plt.xticks(rotation=45)
-plt.grid(axis='y', alpha=0.3)
-plt.tight_layout()
-plt.savefig('chart1_category_revenue.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✅ Saved: chart1_category_revenue.png")
+
+def draw_category_revenue(category_revenue):
+    fig = plt.figure(figsize=(12, 6))
+    bars = plt.bar(category_revenue.index, category_revenue.values, 
+                   color='skyblue', edgecolor='navy', linewidth=2)
+
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2, height,
+                f'₹{height/100000:.1f}L',
+                ha='center', va='bottom', fontsize=11, fontweight='bold')
+
+    plt.title('Total Revenue by Product Category', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Category', fontsize=12)
+    plt.ylabel('Revenue (₹)', fontsize=12)
+    plt.xticks(rotation=45)
+    plt.grid(axis='y', alpha=0.3)
+    plt.tight_layout()
+    return fig
+
+save_chart('chart1_category_revenue.png', category_revenue, draw_category_revenue)
 
 # 6.2: Monthly Revenue Trend
 print("\n📊 Creating Chart 2: Monthly Revenue Trend...")
 monthly_data = df.groupby(df['Order_Date'].dt.to_period('M'))['Final_Amount'].sum()
-months = [str(m) for m in monthly_data.index]
-
-plt.figure(figsize=(14, 6))
-plt.plot(months, monthly_data.values, marker='o', linewidth=2.5, 
-         color='#2E86AB', markersize=8)
-plt.title('Monthly Revenue Trend', fontsize=16, fontweight='bold', pad=20)
-plt.xlabel('Month', fontsize=12)
-plt.ylabel('Revenue (₹)', fontsize=12)
-plt.xticks(rotation=45)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('chart2_monthly_trend.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✅ Saved: chart2_monthly_trend.png")
+
+def draw_monthly_trend(monthly_data):
+    months = [str(m) for m in monthly_data.index]
+    fig = plt.figure(figsize=(14, 6))
+    plt.plot(months, monthly_data.values, marker='o', linewidth=2.5, 
+             color='#2E86AB', markersize=8)
+    plt.title('Monthly Revenue Trend', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Month', fontsize=12)
+    plt.ylabel('Revenue (₹)', fontsize=12)
+    plt.xticks(rotation=45)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return fig
+
+save_chart('chart2_monthly_trend.png', monthly_data, draw_monthly_trend)
 
 # 6.3: Customer Membership Distribution
 print("\n📊 Creating Chart 3: Membership Distribution...")
 membership_counts = customers_clean['Membership_Type'].value_counts()
 
-plt.figure(figsize=(8, 8))
-colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
-explode = (0.05, 0.05, 0.05, 0.1)  # Explode Platinum
+def draw_membership_distribution(membership_counts):
+    fig = plt.figure(figsize=(8, 8))
+    colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
+    explode = (0.05, 0.05, 0.05, 0.1)  # Explode Platinum
 
-plt.pie(membership_counts.values, labels=membership_counts.index,
-        autopct='%1.1f%%', colors=colors, explode=explode,
-        shadow=True, startangle=90)
-plt.title('Customer Distribution by Membership Type', 
-          fontsize=16, fontweight='bold', pad=20)
-plt.tight_layout()
-plt.savefig('chart3_membership_distribution.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✅ Saved: chart3_membership_distribution.png")
+    plt.pie(membership_counts.values, labels=membership_counts.index,
+            autopct='%1.1f%%', colors=colors, explode=explode,
+            shadow=True, startangle=90)
+    plt.title('Customer Distribution by Membership Type', 
+              fontsize=16, fontweight='bold', pad=20)
+    plt.tight_layout()
+    return fig
+
+save_chart('chart3_membership_distribution.png', membership_counts, draw_membership_distribution)
 
 # 6.4: Order Status Distribution
 print("\n📊 Creating Chart 4: Order Status...")
 status_counts = df['Order_Status'].value_counts()
 
-plt.figure(figsize=(10, 6))
-bars = plt.barh(status_counts.index, status_counts.values, 
-                color='lightcoral', edgecolor='darkred', linewidth=2)
-
-for bar in bars:
-    width = bar.get_width()
-    plt.text(width, bar.get_y() + bar.get_height()/2,
-            f' {width:,}',
-            ha='left', va='center', fontsize=11, fontweight='bold')
-
-plt.title('Order Status Distribution', fontsize=16, fontweight='bold', pad=20)
-plt.xlabel('Number of Orders', fontsize=12)
-plt.ylabel('Status', fontsize=12)
-plt.grid(axis='x', alpha=0.3)
-plt.tight_layout()
-plt.savefig('chart4_order_status.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✅ Saved: chart4_order_status.png")
+def draw_order_status(status_counts):
+    fig = plt.figure(figsize=(10, 6))
+    bars = plt.barh(status_counts.index, status_counts.values, 
+                    color='lightcoral', edgecolor='darkred', linewidth=2)
+
+    for bar in bars:
+        width = bar.get_width()
+        plt.text(width, bar.get_y() + bar.get_height()/2,
+                f' {width:,}',
+                ha='left', va='center', fontsize=11, fontweight='bold')
+
+    plt.title('Order Status Distribution', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Number of Orders', fontsize=12)
+    plt.ylabel('Status', fontsize=12)
+    plt.grid(axis='x', alpha=0.3)
+    plt.tight_layout()
+    return fig
+
+save_chart('chart4_order_status.png', status_counts, draw_order_status)
 
 # 6.5: Top 10 Cities by Revenue
 print("\n📊 Creating Chart 5: Top Cities...")
 city_revenue = df.groupby('City')['Final_Amount'].sum().sort_values(ascending=False).head(10)
 
-plt.figure(figsize=(12, 6))
-bars = plt.barh(city_revenue.index, city_revenue.values,
-                color='#66b3ff', edgecolor='navy', linewidth=2)
-
-for bar in bars:
-    width = bar.get_width()
-    plt.text(width, bar.get_y() + bar.get_height()/2,
-            f' ₹{width/100000:.1f}L',
-            ha='left', va='center', fontsize=10, fontweight='bold')
-
-plt.title('Top 10 Cities by Revenue', fontsize=16, fontweight='bold', pad=20)
-plt.xlabel('Revenue (₹)', fontsize=12)
-plt.ylabel('City', fontsize=12)
-plt.gca().invert_yaxis()
-plt.grid(axis='x', alpha=0.3)
-plt.tight_layout()
-plt.savefig('chart5_top_cities.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✅ Saved: chart5_top_cities.png")
+def draw_top_cities(city_revenue):
+    fig = plt.figure(figsize=(12, 6))
+    bars = plt.barh(city_revenue.index, city_revenue.values,
+                    color='#66b3ff', edgecolor='navy', linewidth=2)
+
+    for bar in bars:
+        width = bar.get_width()
+        plt.text(width, bar.get_y() + bar.get_height()/2,
+                f' ₹{width/100000:.1f}L',
+                ha='left', va='center', fontsize=10, fontweight='bold')
+
+    plt.title('Top 10 Cities by Revenue', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Revenue (₹)', fontsize=12)
+    plt.ylabel('City', fontsize=12)
+    plt.gca().invert_yaxis()
+    plt.grid(axis='x', alpha=0.3)
+    plt.tight_layout()
+    return fig
+
+save_chart('chart5_top_cities.png', city_revenue, draw_top_cities)
 
 # 6.6: Find most ordered products
 print("\n📊 Creating Chart 6: Most Ordered Products...")
@@ -391,26 +416,27 @@ product_popularity = df.groupby('Product_Name').agg({
    
 # Create bar chart
 # YOUR CODE HERE
-plt.figure(figsize=(12,6))
-bars = plt.barh(product_popularity.index, product_popularity['Order_ID'], 
-               color= "#034858", edgecolor='skyblue', linewidth=2)
-
-for bar in bars:
-    width = bar.get_width()
-    plt.text(width, bar.get_y() + bar.get_height()/2,
-             f' {int(width)}',
-             ha='left', va='center', 
-             fontsize=10, fontweight='bold')
-    
-plt.title('Most Ordered Products', fontsize=16, fontweight='bold', pad=20)
-plt.xlabel('No. of Orders', fontsize=12)
-plt.ylabel('Product', fontsize=12)
-plt.xticks(rotation=45)
-plt.grid(axis='y', alpha=0.3, linestyle='--')
-plt.tight_layout()
-plt.savefig('chart6_most_ordered_products.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✅ Saved: most_orderd_products.png")
+def draw_most_ordered_products(order_counts):
+    fig = plt.figure(figsize=(12,6))
+    bars = plt.barh(order_counts.index, order_counts.values, 
+                   color= "#034858", edgecolor='skyblue', linewidth=2)
+
+    for bar in bars:
+        width = bar.get_width()
+        plt.text(width, bar.get_y() + bar.get_height()/2,
+                 f' {int(width)}',
+                 ha='left', va='center', 
+                 fontsize=10, fontweight='bold')
+        
+    plt.title('Most Ordered Products', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('No. of Orders', fontsize=12)
+    plt.ylabel('Product', fontsize=12)
+    plt.xticks(rotation=45)
+    plt.grid(axis='y', alpha=0.3, linestyle='--')
+    plt.tight_layout()
+    return fig
+
+save_chart('chart6_most_ordered_products.png', product_popularity['Order_ID'], draw_most_ordered_products)
 
 # 6.7: Analyze if discounts increase order value
 print("\n📊 Creating Chart 7: Dicounts increase...")
@@ -418,18 +444,19 @@ discount_groups = df.groupby('Discount_Percent')['Final_Amount'].mean()
 
 # Create line chart showing relationship
 # YOUR CODE HERE
-plt.figure(figsize=(14,6))
-plt.plot(discount_groups.index, discount_groups.values, marker='o', linewidth=2.5,
-         color='#4b8be0', markersize=8)
-plt.title('Relationship between Discount% & Revenue', fontsize=16, fontweight='bold', pad=20)
-plt.xlabel('Discount %', fontsize=12)
-plt.ylabel('Revenue', fontsize=12)
-plt.xticks(rotation=45)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('chart7_relationship_discount_revenue.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✅ Saved: chart7_discount_vs_revenue.png")
+def draw_discount_vs_revenue(discount_groups):
+    fig = plt.figure(figsize=(14,6))
+    plt.plot(discount_groups.index, discount_groups.values, marker='o', linewidth=2.5,
+             color='#4b8be0', markersize=8)
+    plt.title('Relationship between Discount% & Revenue', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Discount %', fontsize=12)
+    plt.ylabel('Revenue', fontsize=12)
+    plt.xticks(rotation=45)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return fig
+
+save_chart('chart7_relationship_discount_revenue.png', discount_groups, draw_discount_vs_revenue)
 
 # Create age groups
 print("\n📊 Creating Chart 8: Spending by age group...")
@@ -438,78 +465,87 @@ df['Age_Group'] = pd.cut(df['Age'], bins=[0, 25, 35, 45, 60, 100],
    
 # 6.8: Analyze spending by age group
 age_analysis = df.groupby('Age_Group')['Final_Amount'].agg(['sum', 'mean', 'count'])
-colors1= ['#EAF077', '#8AF38A','#79BDED','#FF6B6B', '#A8E6CF']
 # Create visualization
 # YOUR CODE HERE
-plt.figure(figsize=(12,6))
-bars = plt.bar(age_analysis.index, age_analysis['sum'], color=colors1, edgecolor='black',
-               linewidth=2, alpha=0.7)
-
-for bar in bars:
-    height = bar.get_height()
-    plt.text(bar.get_x() + bar.get_width()/2,
-             height,
-             f'₹{height/100000:.1f}L',
-             fontsize=11, fontweight='bold')
-
-plt.title('Total Spending by Age Group', fontsize=16, fontweight='bold', pad=20)
-plt.xlabel('Age group', fontsize=12)
-plt.ylabel('Total Amount Spent', fontsize=12)
-plt.grid(axis='y', alpha=0.3, linestyle='--')
-plt.savefig('chart8_Spending_by_age.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✅ Saved: chart8_spending_by_age.png")
+def draw_spending_by_age(age_spending):
+    colors1= ['#EAF077', '#8AF38A','#79BDED','#FF6B6B', '#A8E6CF']
+    fig = plt.figure(figsize=(12,6))
+    bars = plt.bar(age_spending.index, age_spending.values, color=colors1, edgecolor='black',
+                   linewidth=2, alpha=0.7)
+
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2,
+                 height,
+                 f'₹{height/100000:.1f}L',
+                 fontsize=11, fontweight='bold')
+
+    plt.title('Total Spending by Age Group', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Age group', fontsize=12)
+    plt.ylabel('Total Amount Spent', fontsize=12)
+    plt.grid(axis='y', alpha=0.3, linestyle='--')
+    return fig
+
+save_chart('chart8_Spending_by_age.png', age_analysis['sum'], draw_spending_by_age)
 
 # 6.9: Comprehensive Dashboard
 print("\n📊 Creating Chart 9: Complete Dashboard...")
-fig = plt.figure(figsize=(16, 10))
-gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
-
-# Revenue by category
-ax1 = fig.add_subplot(gs[0, :2])
 cat_rev = df.groupby('Category')['Final_Amount'].sum().sort_values(ascending=False)
-ax1.bar(cat_rev.index, cat_rev.values, color='skyblue', edgecolor='black')
-ax1.set_title('Revenue by Category', fontweight='bold')
-ax1.set_ylabel('Revenue (₹)')
-ax1.tick_params(axis='x', rotation=45)
-ax1.grid(axis='y', alpha=0.3)
-
-# Order status pie
-ax2 = fig.add_subplot(gs[0, 2])
 status_counts = df['Order_Status'].value_counts().head(5)
-ax2.pie(status_counts.values, labels=status_counts.index, autopct='%1.0f%%')
-ax2.set_title('Order Status', fontweight='bold')
-
-# Monthly trend
-ax3 = fig.add_subplot(gs[1, :2])
 monthly = df.groupby(df['Order_Date'].dt.to_period('M'))['Final_Amount'].sum()
-months_short = [str(m)[:7] for m in monthly.index]
-ax3.plot(months_short, monthly.values, marker='o', linewidth=2, color='#2E86AB')
-ax3.set_title('Monthly Revenue Trend', fontweight='bold')
-ax3.tick_params(axis='x', rotation=45)
-ax3.grid(True, alpha=0.3)
-
-# Top customers table
-ax4 = fig.add_subplot(gs[1, 2])
-ax4.axis('off')
 top_5 = df.groupby('Customer_ID')['Final_Amount'].sum().sort_values(ascending=False).head(5)
-table_data = [[f"₹{v/1000:.0f}K"] for v in top_5.values]
-table = ax4.table(cellText=table_data,
-                 rowLabels=[f"Cust {i+1}" for i in range(5)],
-                 colLabels=['Spent'],
-                 cellLoc='center',
-                 loc='center')
-table.auto_set_font_size(False)
-table.set_fontsize(9)
-table.scale(1, 2)
-ax4.set_title('Top 5 Customers', fontweight='bold', pad=20)
-
-fig.suptitle('📊 E-COMMERCE ANALYTICS DASHBOARD', 
-            fontsize=18, fontweight='bold', y=0.98)
-
-plt.savefig('chart9_complete_dashboard.png', dpi=300, bbox_inches='tight')
-plt.show()
-print("✅ Saved: chart9_complete_dashboard.png")
+dashboard_data = {'cat_rev': cat_rev, 'status_counts': status_counts,
+                  'monthly': monthly, 'top_5': top_5}
+
+def draw_dashboard(data):
+    cat_rev, status_counts = data['cat_rev'], data['status_counts']
+    monthly, top_5 = data['monthly'], data['top_5']
+
+    fig = plt.figure(figsize=(16, 10))
+    gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
+
+    # Revenue by category
+    ax1 = fig.add_subplot(gs[0, :2])
+    ax1.bar(cat_rev.index, cat_rev.values, color='skyblue', edgecolor='black')
+    ax1.set_title('Revenue by Category', fontweight='bold')
+    ax1.set_ylabel('Revenue (₹)')
+    ax1.tick_params(axis='x', rotation=45)
+    ax1.grid(axis='y', alpha=0.3)
+
+    # Order status pie
+    ax2 = fig.add_subplot(gs[0, 2])
+    ax2.pie(status_counts.values, labels=status_counts.index, autopct='%1.0f%%')
+    ax2.set_title('Order Status', fontweight='bold')
+
+    # Monthly trend
+    ax3 = fig.add_subplot(gs[1, :2])
+    months_short = [str(m)[:7] for m in monthly.index]
+    ax3.plot(months_short, monthly.values, marker='o', linewidth=2, color='#2E86AB')
+    ax3.set_title('Monthly Revenue Trend', fontweight='bold')
+    ax3.tick_params(axis='x', rotation=45)
+    ax3.grid(True, alpha=0.3)
+
+    # Top customers table
+    ax4 = fig.add_subplot(gs[1, 2])
+    ax4.axis('off')
+    table_data = [[f"₹{v/1000:.0f}K"] for v in top_5.values]
+    table = ax4.table(cellText=table_data,
+                     rowLabels=[f"Cust {i+1}" for i in range(5)],
+                     colLabels=['Spent'],
+                     cellLoc='center',
+                     loc='center')
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1, 2)
+    ax4.set_title('Top 5 Customers', fontweight='bold', pad=20)
+
+    fig.suptitle('📊 E-COMMERCE ANALYTICS DASHBOARD', 
+                fontsize=18, fontweight='bold', y=0.98)
+    return fig
+
+save_chart('chart9_complete_dashboard.png', dashboard_data, draw_dashboard)
+
+chart_cache.print_stats()
 
 
 # ============================================================================
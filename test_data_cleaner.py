@@ -0,0 +1,80 @@
+"""
+Tests for ChunkedDataCleaner (run with: python -m pytest)
+Cleaning a file chunk by chunk must write the same file and log the same
+actions as DataCleaner.clean_all() on the whole DataFrame.
+"""
+
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_cleaner import ChunkedDataCleaner, DataCleaner
+
+N_ROWS = 1000
+CHUNKSIZE = 300
+
+
+@pytest.fixture
+def messy_csv(tmp_path):
+    """
+    Whitespace, missing values, outliers, duplicates and a date column;
+    Age is numeric except a few 'unknown' values in the last chunk
+    """
+    rng = np.random.default_rng(0)
+    age = rng.integers(18, 70, N_ROWS).astype(object)
+    age[[3, 400]] = [400, -5]
+    age[rng.choice(np.arange(N_ROWS - 100, N_ROWS), 5, replace=False)] = 'unknown'
+    salary = rng.normal(50_000, 8_000, N_ROWS).round(2)
+    salary[rng.choice(N_ROWS, 50, replace=False)] = np.nan
+    salary[7] = 1_000_000
+    df = pd.DataFrame({
+        'Name': rng.choice(['  Alice', 'bob ', 'CHARLIE', None], N_ROWS),
+        'Age': age,
+        'Salary': salary,
+        'City': rng.choice(['mumbai', ' DELHI', 'Bangalore '], N_ROWS),
+        'Join_Date': rng.choice(['2024-01-01', '2024-02-15', 'invalid'], N_ROWS),
+    })
+    df.iloc[N_ROWS - 20:] = df.iloc[:20].to_numpy()   # duplicates across chunks
+    path = tmp_path / 'messy.csv'
+    df.to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize('policy', [
+    {'outliers': 'cap'},
+    {'outliers': 'remove', 'case': 'title'},
+    {'outliers': 'keep', 'case': 'lower', 'columns': {'Age': {'outliers': 'remove'}}},
+])
+def test_chunked_matches_in_memory(messy_csv, tmp_path, policy):
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaner = DataCleaner(pd.read_csv(messy_csv), policy=policy)
+        cleaner.clean_all()
+        cleaner.df.to_csv(tmp_path / 'in_memory.csv', index=False)
+
+        chunked = ChunkedDataCleaner(messy_csv, chunksize=CHUNKSIZE, policy=policy)
+        chunked.run(tmp_path / 'chunked.csv')
+
+    assert (tmp_path / 'chunked.csv').read_bytes() == (tmp_path / 'in_memory.csv').read_bytes()
+    assert sorted(chunked.cleaning_log) == sorted(cleaner.cleaning_log)
+
+
+def test_chunked_reads_every_chunk_with_the_file_dtypes(messy_csv):
+    chunked = ChunkedDataCleaner(messy_csv, chunksize=CHUNKSIZE)
+
+    dtypes = {tuple(chunk.dtypes) for chunk in chunked._read_chunks()}
+
+    assert len(dtypes) == 1
+    assert dict(chunked.column_dtypes) == dict(pd.read_csv(messy_csv).dtypes)
+
+
+def test_chunked_drops_mixed_column_with_missing_values(messy_csv, tmp_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        chunked = ChunkedDataCleaner(messy_csv, chunksize=CHUNKSIZE, policy={'outliers': 'cap'},
+                                     drop_missing_above=0.1)
+        chunked.run(tmp_path / 'chunked.csv')
+
+    assert 'Age' in chunked.stats['dropped']
+    assert 'Age' not in pd.read_csv(tmp_path / 'chunked.csv').columns